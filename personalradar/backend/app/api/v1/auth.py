@@ -1,11 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.security import OAuth2PasswordRequestForm
-from google.oauth2 import id_token
-from google.auth.transport import requests
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from datetime import timedelta
-from ...core.auth import AuthService
+from ...core.auth import AuthService, oauth2_scheme
 from ...core.config import settings
-from ...core.database import get_database
+from ...core.container import get_container
+from ...core.google_auth import GoogleTokenVerifier
 from ...models.user import User, UserCreate
 from pydantic import BaseModel
 import logging
@@ -13,29 +11,30 @@ from typing import Dict, Any
 
 router = APIRouter()
 
+def get_auth_service(request: Request) -> AuthService:
+    return get_container(request).auth_service
+
+def get_google_verifier(request: Request) -> GoogleTokenVerifier:
+    return get_container(request).google_verifier
+
 class GoogleAuthRequest(BaseModel):
     token: str
 
 @router.post("/google")
-async def google_auth(request: GoogleAuthRequest, db=Depends(get_database)) -> Dict[str, Any]:
+async def google_auth(
+    request: GoogleAuthRequest,
+    auth_service: AuthService = Depends(get_auth_service),
+    verifier: GoogleTokenVerifier = Depends(get_google_verifier)
+) -> Dict[str, Any]:
     try:
         token = request.token
         logging.warning(f"Received Google login request with token: {token[:20]}... (truncated)")
         logging.warning(f"Using GOOGLE_CLIENT_ID: {settings.GOOGLE_CLIENT_ID}")
-        # Verify the Google token
-        idinfo = id_token.verify_oauth2_token(
-            token, 
-            requests.Request(), 
-            settings.GOOGLE_CLIENT_ID
-        )
+        # Verify the Google token; signing keys are cached and checks run off the event loop
+        idinfo = await verifier.verify(token)
         logging.warning(f"Google token verified. idinfo: {idinfo}")
 
-        if idinfo['iss'] not in ['accounts.google.com', 'https://accounts.google.com']:
-            logging.warning(f"Invalid issuer: {idinfo['iss']}")
-            raise ValueError('Invalid issuer.')
-
         # Get or create user
-        auth_service = AuthService(db)
         user = await auth_service.get_user_by_google_id(idinfo['sub'])
         
         if not user:
@@ -53,8 +52,11 @@ async def google_auth(request: GoogleAuthRequest, db=Depends(get_database)) -> D
 
         # Create access token
         access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        token_data: Dict[str, Any] = {"sub": str(user.id)}
+        if settings.AUTH_TRUST_CLAIMS_SECONDS > 0:
+            token_data["usr"] = auth_service.user_claims(user)
         access_token = auth_service.create_access_token(
-            data={"sub": str(user.id)},
+            data=token_data,
             expires_delta=access_token_expires
         )
         logging.warning(f"Returning access token for user {user.id}")
@@ -73,8 +75,10 @@ async def google_auth(request: GoogleAuthRequest, db=Depends(get_database)) -> D
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-async def get_current_user(db=Depends(get_database), token: str = Depends(OAuth2PasswordRequestForm)) -> User:
-    auth_service = AuthService(db)
+async def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    auth_service: AuthService = Depends(get_auth_service)
+) -> User:
     return await auth_service.verify_token(token)
 
 @router.get("/me", response_model=User)
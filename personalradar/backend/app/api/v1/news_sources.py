@@ -1,61 +1,67 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from typing import List
 from ...services.news_source_service import NewsSourceService
 from ...models.news_source import NewsSource, NewsSourceCreate
-from ...core.database import get_database
+from ...core.container import get_container
+from ...core.responses import etag_matches, model_list_response, model_response, not_modified, with_etag
 
 router = APIRouter()
 
+def get_news_source_service(request: Request) -> NewsSourceService:
+    return get_container(request).news_source_service
+
 @router.get("/", response_model=List[NewsSource])
-async def list_news_sources(db=Depends(get_database)):
+async def list_news_sources(request: Request, service: NewsSourceService = Depends(get_news_source_service)):
     """Get all news sources"""
-    service = NewsSourceService(db)
-    return await service.list_news_sources()
+    etag = await service.etag()
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    return with_etag(model_list_response(await service.list_news_sources(), NewsSource), etag)
 
 @router.post("/", response_model=NewsSource)
-async def create_news_source(news_source: NewsSourceCreate, db=Depends(get_database)):
+async def create_news_source(news_source: NewsSourceCreate, service: NewsSourceService = Depends(get_news_source_service)):
     """Create a new news source"""
-    service = NewsSourceService(db)
     return await service.create_news_source(news_source)
 
 @router.get("/{news_source_id}", response_model=NewsSource)
-async def get_news_source(news_source_id: str, db=Depends(get_database)):
+async def get_news_source(news_source_id: str, request: Request, service: NewsSourceService = Depends(get_news_source_service)):
     """Get a specific news source"""
-    service = NewsSourceService(db)
+    etag = await service.etag(news_source_id)
+    if etag_matches(request, etag):
+        return not_modified(etag)
     news_source = await service.get_news_source(news_source_id)
     if not news_source:
         raise HTTPException(status_code=404, detail="News source not found")
-    return news_source
+    return with_etag(model_response(news_source), etag)
 
 @router.patch("/{news_source_id}", response_model=NewsSource)
-async def update_news_source(news_source_id: str, news_source_data: dict, db=Depends(get_database)):
+async def update_news_source(news_source_id: str, news_source_data: dict, service: NewsSourceService = Depends(get_news_source_service)):
     """Update a news source"""
-    service = NewsSourceService(db)
+    bounds = (news_source_data.get("min_cadence_days"), news_source_data.get("max_cadence_days"))
+    if None not in bounds and bounds[0] > bounds[1]:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="min_cadence_days must not exceed max_cadence_days")
     updated_news_source = await service.update_news_source(news_source_id, news_source_data)
     if not updated_news_source:
         raise HTTPException(status_code=404, detail="News source not found")
     return updated_news_source
 
 @router.delete("/{news_source_id}")
-async def delete_news_source(news_source_id: str, db=Depends(get_database)):
+async def delete_news_source(news_source_id: str, service: NewsSourceService = Depends(get_news_source_service)):
     """Delete a news source"""
-    service = NewsSourceService(db)
     success = await service.delete_news_source(news_source_id)
     if not success:
         raise HTTPException(status_code=404, detail="News source not found")
     return {"message": "News source deleted successfully"}
 
 @router.post("/{news_source_id}/check")
-async def mark_as_checked(news_source_id: str, db=Depends(get_database)):
+async def mark_as_checked(news_source_id: str, service: NewsSourceService = Depends(get_news_source_service)):
     """Mark a news source as checked (update last_checked timestamp)"""
-    service = NewsSourceService(db)
     updated_news_source = await service.update_last_checked(news_source_id)
     if not updated_news_source:
         raise HTTPException(status_code=404, detail="News source not found")
     return {"message": "News source marked as checked", "last_checked": updated_news_source.last_checked}
 
 @router.get("/due/checking", response_model=List[NewsSource])
-async def get_sources_due_for_checking(db=Depends(get_database)):
+async def get_sources_due_for_checking(service: NewsSourceService = Depends(get_news_source_service)):
     """Get news sources that are due for checking based on their cadence"""
-    service = NewsSourceService(db)
-    return await service.get_sources_due_for_checking() 
\ No newline at end of file
+    return model_list_response(await service.get_sources_due_for_checking(), NewsSource) 
\ No newline at end of file
@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Depends, Query, Request
+from typing import Optional
+from ...core.container import get_container
+from ...models.search import SearchResults
+from ...services.search_service import SearchService
+
+router = APIRouter()
+
+def get_search_service(request: Request) -> SearchService:
+    return get_container(request).search_service
+
+@router.get("/", response_model=SearchResults)
+async def search(
+    q: str = Query(..., min_length=1, max_length=200, pattern=r"\S", description="Words or the start of a name"),
+    kind: Optional[str] = Query(None, alias="type", pattern="^(technology|discovery)$", description="Limit to technologies or discoveries"),
+    quadrant: Optional[str] = Query(None, description="Filter technologies by quadrant"),
+    ring: Optional[str] = Query(None, description="Filter technologies by ring"),
+    status: Optional[str] = Query(None, description="Filter discoveries by status"),
+    category: Optional[str] = Query(None, description="Filter discoveries by category"),
+    skip: int = Query(0, ge=0, le=1000, description="Number of results to skip"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of results to return"),
+    search_service: SearchService = Depends(get_search_service)
+) -> SearchResults:
+    """Ranked search across technologies and discoveries"""
+    return await search_service.search(q, kind, quadrant, ring, status, category, skip, limit)
@@ -1,14 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from ...core.database import Database
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from ...core.bulk_io import export_response, iter_chunks, summarize
+from ...core.container import get_container
+from ...core.responses import etag_matches, model_list_response, model_stream_response, not_modified, representation_etag, wants_ndjson, with_etag
+from ...models.radar_history import RadarMovement, RadarSnapshot, TechnologyChange
 from ...models.technology import Technology, TechnologyCreate
 from ...services.technology_service import TechnologyService
-from typing import List, Dict
+from datetime import datetime
+from typing import List, Dict, Optional
 
 router = APIRouter()
 
-async def get_technology_service() -> TechnologyService:
-    db = Database.get_db()
-    return TechnologyService(db)
+def get_technology_service(request: Request) -> TechnologyService:
+    return get_container(request).technology_service
 
 @router.post("/", response_model=Technology, status_code=status.HTTP_201_CREATED)
 async def create_technology(
@@ -22,9 +25,70 @@ async def create_technology(
 
 @router.get("/", response_model=List[Technology])
 async def list_technologies(
+    request: Request,
     service: TechnologyService = Depends(get_technology_service)
-) -> List[Technology]:
-    return await service.list_technologies()
+):
+    """List technologies as a JSON array, or as NDJSON streamed from the cursor with Accept: application/x-ndjson"""
+    ndjson = wants_ndjson(request)
+    etag = representation_etag(await service.etag(), ndjson)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    if ndjson:
+        return with_etag(model_stream_response(service.stream_technologies(), Technology, ndjson=True), etag)
+    # The radar is small and the JSON list is served from the read-through cache
+    return with_etag(model_list_response(await service.list_technologies(etag), Technology), etag)
+
+@router.post("/bulk")
+async def bulk_import_technologies(
+    request: Request,
+    service: TechnologyService = Depends(get_technology_service)
+):
+    """Upsert technologies by name from a streamed NDJSON (default) or CSV body"""
+    outcomes = []
+    async for chunk in iter_chunks(request):
+        outcomes.extend(await service.bulk_upsert_technologies(chunk))
+    return summarize(outcomes)
+
+@router.get("/export")
+async def export_technologies(
+    format: str = Query("ndjson", description="ndjson or csv"),
+    service: TechnologyService = Depends(get_technology_service)
+):
+    """Stream every technology straight from the database cursor"""
+    fields = ["_id", *TechnologyCreate.model_fields, "created_at", "updated_at"]
+    return export_response(service.export_cursor(), format, fields, "technologies")
+
+@router.get("/history/radar", response_model=RadarSnapshot)
+async def radar_at(
+    at: Optional[datetime] = Query(None, description="Point in time; defaults to now"),
+    service: TechnologyService = Depends(get_technology_service)
+) -> RadarSnapshot:
+    """The radar as it stood at a point in time; history starts at the first snapshot"""
+    radar = await service.history.radar_at(at)
+    if radar is None:
+        raise HTTPException(status_code=404, detail="Radar history does not reach back to this time")
+    return radar
+
+@router.get("/history/movements", response_model=List[RadarMovement])
+async def radar_movements(
+    since: datetime = Query(..., description="Start of the window"),
+    until: Optional[datetime] = Query(None, description="End of the window; defaults to now"),
+    service: TechnologyService = Depends(get_technology_service)
+) -> List[RadarMovement]:
+    """Technologies that were added, removed or moved quadrant/ring between two dates"""
+    return await service.history.movements(since, until or datetime.utcnow())
+
+@router.post("/history/snapshot", response_model=RadarSnapshot)
+async def take_radar_snapshot(service: TechnologyService = Depends(get_technology_service)) -> RadarSnapshot:
+    """Compact the change log into a new snapshot now"""
+    return await service.history.take_snapshot()
+
+@router.get("/{tech_id}/history", response_model=List[TechnologyChange])
+async def technology_history(
+    tech_id: str,
+    service: TechnologyService = Depends(get_technology_service)
+) -> List[TechnologyChange]:
+    return await service.history.technology_history(tech_id)
 
 @router.patch("/{tech_id}", response_model=Technology)
 async def update_technology(tech_id: str, update_data: Dict, service: TechnologyService = Depends(get_technology_service)):
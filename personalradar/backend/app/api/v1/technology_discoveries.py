@@ -1,56 +1,126 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from typing import Any, Dict, List, Optional
 from datetime import datetime, timedelta
-from ...models.technology_discovery import TechnologyDiscovery, TechnologyDiscoveryCreate
+from ...models.technology_discovery import DiscoveryPromotion, DiscoveryStatusUpdate, TechnologyDiscovery, TechnologyDiscoveryCreate
+from ...models.discovery_rollup import TrendingTechnologies
+from ...services.discovery_rollup_service import window_days
 from ...services.technology_discovery_service import TechnologyDiscoveryService
 from ...services.news_source_service import NewsSourceService
+from ...services.technology_service import TechnologyService
 from ...services.tech_discovery_agent import TechDiscoveryAgent
-from ...core.database import get_database
+from ...core.bulk_io import export_response, iter_chunks, summarize
+from ...core.container import get_container
+from ...core.responses import ORJSONResponse, etag_matches, model_response, model_stream_response, not_modified, representation_etag, wants_ndjson, with_etag
 
 router = APIRouter()
 
-async def get_discovery_service() -> TechnologyDiscoveryService:
-    db = await get_database()
-    return TechnologyDiscoveryService(db)
+def get_discovery_service(request: Request) -> TechnologyDiscoveryService:
+    return get_container(request).discovery_service
 
-async def get_news_source_service() -> NewsSourceService:
-    db = await get_database()
-    return NewsSourceService(db)
+def get_news_source_service(request: Request) -> NewsSourceService:
+    return get_container(request).news_source_service
 
-async def get_discovery_agent() -> TechDiscoveryAgent:
-    db = await get_database()
-    discovery_service = TechnologyDiscoveryService(db)
-    news_source_service = NewsSourceService(db)
-    return TechDiscoveryAgent(news_source_service, discovery_service)
+def get_technology_service(request: Request) -> TechnologyService:
+    return get_container(request).technology_service
+
+def get_discovery_agent(request: Request) -> TechDiscoveryAgent:
+    try:
+        return get_container(request).agent
+    except RuntimeError as e:
+        # API-only installs lack the crawler extras
+        raise HTTPException(status_code=503, detail=str(e))
 
 @router.get("/", response_model=List[TechnologyDiscovery])
 async def list_discoveries(
+    request: Request,
+    news_source_id: Optional[str] = Query(None, description="Filter by news source ID"),
+    status: Optional[str] = Query(None, description="Filter by status"),
+    category: Optional[str] = Query(None, description="Filter by category"),
+    min_confidence: Optional[float] = Query(0.0, description="Minimum confidence score"),
+    skip: int = Query(0, ge=0, description="Number of discoveries to skip"),
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Maximum number of discoveries to return"),
+    include_archived: bool = Query(False, description="Also return archived discoveries"),
+    discovery_service: TechnologyDiscoveryService = Depends(get_discovery_service)
+):
+    """List technology discoveries with optional filters.
+
+    Streamed from the cursor as a JSON array, or as NDJSON with Accept: application/x-ndjson.
+    """
+    ndjson = wants_ndjson(request)
+    etag = representation_etag(await discovery_service.etag(), ndjson)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    batches = discovery_service.stream_discoveries(
+        news_source_id=news_source_id,
+        status=status,
+        category=category,
+        min_confidence=min_confidence,
+        skip=skip,
+        limit=limit,
+        include_archived=include_archived,
+    )
+    return with_etag(model_stream_response(batches, TechnologyDiscovery, ndjson=ndjson), etag)
+
+@router.post("/bulk")
+async def bulk_import_discoveries(
+    request: Request,
+    discovery_service: TechnologyDiscoveryService = Depends(get_discovery_service)
+):
+    """Upsert discoveries by news source and name from a streamed NDJSON (default) or CSV body"""
+    outcomes = []
+    async for chunk in iter_chunks(request):
+        outcomes.extend(await discovery_service.bulk_upsert_discoveries(chunk))
+    await discovery_service.refresh_stats()
+    return summarize(outcomes)
+
+@router.get("/export")
+async def export_discoveries(
+    format: str = Query("ndjson", description="ndjson or csv"),
     news_source_id: Optional[str] = Query(None, description="Filter by news source ID"),
     status: Optional[str] = Query(None, description="Filter by status"),
     category: Optional[str] = Query(None, description="Filter by category"),
     min_confidence: Optional[float] = Query(0.0, description="Minimum confidence score"),
     discovery_service: TechnologyDiscoveryService = Depends(get_discovery_service)
 ):
-    """List technology discoveries with optional filters"""
-    if category:
-        discoveries = await discovery_service.get_discoveries_by_category(category)
-    elif min_confidence > 0.0:
-        discoveries = await discovery_service.get_high_confidence_discoveries(min_confidence)
-    else:
-        discoveries = await discovery_service.list_discoveries(news_source_id, status)
-    
-    return discoveries
+    """Stream discoveries straight from the database cursor, newest first"""
+    cursor = discovery_service.export_cursor(
+        news_source_id=news_source_id,
+        status=status,
+        category=category,
+        min_confidence=min_confidence,
+    )
+    fields = ["_id", *TechnologyDiscoveryCreate.model_fields, "created_at", "updated_at"]
+    return export_response(cursor, format, fields, "technology_discoveries")
+
+@router.get("/trending", response_model=TrendingTechnologies)
+async def get_trending_technologies(
+    window: str = Query("7d", description="Window length in days or weeks, e.g. 7d or 2w; compared with the window before it"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of technologies to return"),
+    min_sources: int = Query(1, ge=1, description="Minimum distinct news sources in the window"),
+    discovery_service: TechnologyDiscoveryService = Depends(get_discovery_service)
+):
+    """Technologies mentioned by a growing number of news sources"""
+    try:
+        days = window_days(window)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return await discovery_service.trending(days, limit, min_sources)
 
 @router.get("/{discovery_id}", response_model=TechnologyDiscovery)
 async def get_discovery(
     discovery_id: str,
+    request: Request,
+    include_archived: bool = Query(False, description="Look in the archive if the discovery is not live"),
     discovery_service: TechnologyDiscoveryService = Depends(get_discovery_service)
 ):
     """Get a specific technology discovery"""
-    discovery = await discovery_service.get_discovery(discovery_id)
+    etag = await discovery_service.etag(discovery_id)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    discovery = await discovery_service.get_discovery(discovery_id, include_archived)
     if not discovery:
         raise HTTPException(status_code=404, detail="Discovery not found")
-    return discovery
+    return with_etag(model_response(discovery), etag)
 
 @router.post("/", response_model=TechnologyDiscovery)
 async def create_discovery(
@@ -72,6 +142,25 @@ async def update_discovery_status(
         raise HTTPException(status_code=404, detail="Discovery not found")
     return discovery
 
+@router.post("/bulk-status")
+async def bulk_update_discovery_status(
+    update: DiscoveryStatusUpdate,
+    discovery_service: TechnologyDiscoveryService = Depends(get_discovery_service)
+):
+    """Set the status of many discoveries at once; returns updated, unchanged or not_found per ID"""
+    return {"results": await discovery_service.bulk_update_status(update.ids, update.status)}
+
+@router.post("/promote")
+async def promote_discoveries(
+    promotion: DiscoveryPromotion,
+    discovery_service: TechnologyDiscoveryService = Depends(get_discovery_service),
+    technology_service: TechnologyService = Depends(get_technology_service)
+):
+    """Add discoveries to the radar in the given quadrant and ring and mark them promoted"""
+    return {"results": await discovery_service.promote_discoveries(
+        promotion.ids, promotion.quadrant, promotion.ring, technology_service
+    )}
+
 @router.delete("/{discovery_id}")
 async def delete_discovery(
     discovery_id: str,
@@ -86,10 +175,16 @@ async def delete_discovery(
 @router.post("/run-discovery")
 async def run_technology_discovery(
     news_source_id: Optional[str] = Query(None, description="Run discovery for specific news source"),
+    replay: bool = Query(False, description="Re-run extraction over archived pages instead of crawling"),
+    as_of: Optional[datetime] = Query(None, description="Replay pages as last fetched at or before this time"),
     agent: TechDiscoveryAgent = Depends(get_discovery_agent),
     news_source_service: NewsSourceService = Depends(get_news_source_service)
 ):
     """Run technology discovery for news sources"""
+    if replay:
+        if agent.page_archive is None:
+            raise HTTPException(status_code=409, detail="Replay needs the page archive, which is disabled")
+        agent = agent.replaying(as_of)
     try:
         if news_source_id:
             # Run discovery for specific source
@@ -97,20 +192,24 @@ async def run_technology_discovery(
             if not news_source:
                 raise HTTPException(status_code=404, detail="News source not found")
             
-            discoveries = await agent.discover_technologies_from_source(news_source)
+            run_stats: Dict[str, Any] = {}
+            discoveries = await agent.discover_technologies_from_source(news_source, run_stats=run_stats)
             return {
                 "message": f"Discovery completed for {news_source.name}",
                 "discoveries_count": len(discoveries),
+                "duplicate_articles_skipped": run_stats["duplicate_articles_skipped"],
                 "discoveries": discoveries
             }
         else:
             # Run discovery for all active sources
-            results = await agent.run_discovery_for_all_sources()
+            run_stats = {}
+            results = await agent.run_discovery_for_all_sources(run_stats)
             total_discoveries = sum(len(discoveries) for discoveries in results.values())
             
             return {
                 "message": "Discovery completed for all active sources",
                 "total_discoveries": total_discoveries,
+                "duplicate_articles_skipped": run_stats.get("duplicate_articles_skipped", 0),
                 "results_by_source": results
             }
             
@@ -135,36 +234,11 @@ async def get_new_discoveries_since(
 
 @router.get("/stats/summary")
 async def get_discovery_stats(
+    request: Request,
     discovery_service: TechnologyDiscoveryService = Depends(get_discovery_service)
 ):
     """Get summary statistics for technology discoveries"""
-    all_discoveries = await discovery_service.list_discoveries()
-    
-    # Calculate stats
-    total_discoveries = len(all_discoveries)
-    by_status = {}
-    by_category = {}
-    by_confidence = {"high": 0, "medium": 0, "low": 0}
-    
-    for discovery in all_discoveries:
-        # Status stats
-        by_status[discovery.status] = by_status.get(discovery.status, 0) + 1
-        
-        # Category stats
-        if discovery.category:
-            by_category[discovery.category] = by_category.get(discovery.category, 0) + 1
-        
-        # Confidence stats
-        if discovery.confidence_score >= 0.8:
-            by_confidence["high"] += 1
-        elif discovery.confidence_score >= 0.5:
-            by_confidence["medium"] += 1
-        else:
-            by_confidence["low"] += 1
-    
-    return {
-        "total_discoveries": total_discoveries,
-        "by_status": by_status,
-        "by_category": by_category,
-        "by_confidence": by_confidence
-    } 
\ No newline at end of file
+    etag = await discovery_service.etag("stats")
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    return with_etag(ORJSONResponse(await discovery_service.get_stats()), etag)
@@ -1,32 +1,55 @@
+import time
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from jose import JWTError, jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from motor.motor_asyncio import AsyncIOMotorClient
-from ..models.user import User, UserCreate, UserInDB
+from ..models.user import COLLECTION, User, UserCreate, UserInDB
+from ..core.cache import LRUCache
 from ..core.config import settings
+from ..core.metrics import REGISTRY, Collector
+from ..core.repository import MongoRepository
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
-class AuthService:
+class AuthMetrics:
+    def __init__(self) -> None:
+        self.requests = 0
+        self.cache_hits = 0
+        self.db_lookups = 0
+        self.trusted_claims = 0
+        self.seconds = 0.0
+
+    def lookups(self) -> Dict[Tuple[str, ...], float]:
+        """Where authenticated users were resolved from"""
+        return {("cache",): self.cache_hits, ("database",): self.db_lookups, ("claims",): self.trusted_claims}
+
+# Per process: an update or deactivation handled by another worker shows up
+# there once its entry expires, after AUTH_USER_CACHE_TTL_SECONDS at most
+user_cache = LRUCache(settings.AUTH_USER_CACHE_MAXSIZE, settings.AUTH_USER_CACHE_TTL_SECONDS)
+auth_metrics = AuthMetrics()
+
+REGISTRY.register(Collector(
+    "auth_requests_total", "Requests authenticated with a bearer token", [], lambda: {(): auth_metrics.requests}))
+REGISTRY.register(Collector(
+    "auth_request_seconds_total", "Time spent authenticating requests", [], lambda: {(): auth_metrics.seconds}))
+REGISTRY.register(Collector(
+    "auth_user_lookups_total", "Authenticated users by where they were resolved from", ["source"], auth_metrics.lookups))
+
+class AuthService(MongoRepository[User]):
+    model = User
+    versioned = False
+
     def __init__(self, db: AsyncIOMotorClient) -> None:
+        super().__init__(db[COLLECTION])
         self.db = db
-        self.collection = db.users
 
     async def get_user_by_google_id(self, google_id: str) -> Optional[User]:
-        user_data = await self.collection.find_one({"google_id": google_id})
-        if user_data:
-            user_data["_id"] = str(user_data["_id"])
-            return User(**user_data)
-        return None
+        return self._to_model(await self.collection.find_one({"google_id": google_id}))
 
     async def get_user_by_email(self, email: str) -> Optional[User]:
-        user_data = await self.collection.find_one({"email": email})
-        if user_data:
-            user_data["_id"] = str(user_data["_id"])
-            return User(**user_data)
-        return None
+        return self._to_model(await self.collection.find_one({"email": email}))
 
     async def create_user(self, user_data: UserCreate) -> User:
         user_dict = user_data.model_dump()
@@ -34,22 +57,20 @@ class AuthService:
         user_dict["updated_at"] = datetime.utcnow()
         user_dict["is_active"] = True
 
-        result = await self.collection.insert_one(user_dict)
-        user_dict["_id"] = str(result.inserted_id)
-        return User(**user_dict)
+        return await self._insert(user_dict)
 
     async def update_user(self, user_id: str, update_data: Dict[str, Any]) -> Optional[User]:
         update_data["updated_at"] = datetime.utcnow()
-        result = await self.collection.update_one(
-            {"_id": user_id},
-            {"$set": update_data}
-        )
-        if result.modified_count:
-            user_data = await self.collection.find_one({"_id": user_id})
-            if user_data:
-                user_data["_id"] = str(user_data["_id"])
-                return User(**user_data)
-        return None
+        user = self._to_model(await self._update(user_id, {"$set": update_data}))
+        await user_cache.delete(user_id)
+        return user
+
+    async def deactivate_user(self, user_id: str) -> Optional[User]:
+        return await self.update_user(user_id, {"is_active": False})
+
+    def user_claims(self, user: User) -> Dict[str, Any]:
+        """User fields signed into a token, for AUTH_TRUST_CLAIMS_SECONDS"""
+        return user.model_dump(mode="json", by_alias=True)
 
     def create_access_token(self, data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
         to_encode = data.copy()
@@ -57,7 +78,7 @@ class AuthService:
             expire = datetime.utcnow() + expires_delta
         else:
             expire = datetime.utcnow() + timedelta(minutes=15)
-        to_encode.update({"exp": expire})
+        to_encode.update({"exp": expire, "iat": datetime.utcnow()})
         encoded_jwt = jwt.encode(
             to_encode, 
             settings.SECRET_KEY, 
@@ -71,26 +92,47 @@ class AuthService:
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
+        started = time.perf_counter()
         try:
-            payload = jwt.decode(
-                token, 
-                settings.SECRET_KEY, 
-                algorithms=[settings.ALGORITHM]
-            )
-            user_id: str = payload.get("sub")
-            if user_id is None:
+            try:
+                payload = jwt.decode(
+                    token, 
+                    settings.SECRET_KEY, 
+                    algorithms=[settings.ALGORITHM]
+                )
+                user_id: str = payload.get("sub")
+                if user_id is None:
+                    raise credentials_exception
+            except JWTError:
+                raise credentials_exception
+
+            user = await self._authenticated_user(user_id, payload)
+            if user is None or not user.is_active:
                 raise credentials_exception
-        except JWTError:
-            raise credentials_exception
+            return user
+        finally:
+            auth_metrics.requests += 1
+            auth_metrics.seconds += time.perf_counter() - started
+
+    async def _authenticated_user(self, user_id: str, payload: Dict[str, Any]) -> Optional[User]:
+        now = time.time()
+        claims = payload.get("usr")
+        if settings.AUTH_TRUST_CLAIMS_SECONDS > 0 and claims and now - payload.get("iat", 0) <= settings.AUTH_TRUST_CLAIMS_SECONDS:
+            auth_metrics.trusted_claims += 1
+            return User(**claims)
+
+        user = await user_cache.get(user_id)
+        if user is not None:
+            auth_metrics.cache_hits += 1
+            return user
 
+        auth_metrics.db_lookups += 1
         user = await self.get_user_by_id(user_id)
-        if user is None:
-            raise credentials_exception
+        # Only active users are cached, and never past the token's expiry
+        remaining = payload.get("exp", now) - now
+        if user is not None and user.is_active and remaining > 0:
+            await user_cache.set(user_id, user, min(settings.AUTH_USER_CACHE_TTL_SECONDS, remaining))
         return user
 
     async def get_user_by_id(self, user_id: str) -> Optional[User]:
-        user_data = await self.collection.find_one({"_id": user_id})
-        if user_data:
-            user_data["_id"] = str(user_data["_id"])
-            return User(**user_data)
-        return None 
\ No newline at end of file
+        return await self._get(user_id) 
\ No newline at end of file
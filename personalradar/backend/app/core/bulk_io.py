@@ -0,0 +1,117 @@
+import csv
+import io
+import json
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+import orjson
+from fastapi import HTTPException, Request
+from fastapi.responses import StreamingResponse
+from .repository import fix_id
+
+BULK_CHUNK_SIZE = 500
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+async def _iter_lines(request: Request) -> AsyncIterator[bytes]:
+    buffer = bytearray()
+    async for chunk in request.stream():
+        # The buffered tail holds no line break, so only the new bytes are searched
+        searched = len(buffer)
+        buffer += chunk
+        start = 0
+        end = buffer.find(b"\n", searched)
+        while end != -1:
+            yield bytes(buffer[start:end])
+            start = end + 1
+            end = buffer.find(b"\n", start)
+        del buffer[:start]
+    if buffer:
+        yield bytes(buffer)
+
+async def iter_rows(request: Request) -> AsyncIterator[Tuple[int, Any]]:
+    """Yield (row number, parsed row) from a streamed NDJSON or CSV body.
+
+    CSV is selected by a text/csv content type; its first line is the header and
+    empty cells are left out. Rows that fail to decode or parse are yielded as ValueError.
+    """
+    is_csv = request.headers.get("content-type", "").startswith("text/csv")
+    header: Optional[List[str]] = None
+    row_number = 0
+    async for raw in _iter_lines(request):
+        try:
+            line = raw.decode("utf-8").rstrip("\r")
+        except UnicodeDecodeError as e:
+            if is_csv and header is None:
+                raise HTTPException(status_code=400, detail=f"CSV header is not valid UTF-8: {e}")
+            row_number += 1
+            yield row_number, ValueError(f"Invalid UTF-8: {e}")
+            continue
+        if not line.strip():
+            continue
+        if is_csv:
+            values = next(csv.reader([line]))
+            if header is None:
+                header = values
+                continue
+            row_number += 1
+            yield row_number, {key: value for key, value in zip(header, values) if value != ""}
+        else:
+            row_number += 1
+            try:
+                yield row_number, json.loads(line)
+            except json.JSONDecodeError as e:
+                yield row_number, ValueError(f"Invalid JSON: {e}")
+
+async def iter_chunks(request: Request, size: int = BULK_CHUNK_SIZE) -> AsyncIterator[List[Tuple[int, Any]]]:
+    chunk: List[Tuple[int, Any]] = []
+    async for row in iter_rows(request):
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def summarize(outcomes: List[Dict[str, Any]]) -> Dict[str, Any]:
+    counts = {"created": 0, "updated": 0, "error": 0}
+    for outcome in outcomes:
+        counts[outcome["status"]] += 1
+    return {
+        "created": counts["created"],
+        "updated": counts["updated"],
+        "errors": counts["error"],
+        "rows": outcomes,
+    }
+
+async def _ndjson_lines(cursor: Any) -> AsyncIterator[bytes]:
+    async for doc in cursor:
+        yield orjson.dumps(fix_id(doc), default=str) + b"\n"
+
+async def _csv_lines(cursor: Any, fields: Sequence[str]) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+    async for doc in cursor:
+        fix_id(doc)
+        writer.writerow(["" if doc.get(field) is None else _csv_value(doc[field]) for field in fields])
+        if buffer.tell() >= 64 * 1024:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode("utf-8")
+
+def _csv_value(value: Any) -> Any:
+    return value.isoformat() if hasattr(value, "isoformat") else value
+
+def export_response(cursor: Any, export_format: str, fields: Sequence[str], filename: str) -> StreamingResponse:
+    """Stream documents from a Mongo cursor without materializing them in a list."""
+    if export_format not in EXPORT_MEDIA_TYPES:
+        raise HTTPException(status_code=400, detail=f"Unsupported export format '{export_format}'")
+    body = _csv_lines(cursor, fields) if export_format == "csv" else _ndjson_lines(cursor)
+    return StreamingResponse(
+        body,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format}"'}
+    )
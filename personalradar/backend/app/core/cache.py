@@ -0,0 +1,164 @@
+import asyncio
+import pickle
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from .config import settings
+from .metrics import REGISTRY, Collector
+
+class CacheMetrics:
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale": self.stale,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+class LRUCache:
+    """In-process LRU with per-entry TTL. Values are kept as Python objects."""
+
+    def __init__(self, maxsize: int = 256, ttl_seconds: float = 60.0) -> None:
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.metrics = CacheMetrics()
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.metrics.evictions += 1
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.metrics.evictions += 1
+
+    async def delete(self, key: str) -> bool:
+        return self._entries.pop(key, None) is not None
+
+    async def delete_prefix(self, prefix: str) -> int:
+        keys = [key for key in self._entries if key.startswith(prefix)]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+class SharedCache:
+    """Cache shared by all workers, backed by any client with async get/set(ex=)/delete/scan_iter.
+
+    redis.asyncio.Redis fits that interface; tests pass a local stand-in. Values are pickled.
+    """
+
+    def __init__(self, client: Any, ttl_seconds: float = 60.0, namespace: str = "radar:") -> None:
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self.namespace = namespace
+        self.metrics = CacheMetrics()
+
+    @classmethod
+    def from_url(cls, url: str, ttl_seconds: float = 60.0) -> "SharedCache":
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise RuntimeError("CACHE_BACKEND=redis requires the 'redis' package") from e
+        return cls(redis.Redis.from_url(url), ttl_seconds)
+
+    async def get(self, key: str) -> Optional[Any]:
+        raw = await self.client.get(self.namespace + key)
+        return pickle.loads(raw) if raw is not None else None
+
+    async def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        await self.client.set(self.namespace + key, pickle.dumps(value), ex=max(1, int(ttl)))
+
+    async def delete_prefix(self, prefix: str) -> int:
+        keys = [key async for key in self.client.scan_iter(match=f"{self.namespace}{prefix}*")]
+        if keys:
+            await self.client.delete(*keys)
+        return len(keys)
+
+class ReadThroughCache:
+    """Read-through cache whose entries are tagged with the collection version they were built from.
+
+    A write in another worker bumps the version in Mongo, so entries built from
+    older data are treated as misses even before their TTL runs out.
+    """
+
+    def __init__(self, backend: Any) -> None:
+        self.backend = backend
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    @property
+    def metrics(self) -> CacheMetrics:
+        return self.backend.metrics
+
+    async def get_or_load(self, key: str, version: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        entry = await self.backend.get(key)
+        if entry is not None:
+            cached_version, value = entry
+            if cached_version == version:
+                self.metrics.hits += 1
+                return value
+            self.metrics.stale += 1
+        else:
+            self.metrics.misses += 1
+
+        # One load per key at a time; concurrent readers wait for the first
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            entry = await self.backend.get(key)
+            if entry is not None and entry[0] == version:
+                return entry[1]
+            value = await loader()
+            await self.backend.set(key, (version, value))
+            return value
+
+    async def invalidate(self, prefix: str) -> None:
+        self.metrics.invalidations += await self.backend.delete_prefix(prefix)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": type(self.backend).__name__, **self.metrics.as_dict()}
+
+_cache: Optional[ReadThroughCache] = None
+
+def get_cache() -> Optional[ReadThroughCache]:
+    """Process-wide cache configured by CACHE_BACKEND (memory, redis or none)."""
+    global _cache
+    if _cache is None and settings.CACHE_BACKEND != "none":
+        if settings.CACHE_BACKEND == "redis":
+            backend: Any = SharedCache.from_url(settings.CACHE_REDIS_URL, settings.CACHE_TTL_SECONDS)
+        else:
+            backend = LRUCache(settings.CACHE_MAXSIZE, settings.CACHE_TTL_SECONDS)
+        _cache = ReadThroughCache(backend)
+    return _cache
+
+def _cache_samples() -> Dict[Tuple[str, ...], float]:
+    if _cache is None:
+        return {}
+    backend = type(_cache.backend).__name__
+    return {(backend, event): count for event, count in _cache.metrics.as_dict().items()}
+
+REGISTRY.register(Collector(
+    "cache_events_total", "Read-through cache hits, misses, stale entries, evictions and invalidations",
+    ["backend", "event"], _cache_samples))
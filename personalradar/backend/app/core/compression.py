@@ -0,0 +1,131 @@
+import zlib
+from typing import Any, Dict, List, Optional, Sequence
+from .config import settings
+
+try:
+    import zstandard
+except ImportError:  # zstd is offered only when the package is installed
+    zstandard = None
+
+# Content types worth compressing; everything else passes through untouched
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "text/")
+
+def supported_encodings() -> List[str]:
+    """Configured encodings in server preference order, minus any whose codec is missing"""
+    encodings = [e.strip() for e in settings.COMPRESSION_ENCODINGS.split(",") if e.strip()]
+    return [e for e in encodings if e == "gzip" or (e == "zstd" and zstandard is not None)]
+
+def negotiate_encoding(accept_encoding: str, available: Sequence[str]) -> Optional[str]:
+    """Pick the first available encoding the client accepts with a non-zero q-value"""
+    accepted: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        if coding:
+            accepted[coding.strip().lower()] = quality
+    for encoding in available:
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+class _Compressor:
+    """Incremental gzip or zstd stream; each flush emits a block the client can decode at once"""
+
+    def __init__(self, encoding: str) -> None:
+        if encoding == "zstd":
+            self._stream = zstandard.ZstdCompressor(level=settings.COMPRESSION_ZSTD_LEVEL).compressobj()
+            self._flush_mode = zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        else:
+            self._stream = zlib.compressobj(settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 31)
+            self._flush_mode = zlib.Z_SYNC_FLUSH
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        out = self._stream.compress(data)
+        return out + (self._stream.flush() if final else self._stream.flush(self._flush_mode))
+
+class CompressionMiddleware:
+    """Compress JSON and text responses with gzip or zstd, negotiated via Accept-Encoding.
+
+    The body is held back only until COMPRESSION_MIN_SIZE bytes have arrived: smaller
+    responses go out unchanged, larger ones are compressed chunk by chunk, so
+    streamed responses keep streaming.
+    """
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+        headers = dict(scope["headers"])
+        encoding = negotiate_encoding(headers.get(b"accept-encoding", b"").decode("latin-1"), supported_encodings())
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Optional[Dict[str, Any]] = None
+        pending: List[bytes] = []
+        pending_size = 0
+        compressor: Optional[_Compressor] = None
+        passthrough = False
+
+        async def send_start(compress: bool) -> None:
+            response_headers = [(k, v) for k, v in start["headers"] if k.lower() != b"content-length" or not compress]
+            response_headers.append((b"vary", b"Accept-Encoding"))
+            if compress:
+                response_headers.append((b"content-encoding", encoding.encode()))
+                # The compressed bytes differ from the identity ones, so the validator becomes weak
+                response_headers = [
+                    (k, b"W/" + v if k.lower() == b"etag" and not v.startswith(b"W/") else v)
+                    for k, v in response_headers
+                ]
+            await send({**start, "headers": response_headers})
+
+        async def send_compressed(message: Dict[str, Any]) -> None:
+            nonlocal start, pending_size, compressor, passthrough
+            if message["type"] == "http.response.start":
+                response_headers = {k.lower(): v for k, v in message["headers"]}
+                content_type = response_headers.get(b"content-type", b"").decode("latin-1")
+                passthrough = (
+                    b"content-encoding" in response_headers
+                    or message["status"] < 200 or message["status"] in (204, 304)
+                    or not content_type.startswith(COMPRESSIBLE_TYPES)
+                )
+                start = message
+                if passthrough:
+                    await send(message)
+                return
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            more_body = message.get("more_body", False)
+            if compressor is None:
+                pending.append(message.get("body", b""))
+                pending_size += len(pending[-1])
+                if pending_size < settings.COMPRESSION_MIN_SIZE:
+                    if more_body:
+                        return
+                    # The whole body fits under the threshold: send it as it is
+                    await send_start(False)
+                    await send({"type": "http.response.body", "body": b"".join(pending)})
+                    return
+                compressor = _Compressor(encoding)
+                await send_start(True)
+                body = b"".join(pending)
+                pending.clear()
+            else:
+                body = message.get("body", b"")
+            await send({
+                "type": "http.response.body",
+                "body": compressor.compress(body, final=not more_body),
+                "more_body": more_body,
+            })
+
+        await self.app(scope, receive, send_compressed)
@@ -9,11 +9,85 @@ class Settings(BaseSettings):
     # MongoDB
     MONGODB_URL: str = "mongodb://mongodb:27017"
     MONGODB_DB: str = "personalradar"
+    # Explain service queries at startup and log collection scans (development only)
+    QUERY_AUDIT: bool = False
+    # Keep discovery stats in a document updated on every write instead of aggregating per request
+    DISCOVERY_STATS_MATERIALIZED: bool = False
+    # A stats rebuild still unfinished after this long is taken to have died and is started over
+    DISCOVERY_STATS_REBUILD_TIMEOUT_SECONDS: int = 300
+
+    # Discovery retention. Ignored discoveries expire this many days after being ignored
+    # (a TTL index: changing it later needs a collMod). The archiver moves discoveries older
+    # than DISCOVERY_ARCHIVE_AFTER_DAYS, and those under DISCOVERY_LOW_CONFIDENCE_BELOW after
+    # DISCOVERY_LOW_CONFIDENCE_ARCHIVE_AFTER_DAYS, into the archive; promoted ones stay. 0 disables
+    DISCOVERY_IGNORED_TTL_DAYS: int = 90
+    DISCOVERY_ARCHIVE_AFTER_DAYS: int = 180
+    DISCOVERY_LOW_CONFIDENCE_BELOW: float = 0.3
+    DISCOVERY_LOW_CONFIDENCE_ARCHIVE_AFTER_DAYS: int = 30
+    DISCOVERY_ARCHIVE_INTERVAL_SECONDS: float = 3600.0
+    DISCOVERY_ARCHIVE_BATCH_SIZE: int = 1000
+
+    # Adaptive crawl cadence: the last CADENCE_HISTORY_RUNS crawls of a source are kept;
+    # from CADENCE_MIN_RUNS on, their yield and content-change rate scale cadence_days
+    CADENCE_HISTORY_RUNS: int = 10
+    CADENCE_MIN_RUNS: int = 3
+    CADENCE_HIGH_YIELD: float = 3.0  # new discoveries per run that count as a productive source
+
+    # Near-duplicate articles (SimHash within this many differing bits of one already
+    # processed, from any source) reuse its extraction instead of calling the LLM again.
+    # Articles shorter than ARTICLE_DEDUP_MIN_WORDS are always extracted. Changing the distance
+    # changes the LSH bands, so fingerprints stored before it stop matching until they expire
+    ARTICLE_DEDUP_ENABLED: bool = True
+    ARTICLE_SIMHASH_MAX_DISTANCE: int = 3
+    ARTICLE_DEDUP_MIN_WORDS: int = 50
+    ARTICLE_FINGERPRINT_TTL_DAYS: int = 180
+
+    # Raw page archive: fetched HTML is stored compressed under PAGE_ARCHIVE_DIR, one file per
+    # distinct content hash, with a page_archive document per URL and fetch, so extraction can be
+    # replayed without crawling again. Fetch records expire after PAGE_ARCHIVE_RETENTION_DAYS (a TTL
+    # index); after each full run the least recently fetched pages are pruned until the archive
+    # fits in PAGE_ARCHIVE_MAX_BYTES. 0 disables either limit
+    PAGE_ARCHIVE_ENABLED: bool = True
+    PAGE_ARCHIVE_DIR: str = "page_archive"
+    PAGE_ARCHIVE_RETENTION_DAYS: int = 90
+    PAGE_ARCHIVE_MAX_BYTES: int = 2 * 1024 ** 3
+    PAGE_ARCHIVE_MAX_PAGE_BYTES: int = 5 * 1024 ** 2  # larger pages are not archived
+    PAGE_ARCHIVE_ZSTD_LEVEL: int = 10
+
+    # Read-through cache for hot read endpoints: memory, redis or none
+    CACHE_BACKEND: str = "memory"
+    CACHE_MAXSIZE: int = 256
+    CACHE_TTL_SECONDS: float = 60.0
+    CACHE_REDIS_URL: str = "redis://localhost:6379/0"
+
+    # Response compression, in server preference order; zstd needs the zstandard package.
+    # Bodies under COMPRESSION_MIN_SIZE bytes are sent as they are
+    COMPRESSION_ENCODINGS: str = "zstd,gzip"
+    COMPRESSION_MIN_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_ZSTD_LEVEL: int = 3
+
+    # Radar history: compact the change log into a snapshot after this many changes
+    RADAR_SNAPSHOT_EVERY: int = 200
+    
+    # Sampling profiler: requests carrying this token in X-Profile-Token, plus a random
+    # share of requests and discovery runs, are written as folded stacks to PROFILE_DIR
+    PROFILE_ADMIN_TOKEN: str = ""
+    PROFILE_SAMPLE_RATE: float = 0.0
+    PROFILE_INTERVAL_SECONDS: float = 0.005
+    PROFILE_DIR: str = "profiles"
+    PROFILE_MAX_FILES: int = 50
     
     # Security
     SECRET_KEY: str = "your-secret-key-here"  # Change this in production
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    # Authenticated users are cached per process; entries never outlive the token
+    AUTH_USER_CACHE_MAXSIZE: int = 10000
+    AUTH_USER_CACHE_TTL_SECONDS: float = 60.0
+    # Trust the user claims signed into a token for this long after issue, skipping
+    # even the cache; a deactivation takes up to this long to apply. 0 disables it
+    AUTH_TRUST_CLAIMS_SECONDS: float = 0.0
     
     # Google OAuth
     GOOGLE_CLIENT_ID: str
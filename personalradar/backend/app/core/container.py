@@ -0,0 +1,66 @@
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
+from fastapi import FastAPI, Request
+from .auth import AuthService
+from .cache import ReadThroughCache, get_cache
+from .config import settings
+from .database import Database
+from .google_auth import GoogleTokenVerifier
+from ..services.article_fingerprint_service import ArticleFingerprintService
+from ..services.discovery_archiver import DiscoveryArchiver
+from ..services.news_source_service import NewsSourceService
+from ..services.page_archive_service import PageArchiveService
+from ..services.search_service import SearchService
+from ..services.tech_discovery_agent import TechDiscoveryAgent
+from ..services.technology_discovery_service import TechnologyDiscoveryService
+from ..services.technology_service import TechnologyService
+
+class Container:
+    """Long-lived clients and services, built once per process by the app lifespan.
+
+    Services hold no per-request state, so one instance of each is shared by all
+    requests. The discovery agent and its OpenAI client are built on first use.
+    """
+
+    def __init__(self, db: Any, cache: Optional[ReadThroughCache] = None) -> None:
+        self.db = db
+        self.cache = cache
+        self.technology_service = TechnologyService(db, cache)
+        self.discovery_service = TechnologyDiscoveryService(db)
+        self.news_source_service = NewsSourceService(db)
+        self.auth_service = AuthService(db)
+        self.search_service = SearchService(db)
+        self.google_verifier = GoogleTokenVerifier(settings.GOOGLE_CLIENT_ID)
+        self.archiver = DiscoveryArchiver(self.discovery_service, settings.DISCOVERY_ARCHIVE_INTERVAL_SECONDS)
+        self._agent: Optional[TechDiscoveryAgent] = None
+
+    @property
+    def agent(self) -> TechDiscoveryAgent:
+        if self._agent is None:
+            self._agent = TechDiscoveryAgent(
+                self.news_source_service,
+                self.discovery_service,
+                ArticleFingerprintService(self.db),
+                PageArchiveService(self.db) if settings.PAGE_ARCHIVE_ENABLED else None,
+            )
+        return self._agent
+
+    async def aclose(self) -> None:
+        await self.archiver.aclose()
+        await self.google_verifier.aclose()
+        if self._agent is not None:
+            await self._agent.openai_client.close()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    await Database.connect_db()
+    app.state.container = Container(Database.get_db(), get_cache())
+    app.state.container.archiver.start()
+    try:
+        yield
+    finally:
+        await app.state.container.aclose()
+        await Database.close_db()
+
+def get_container(request: Request) -> Container:
+    return request.app.state.container
@@ -1,7 +1,12 @@
 from motor.motor_asyncio import AsyncIOMotorClient
 from pymongo import MongoClient
 import os
+import time
 from typing import Optional, Any
+from .config import settings
+from .indexes import ensure_indexes
+from .metrics import event_listeners
+from .query_audit import audit_queries
 
 class Database:
     client: Optional[AsyncIOMotorClient] = None
@@ -13,7 +18,7 @@ class Database:
         mongodb_url = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
         mongodb_db = os.getenv("MONGODB_DB", "personalradar")
         
-        cls.client = AsyncIOMotorClient(mongodb_url)
+        cls.client = AsyncIOMotorClient(mongodb_url, event_listeners=event_listeners())
         cls.db = cls.client[mongodb_db]
         
         # Create indexes
@@ -29,22 +34,17 @@ class Database:
 
     @classmethod
     async def create_indexes(cls) -> None:
-        """Create necessary indexes for collections."""
-        # Technologies collection indexes
-        await cls.db.technologies.create_index("name", unique=True)
-        await cls.db.technologies.create_index("category")
-        await cls.db.technologies.create_index("status")
-        await cls.db.technologies.create_index("last_assessed")
-        await cls.db.technologies.create_index("source")
-        await cls.db.technologies.create_index("date_of_assessment")
-        await cls.db.technologies.create_index("uri")
-        
-        # User preferences collection indexes
-        await cls.db.user_preferences.create_index("user_id", unique=True)
-        
-        # Technology assessments collection indexes
-        await cls.db.assessments.create_index([("technology_id", 1), ("user_id", 1)], unique=True)
-        await cls.db.assessments.create_index("assessment_date")
+        """Create the indexes declared in the model registry and report drift."""
+        await ensure_indexes(cls.db)
+        if settings.QUERY_AUDIT:
+            await audit_queries(cls.db)
+
+    @classmethod
+    async def ping(cls) -> float:
+        """Round-trip a ping to the server and return its latency in milliseconds."""
+        started = time.perf_counter()
+        await cls.client.admin.command("ping")
+        return (time.perf_counter() - started) * 1000
 
     @classmethod
     def get_db(cls) -> Any:
@@ -0,0 +1,105 @@
+import asyncio
+import logging
+import re
+import time
+from typing import Any, Dict, Optional
+import httpx
+from jose import jwt
+
+GOOGLE_CERTS_URL = "https://www.googleapis.com/oauth2/v3/certs"
+GOOGLE_ISSUERS = ("accounts.google.com", "https://accounts.google.com")
+
+_MAX_AGE = re.compile(r"max-age=(\d+)")
+
+class GoogleTokenVerifier:
+    """Verifies Google ID tokens without blocking the event loop.
+
+    The signing keys (JWKS) are cached for the lifetime Google sends in
+    Cache-Control and refreshed in the background shortly before they expire,
+    so logins only wait on the network for the very first fetch. Signature checks
+    run in a worker thread.
+    """
+
+    def __init__(
+        self,
+        client_id: str,
+        certs_url: str = GOOGLE_CERTS_URL,
+        client: Optional[httpx.AsyncClient] = None,
+        default_ttl: float = 300.0,
+        refresh_margin: float = 60.0,
+    ) -> None:
+        self.client_id = client_id
+        self.certs_url = certs_url
+        self.client = client or httpx.AsyncClient(timeout=10.0)
+        self.default_ttl = default_ttl
+        self.refresh_margin = refresh_margin
+        self.fetches = 0
+        self._keys: Dict[str, Dict[str, Any]] = {}
+        self._expires_at = 0.0
+        self._fetched_at = float("-inf")
+        self._lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    async def _fetch_keys(self) -> None:
+        response = await self.client.get(self.certs_url)
+        response.raise_for_status()
+        match = _MAX_AGE.search(response.headers.get("cache-control", ""))
+        ttl = float(match.group(1)) if match else self.default_ttl
+        self._keys = {key["kid"]: key for key in response.json()["keys"]}
+        self._fetched_at = time.monotonic()
+        self._expires_at = self._fetched_at + ttl
+        self.fetches += 1
+
+    async def _refresh(self, force: bool = False) -> None:
+        # Concurrent callers share one fetch
+        expires_at = self._expires_at
+        async with self._lock:
+            if self._expires_at == expires_at and (force or time.monotonic() >= self._expires_at - self.refresh_margin):
+                await self._fetch_keys()
+
+    async def _refresh_in_background(self) -> None:
+        try:
+            await self._refresh()
+        except Exception as e:
+            logging.warning(f"Background refresh of Google signing keys failed: {e}")
+
+    async def signing_key(self, kid: str) -> Dict[str, Any]:
+        now = time.monotonic()
+        if not self._keys or now >= self._expires_at:
+            await self._refresh()
+        elif now >= self._expires_at - self.refresh_margin and (self._refresh_task is None or self._refresh_task.done()):
+            self._refresh_task = asyncio.create_task(self._refresh_in_background())
+
+        if kid not in self._keys and time.monotonic() - self._fetched_at >= self.refresh_margin:
+            # Google rotated its keys before our copy expired; unknown kids cannot force a fetch per request
+            await self._refresh(force=True)
+        if kid not in self._keys:
+            raise ValueError(f"Unknown signing key '{kid}'")
+        return self._keys[kid]
+
+    async def verify(self, token: str) -> Dict[str, Any]:
+        """Return the token's claims, or raise ValueError if it is not a valid ID token for this app"""
+        try:
+            header = jwt.get_unverified_header(token)
+        except Exception as e:
+            raise ValueError(f"Malformed token: {e}") from e
+        key = await self.signing_key(header.get("kid", ""))
+        try:
+            claims = await asyncio.to_thread(
+                jwt.decode,
+                token,
+                key,
+                algorithms=[key.get("alg", "RS256")],
+                audience=self.client_id,
+                options={"verify_at_hash": False},
+            )
+        except Exception as e:
+            raise ValueError(f"Invalid token: {e}") from e
+        if claims.get("iss") not in GOOGLE_ISSUERS:
+            raise ValueError("Invalid issuer.")
+        return claims
+
+    async def aclose(self) -> None:
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+        await self.client.aclose()
@@ -0,0 +1,88 @@
+import asyncio
+import logging
+from typing import Any, Dict, List
+from pymongo import IndexModel
+from ..models.indexes import INDEX_REGISTRY
+
+logger = logging.getLogger(__name__)
+
+# Index options that change query behaviour and therefore count as drift
+COMPARED_OPTIONS = ("unique", "sparse", "partialFilterExpression", "expireAfterSeconds")
+
+def _normalize_key(key: Any) -> List[tuple]:
+    return [(field, direction) for field, direction in dict(key).items()]
+
+def _text_fields(document: Dict[str, Any]) -> List[str]:
+    return [field for field, direction in _normalize_key(document["key"]) if direction == "text"]
+
+def _declared_key(document: Dict[str, Any]) -> List[tuple]:
+    """The key as the server reports it: text fields collapse into _fts/_ftsx"""
+    stored: List[tuple] = []
+    for field, direction in _normalize_key(document["key"]):
+        if direction != "text":
+            stored.append((field, direction))
+        elif ("_fts", "text") not in stored:
+            stored += [("_fts", "text"), ("_ftsx", 1)]
+    return stored
+
+def _index_differences(declared: Dict[str, Any], existing: Dict[str, Any]) -> List[str]:
+    differences = []
+    if _declared_key(declared) != _normalize_key(existing["key"]):
+        differences.append(f"key {existing['key']} != {_declared_key(declared)}")
+    for option in COMPARED_OPTIONS:
+        if declared.get(option) != existing.get(option):
+            differences.append(f"{option} {existing.get(option)!r} != {declared.get(option)!r}")
+    text_fields = _text_fields(declared)
+    if text_fields:
+        weights = {**{field: 1 for field in text_fields}, **declared.get("weights", {})}
+        if weights != existing.get("weights"):
+            differences.append(f"weights {existing.get('weights')!r} != {weights!r}")
+    return differences
+
+async def ensure_collection_indexes(db: Any, collection_name: str, indexes: List[IndexModel]) -> Dict[str, Any]:
+    """Create missing indexes for one collection and report drift against the declaration."""
+    collection = db[collection_name]
+    existing = await collection.index_information()
+    declared = {index.document["name"]: index for index in indexes}
+
+    # The server accepts one index per key pattern and partial filter
+    existing_keys = {
+        (tuple(_normalize_key(info["key"])), repr(info.get("partialFilterExpression"))): name
+        for name, info in existing.items()
+    }
+    missing = []
+    mismatched = {}
+    for name, index in declared.items():
+        key = (tuple(_declared_key(index.document)), repr(index.document.get("partialFilterExpression")))
+        if name in existing:
+            differences = _index_differences(index.document, existing[name])
+            if differences:
+                mismatched[name] = differences
+        elif key in existing_keys:
+            # Same key under another name; creating it again would be rejected by the server
+            mismatched[name] = [f"exists as {existing_keys[key]}"]
+        else:
+            missing.append(index)
+    undeclared = [name for name in existing if name != "_id_" and name not in declared]
+
+    if missing:
+        await collection.create_indexes(missing)
+
+    report = {
+        "collection": collection_name,
+        "created": [index.document["name"] for index in missing],
+        "mismatched": mismatched,
+        "undeclared": undeclared,
+    }
+    if mismatched or undeclared:
+        logger.warning(f"Index drift on {collection_name}: mismatched={mismatched} undeclared={undeclared}")
+    if missing:
+        logger.info(f"Created indexes on {collection_name}: {report['created']}")
+    return report
+
+async def ensure_indexes(db: Any, registry: Dict[str, List[IndexModel]] = INDEX_REGISTRY) -> List[Dict[str, Any]]:
+    """Create missing indexes for every registered collection concurrently."""
+    return list(await asyncio.gather(*(
+        ensure_collection_indexes(db, collection_name, indexes)
+        for collection_name, indexes in registry.items()
+    )))
@@ -0,0 +1,287 @@
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Sequence, Tuple
+from pymongo import monitoring
+from starlette.routing import Match
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _labels(names: Sequence[str], values: Tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        # pymongo listeners run on driver threads as well as the event loop
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}", *self._samples()]
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: Any) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> List[str]:
+        return [f"{self.name}{_labels(self.labelnames, key)} {value}" for key, value in sorted(self._values.items())]
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: Any) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, *args: Any, buckets: Sequence[float] = DEFAULT_BUCKETS, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: a count per bucket (last one is +Inf), the sum and the total count
+        self._values: Dict[Tuple[str, ...], Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            counts, total = self._values.setdefault(key, ([0] * (len(self.buckets) + 1), [0.0]))
+            counts[bisect_left(self.buckets, value)] += 1
+            total[0] += value
+
+    def count(self, **labels: Any) -> int:
+        entry = self._values.get(self._key(labels))
+        return sum(entry[0]) if entry else 0
+
+    def _samples(self) -> List[str]:
+        lines = []
+        for key, (counts, total) in sorted(self._values.items()):
+            cumulative = 0
+            for bound, count in zip([*self.buckets, "+Inf"], counts):
+                cumulative += count
+                le = 'le="%s"' % bound
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, key)} {total[0]}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, key)} {cumulative}")
+        return lines
+
+class Collector(_Metric):
+    """Samples read at scrape time from counters kept elsewhere, keyed by label values"""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str],
+        collect: Callable[[], Dict[Tuple[str, ...], float]],
+        kind: str = "counter",
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.kind = kind
+        self.collect = collect
+
+    def _samples(self) -> List[str]:
+        return [f"{self.name}{_labels(self.labelnames, key)} {value}" for key, value in sorted(self.collect().items())]
+
+class Registry:
+    def __init__(self) -> None:
+        self.metrics: List[_Metric] = []
+
+    def register(self, metric: _Metric) -> Any:
+        self.metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        return "\n".join(line for metric in self.metrics for line in metric.render()) + "\n"
+
+REGISTRY = Registry()
+
+HTTP_REQUESTS = REGISTRY.register(Counter(
+    "http_requests_total", "HTTP requests by route and status", ["method", "route", "status"]))
+HTTP_LATENCY = REGISTRY.register(Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route", ["method", "route"]))
+HTTP_IN_FLIGHT = REGISTRY.register(Gauge(
+    "http_requests_in_flight", "HTTP requests being served by route", ["method", "route"]))
+
+MONGO_COMMANDS = REGISTRY.register(Counter(
+    "mongo_commands_total", "MongoDB commands by collection and outcome", ["command", "collection", "outcome"]))
+MONGO_LATENCY = REGISTRY.register(Histogram(
+    "mongo_command_duration_seconds", "MongoDB command latency", ["command", "collection"]))
+MONGO_POOL_CONNECTIONS = REGISTRY.register(Gauge(
+    "mongo_pool_connections", "Open connections in the driver pool", ["address"]))
+MONGO_POOL_CHECKED_OUT = REGISTRY.register(Gauge(
+    "mongo_pool_checked_out", "Connections currently checked out of the driver pool", ["address"]))
+MONGO_POOL_WAIT = REGISTRY.register(Histogram(
+    "mongo_pool_checkout_wait_seconds", "Time spent waiting for a pooled connection", ["address"]))
+
+OUTBOUND_LATENCY = REGISTRY.register(Histogram(
+    "outbound_request_duration_seconds", "Outbound HTTP and OpenAI call latency", ["target"],
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)))
+OUTBOUND_ERRORS = REGISTRY.register(Counter(
+    "outbound_request_errors_total", "Outbound calls that failed or returned an error status", ["target"]))
+
+DISCOVERY_ARTICLES = REGISTRY.register(Counter(
+    "discovery_articles_total", "Articles handled by the discovery agent: extracted or reused from a near-duplicate",
+    ["outcome"]))
+
+def _route_label(app: Any, scope: Dict[str, Any]) -> str:
+    # Label by route template so IDs in paths do not explode the series count
+    for route in app.router.routes:
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return getattr(route, "path", scope["path"])
+    return "unmatched"
+
+class MetricsMiddleware:
+    """ASGI middleware recording per-route latency, status counts and in-flight requests"""
+
+    def __init__(self, app: Any, fastapi_app: Any) -> None:
+        self.app = app
+        self.fastapi_app = fastapi_app
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        method = scope["method"]
+        route = _route_label(self.fastapi_app, scope)
+        status = [500]
+
+        async def send_with_status(message: Dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc(method=method, route=route)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            HTTP_IN_FLIGHT.dec(method=method, route=route)
+            HTTP_LATENCY.observe(time.perf_counter() - started, method=method, route=route)
+            HTTP_REQUESTS.inc(method=method, route=route, status=status[0])
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    """Command counts and durations per collection, attached to the Motor client"""
+
+    def __init__(self) -> None:
+        self._collections: Dict[Tuple[Any, int], str] = {}
+        self._lock = threading.Lock()
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        # getMore names the cursor id first; its collection is a separate field
+        collection = event.command.get("collection" if event.command_name == "getMore" else event.command_name)
+        with self._lock:
+            self._collections[(event.connection_id, event.request_id)] = collection if isinstance(collection, str) else ""
+
+    def _finish(self, event: Any, outcome: str) -> None:
+        with self._lock:
+            collection = self._collections.pop((event.connection_id, event.request_id), "")
+        MONGO_COMMANDS.inc(command=event.command_name, collection=collection, outcome=outcome)
+        MONGO_LATENCY.observe(event.duration_micros / 1_000_000, command=event.command_name, collection=collection)
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        self._finish(event, "ok")
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        self._finish(event, "error")
+
+class MongoPoolMetrics(monitoring.ConnectionPoolListener):
+    """Connection pool size, checked-out connections and checkout wait times"""
+
+    def __init__(self) -> None:
+        self._checkout_started: Dict[Tuple[Any, int], float] = {}
+
+    def pool_created(self, event: Any) -> None:
+        MONGO_POOL_CONNECTIONS.set(0, address=_address(event))
+
+    def pool_ready(self, event: Any) -> None:
+        pass
+
+    def pool_cleared(self, event: Any) -> None:
+        pass
+
+    def pool_closed(self, event: Any) -> None:
+        MONGO_POOL_CONNECTIONS.set(0, address=_address(event))
+        MONGO_POOL_CHECKED_OUT.set(0, address=_address(event))
+
+    def connection_created(self, event: Any) -> None:
+        MONGO_POOL_CONNECTIONS.inc(address=_address(event))
+
+    def connection_ready(self, event: Any) -> None:
+        pass
+
+    def connection_closed(self, event: Any) -> None:
+        MONGO_POOL_CONNECTIONS.dec(address=_address(event))
+
+    def connection_check_out_started(self, event: Any) -> None:
+        self._checkout_started[(event.address, threading.get_ident())] = time.perf_counter()
+
+    def connection_check_out_failed(self, event: Any) -> None:
+        self._checkout_started.pop((event.address, threading.get_ident()), None)
+
+    def connection_checked_out(self, event: Any) -> None:
+        started = self._checkout_started.pop((event.address, threading.get_ident()), None)
+        if started is not None:
+            MONGO_POOL_WAIT.observe(time.perf_counter() - started, address=_address(event))
+        MONGO_POOL_CHECKED_OUT.inc(address=_address(event))
+
+    def connection_checked_in(self, event: Any) -> None:
+        MONGO_POOL_CHECKED_OUT.dec(address=_address(event))
+
+def _address(event: Any) -> str:
+    host, port = event.address
+    return f"{host}:{port}"
+
+class OutboundCall:
+    def __init__(self) -> None:
+        self.failed = False
+
+@contextmanager
+def outbound_call(target: str) -> Iterator[OutboundCall]:
+    """Time an outbound call; exceptions, or setting call.failed, count as errors"""
+    call = OutboundCall()
+    started = time.perf_counter()
+    try:
+        yield call
+    except Exception:
+        call.failed = True
+        raise
+    finally:
+        OUTBOUND_LATENCY.observe(time.perf_counter() - started, target=target)
+        if call.failed:
+            OUTBOUND_ERRORS.inc(target=target)
+
+def event_listeners() -> List[Any]:
+    return [MongoCommandMetrics(), MongoPoolMetrics()]
@@ -0,0 +1,118 @@
+import asyncio
+import hmac
+import logging
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Optional
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = "x-profile-token"
+
+class SamplingProfiler:
+    """Statistical profiler: a timer thread samples one thread's Python stack.
+
+    Samples are folded into "outer;inner count" lines, the input format of
+    flamegraph.pl, speedscope and inferno. The event loop thread is shared, so
+    other requests running on it while profiling appear in the profile too.
+    """
+
+    def __init__(self, thread_id: int, interval: float = 0.005) -> None:
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+                frame = frame.f_back
+            if stack:
+                self.samples[";".join(reversed(stack))] += 1
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> Counter:
+        self._stop.set()
+        self._thread.join()
+        return self.samples
+
+def write_profile(samples: Counter, name: str, directory: Optional[str] = None) -> str:
+    """Write folded stacks to the profile directory and prune it to PROFILE_MAX_FILES"""
+    directory = directory or settings.PROFILE_DIR
+    os.makedirs(directory, exist_ok=True)
+    slug = re.sub(r"[^A-Za-z0-9_.-]+", "_", name).strip("_")[:80]
+    path = os.path.join(directory, f"{datetime.utcnow():%Y%m%dT%H%M%S%f}-{slug}.folded")
+    with open(path, "w") as f:
+        for stack, count in samples.most_common():
+            f.write(f"{stack} {count}\n")
+
+    profiles = sorted(
+        (entry for entry in os.scandir(directory) if entry.name.endswith(".folded")),
+        key=lambda entry: entry.stat().st_mtime
+    )
+    for entry in profiles[:max(0, len(profiles) - settings.PROFILE_MAX_FILES)]:
+        os.remove(entry.path)
+    return path
+
+_active = False
+
+def profile_requested(headers: Dict[str, str]) -> bool:
+    """True when the request carries the admin profiling token"""
+    token = headers.get(PROFILE_HEADER)
+    return bool(settings.PROFILE_ADMIN_TOKEN and token and hmac.compare_digest(token, settings.PROFILE_ADMIN_TOKEN))
+
+@asynccontextmanager
+async def profile_block(name: str, force: bool = False) -> AsyncIterator[Optional[Dict[str, Any]]]:
+    """Profile the enclosed block when forced or sampled at PROFILE_SAMPLE_RATE.
+
+    Yields a dict that receives the written file's "path", or None when the block
+    is not profiled. Only one profile runs at a time per process.
+    """
+    global _active
+    if _active or not (force or random.random() < settings.PROFILE_SAMPLE_RATE):
+        yield None
+        return
+    _active = True
+    result: Dict[str, Any] = {}
+    profiler = SamplingProfiler(threading.get_ident(), settings.PROFILE_INTERVAL_SECONDS)
+    started = time.perf_counter()
+    profiler.start()
+    try:
+        yield result
+    finally:
+        samples = profiler.stop()
+        _active = False
+        try:
+            result["path"] = await asyncio.to_thread(write_profile, samples, name)
+            logger.info(f"Profiled {name} in {time.perf_counter() - started:.3f}s: {result['path']}")
+        except OSError as e:
+            logger.warning(f"Could not write profile for {name}: {e}")
+
+class ProfilingMiddleware:
+    """Profiles requests that carry the admin token header, or a sampled share of all requests"""
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http" or not (settings.PROFILE_ADMIN_TOKEN or settings.PROFILE_SAMPLE_RATE > 0):
+            await self.app(scope, receive, send)
+            return
+        headers = {key.decode("latin-1"): value.decode("latin-1") for key, value in scope["headers"]}
+        async with profile_block(f"{scope['method']} {scope['path']}", force=profile_requested(headers)):
+            await self.app(scope, receive, send)
@@ -0,0 +1,107 @@
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, NamedTuple, Optional, Set
+from ..models import news_source, technology, technology_discovery, user
+
+logger = logging.getLogger(__name__)
+
+class AuditedQuery(NamedTuple):
+    name: str
+    collection: str
+    filter: Dict[str, Any]
+    sort: Optional[Dict[str, int]] = None
+    # Unfiltered list endpoints read the whole collection by design
+    full_scan_expected: bool = False
+
+# Representative shapes of the queries issued by the services
+AUDITED_QUERIES: List[AuditedQuery] = [
+    AuditedQuery("technologies.list", technology.COLLECTION, {}, full_scan_expected=True),
+    AuditedQuery("technologies.by_name", technology.COLLECTION, {"name": "Kubernetes"}),
+    AuditedQuery("discoveries.list", technology_discovery.COLLECTION, {}, {"discovered_at": -1}),
+    AuditedQuery("discoveries.by_source", technology_discovery.COLLECTION, {"news_source_id": "audit"}, {"discovered_at": -1}),
+    AuditedQuery("discoveries.by_status", technology_discovery.COLLECTION, {"status": "discovered"}, {"discovered_at": -1}),
+    AuditedQuery("discoveries.by_category", technology_discovery.COLLECTION, {"category": "Tool"}, {"discovered_at": -1}),
+    AuditedQuery("discoveries.high_confidence", technology_discovery.COLLECTION, {"confidence_score": {"$gte": 0.7}}, {"discovered_at": -1}),
+    AuditedQuery(
+        "discoveries.source_status",
+        technology_discovery.COLLECTION,
+        {"news_source_id": "audit", "status": "discovered"},
+        {"discovered_at": -1},
+    ),
+    AuditedQuery(
+        "discoveries.status_category_confidence",
+        technology_discovery.COLLECTION,
+        {"status": "discovered", "category": "Tool", "confidence_score": {"$gte": 0.7}},
+        {"discovered_at": -1},
+    ),
+    AuditedQuery(
+        "discoveries.new_since",
+        technology_discovery.COLLECTION,
+        {"news_source_id": "audit", "discovered_at": {"$gte": datetime(1970, 1, 1)}},
+        {"discovered_at": -1},
+    ),
+    AuditedQuery("news_sources.list", news_source.COLLECTION, {}, full_scan_expected=True),
+    AuditedQuery(
+        "news_sources.due",
+        news_source.COLLECTION,
+        {"is_active": True, "next_check_at": {"$lte": datetime(1970, 1, 1)}},
+        {"next_check_at": 1},
+    ),
+    AuditedQuery("users.by_google_id", user.COLLECTION, {"google_id": "audit"}),
+    AuditedQuery("users.by_email", user.COLLECTION, {"email": "audit@example.com"}),
+]
+
+def _plan_stages(plan: Any) -> Set[str]:
+    stages: Set[str] = set()
+    if isinstance(plan, dict):
+        if "stage" in plan:
+            stages.add(plan["stage"])
+        for value in plan.values():
+            stages |= _plan_stages(value)
+    elif isinstance(plan, list):
+        for value in plan:
+            stages |= _plan_stages(value)
+    return stages
+
+async def explain_query(db: Any, query: AuditedQuery) -> Dict[str, Any]:
+    """Explain one query and report the stages of its winning plan."""
+    find: Dict[str, Any] = {"find": query.collection, "filter": query.filter}
+    if query.sort:
+        find["sort"] = query.sort
+    explained = await db.command({"explain": find, "verbosity": "queryPlanner"})
+    stages = _plan_stages(explained["queryPlanner"]["winningPlan"])
+    return {
+        "query": query.name,
+        "collection": query.collection,
+        "stages": sorted(stages),
+        "collection_scan": "COLLSCAN" in stages,
+        "in_memory_sort": "SORT" in stages,
+    }
+
+async def audit_queries(db: Any, queries: List[AuditedQuery] = AUDITED_QUERIES) -> List[Dict[str, Any]]:
+    """Explain every audited query and log the ones not served by an index."""
+    results = list(await asyncio.gather(*(explain_query(db, query) for query in queries)))
+    for query, result in zip(queries, results):
+        if query.full_scan_expected:
+            continue
+        if result["collection_scan"]:
+            logger.warning(f"Query audit: {query.name} on {query.collection} runs a collection scan")
+        elif result["in_memory_sort"]:
+            logger.warning(f"Query audit: {query.name} on {query.collection} sorts in memory")
+    return results
+
+if __name__ == "__main__":
+    from .database import Database
+
+    async def main() -> None:
+        await Database.connect_db()
+        try:
+            for result in await audit_queries(Database.get_db()):
+                flag = "COLLSCAN" if result["collection_scan"] else "ok"
+                print(f"{flag:9} {result['query']:35} {', '.join(result['stages'])}")
+        finally:
+            await Database.close_db()
+
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
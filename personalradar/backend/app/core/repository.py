@@ -0,0 +1,179 @@
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, Generic, List, Optional, Sequence, Tuple, Type, TypeVar
+from bson import ObjectId
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError
+from .versions import CollectionVersions
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Documents validated and serialized together when streaming a cursor
+STREAM_BATCH_SIZE = 500
+
+def to_object_id(value: Any) -> Any:
+    """Convert a 24-hex string to ObjectId; anything else is used as stored."""
+    if isinstance(value, str) and ObjectId.is_valid(value):
+        return ObjectId(value)
+    return value
+
+def fix_id(doc: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Expose the Mongo ObjectId as a string, as the API models expect."""
+    if doc and "_id" in doc and isinstance(doc["_id"], ObjectId):
+        doc["_id"] = str(doc["_id"])
+    return doc
+
+@lru_cache(maxsize=None)
+def list_adapter(model: Type[ModelT]) -> TypeAdapter:
+    """Validator/serializer for a list of models, built once per model class."""
+    return TypeAdapter(List[model])
+
+class MongoRepository(Generic[ModelT]):
+    """Base for services that map one collection onto one response model.
+
+    Writes answer from the document already in hand (the inserted dict, or the
+    one returned by find_one_and_update/find_one_and_delete) instead of reading it back.
+    """
+    model: Type[ModelT]
+    # Bump the collection version on every successful write (drives list/detail ETags)
+    versioned: bool = True
+
+    def __init__(self, collection: Any) -> None:
+        self.collection = collection
+        self.versions = CollectionVersions(collection.database)
+
+    async def etag(self, resource_id: Optional[str] = None) -> str:
+        return await self.versions.etag(self.collection.name, resource_id)
+
+    async def _changed(self) -> None:
+        # Bumped after the write, and read before the data, so a tag is never paired with older data
+        if self.versioned:
+            await self.versions.bump(self.collection.name)
+
+    def _prepare_doc(self, doc: Dict[str, Any]) -> Dict[str, Any]:
+        """Hook for subclasses to repair stored documents that fail validation as-is."""
+        return doc
+
+    def _derived_fields(self, fields: Dict[str, Any]) -> Dict[str, Any]:
+        """Hook for subclasses to store fields computed from the written ones, such as search keys."""
+        return {}
+
+    def _to_model(self, doc: Optional[Dict[str, Any]]) -> Optional[ModelT]:
+        if doc is None:
+            return None
+        return self.model(**self._prepare_doc(fix_id(doc)))
+
+    def _to_models(self, docs: List[Dict[str, Any]]) -> List[ModelT]:
+        """Validate a batch in one pass; fall back to per-document repair only if it fails."""
+        for doc in docs:
+            fix_id(doc)
+        try:
+            return list_adapter(self.model).validate_python(docs)
+        except ValidationError:
+            return [self._to_model(doc) for doc in docs]
+
+    async def _find_models(self, cursor: Any) -> List[ModelT]:
+        return self._to_models(await cursor.to_list(length=None))
+
+    async def _iter_models(self, cursor: Any, batch_size: int = STREAM_BATCH_SIZE) -> AsyncIterator[List[ModelT]]:
+        """Validate a cursor batch by batch, so only one batch is held in memory at a time."""
+        batch: List[Dict[str, Any]] = []
+        async for doc in cursor.batch_size(batch_size):
+            batch.append(doc)
+            if len(batch) >= batch_size:
+                yield self._to_models(batch)
+                batch = []
+        if batch:
+            yield self._to_models(batch)
+
+    async def _insert(self, doc: Dict[str, Any]) -> ModelT:
+        doc.update(self._derived_fields(doc))
+        result = await self.collection.insert_one(doc)
+        doc["_id"] = result.inserted_id
+        await self._changed()
+        return self._to_model(doc)
+
+    async def _get(self, doc_id: str) -> Optional[ModelT]:
+        return self._to_model(await self.collection.find_one({"_id": to_object_id(doc_id)}))
+
+    async def _update(
+        self,
+        doc_id: str,
+        update: Any,
+        return_document: ReturnDocument = ReturnDocument.AFTER,
+    ) -> Optional[Dict[str, Any]]:
+        """Apply an update and return the raw document, after the update by default."""
+        if isinstance(update, dict) and "$set" in update:
+            update = {**update, "$set": {**update["$set"], **self._derived_fields(update["$set"])}}
+        doc = await self.collection.find_one_and_update(
+            {"_id": to_object_id(doc_id)},
+            update,
+            return_document=return_document
+        )
+        if doc is not None:
+            await self._changed()
+        return doc
+
+    async def _delete(self, doc_id: str) -> Optional[Dict[str, Any]]:
+        doc = await self.collection.find_one_and_delete({"_id": to_object_id(doc_id)})
+        if doc is not None:
+            await self._changed()
+        return doc
+
+    async def _bulk_upsert(
+        self,
+        rows: List[Tuple[int, Any]],
+        create_model: Type[BaseModel],
+        key_fields: Sequence[str],
+    ) -> List[Dict[str, Any]]:
+        """Validate rows and upsert them by key_fields with one unordered bulk_write.
+
+        Fields absent from a row keep their stored value; on insert they take the
+        create model's defaults. Returns one outcome per row, in row order.
+        """
+        now = datetime.utcnow()
+        outcomes: Dict[int, Dict[str, Any]] = {}
+        operations = []
+        operation_rows: List[Tuple[int, Dict[str, Any]]] = []
+        for row_number, row in rows:
+            if isinstance(row, Exception):
+                outcomes[row_number] = {"row": row_number, "status": "error", "error": str(row)}
+                continue
+            try:
+                item = create_model.model_validate(row)
+            except ValidationError as e:
+                outcomes[row_number] = {"row": row_number, "status": "error", "error": str(e)}
+                continue
+            provided = item.model_dump(exclude_unset=True)
+            provided.update(self._derived_fields(provided))
+            defaults = {k: v for k, v in item.model_dump().items() if k not in provided}
+            key = {field: getattr(item, field) for field in key_fields}
+            operations.append(UpdateOne(
+                key,
+                {"$set": {**provided, "updated_at": now}, "$setOnInsert": {**defaults, "created_at": now}},
+                upsert=True
+            ))
+            operation_rows.append((row_number, key))
+
+        if operations:
+            try:
+                result = await self.collection.bulk_write(operations, ordered=False)
+                upserted = dict(result.upserted_ids)
+                failed: Dict[int, str] = {}
+            except BulkWriteError as e:
+                upserted = {item["index"]: item["_id"] for item in e.details.get("upserted", [])}
+                failed = {error["index"]: error.get("errmsg", "write failed") for error in e.details.get("writeErrors", [])}
+            for index, (row_number, key) in enumerate(operation_rows):
+                outcome: Dict[str, Any] = {"row": row_number, **key}
+                if index in failed:
+                    outcome.update(status="error", error=failed[index])
+                elif index in upserted:
+                    outcome.update(status="created", id=str(upserted[index]))
+                else:
+                    outcome.update(status="updated")
+                outcomes[row_number] = outcome
+            if len(failed) < len(operations):
+                await self._changed()
+
+        return [outcomes[row_number] for row_number, _ in rows]
@@ -0,0 +1,79 @@
+from typing import AsyncIterator, List, Type
+from fastapi import Request
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from pydantic import BaseModel
+from .repository import list_adapter
+
+__all__ = [
+    "ORJSONResponse", "model_response", "model_list_response", "model_stream_response",
+    "wants_ndjson", "representation_etag", "etag_matches", "not_modified", "with_etag",
+]
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+def model_response(model: BaseModel) -> Response:
+    return Response(content=model.model_dump_json(by_alias=True), media_type="application/json")
+
+def model_list_response(models: List[BaseModel], model: Type[BaseModel]) -> Response:
+    """Serialize already-validated models straight to JSON bytes.
+
+    Returning a Response skips FastAPI's response_model re-validation; the route's
+    response_model still documents the payload.
+    """
+    return Response(
+        content=list_adapter(model).dump_json(models, by_alias=True),
+        media_type="application/json"
+    )
+
+def wants_ndjson(request: Request) -> bool:
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+def representation_etag(etag: str, ndjson: bool) -> str:
+    """The NDJSON body differs from the JSON array, so it needs its own strong tag"""
+    return f'{etag[:-1]}-ndjson"' if ndjson else etag
+
+async def _json_array(batches: AsyncIterator[List[BaseModel]], model: Type[BaseModel]) -> AsyncIterator[bytes]:
+    adapter = list_adapter(model)
+    separator = b""
+    yield b"["
+    async for models in batches:
+        if models:
+            # Each batch serializes as a JSON array; its items are spliced into the outer one
+            yield separator + adapter.dump_json(models, by_alias=True)[1:-1]
+            separator = b","
+    yield b"]"
+
+async def _ndjson(batches: AsyncIterator[List[BaseModel]]) -> AsyncIterator[bytes]:
+    async for models in batches:
+        yield b"".join(item.model_dump_json(by_alias=True).encode() + b"\n" for item in models)
+
+def model_stream_response(batches: AsyncIterator[List[BaseModel]], model: Type[BaseModel], ndjson: bool = False) -> StreamingResponse:
+    """Stream validated batches as one JSON array, or as NDJSON lines.
+
+    The JSON array is byte-for-byte what model_list_response would send, but the
+    first batch goes out while the cursor is still being read.
+    """
+    if ndjson:
+        return StreamingResponse(_ndjson(batches), media_type=NDJSON_MEDIA_TYPE)
+    return StreamingResponse(_json_array(batches, model), media_type="application/json")
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match uses weak comparison, so W/ prefixes are ignored."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    candidates = [candidate.strip() for candidate in header.split(",")]
+    return etag in (candidate[2:] if candidate.startswith("W/") else candidate for candidate in candidates)
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Vary": "Accept"})
+
+def with_etag(response: Response, etag: str) -> Response:
+    response.headers["ETag"] = etag
+    # Let browsers keep the body but revalidate before every reuse
+    response.headers["Cache-Control"] = "no-cache"
+    # Lists come as JSON or NDJSON depending on Accept
+    response.headers["Vary"] = "Accept"
+    return response
@@ -0,0 +1,45 @@
+from typing import Any, Dict, Optional
+from bson import ObjectId
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+VERSIONS_COLLECTION = "collection_versions"
+
+class CollectionVersions:
+    """Monotonic per-collection version counters shared by every worker through Mongo.
+
+    Each counter carries a random epoch so a dropped or reset counter never
+    reproduces a version a client may still hold.
+    """
+
+    def __init__(self, db: Any) -> None:
+        self.collection = db[VERSIONS_COLLECTION]
+
+    async def bump(self, name: str) -> Dict[str, Any]:
+        return await self.collection.find_one_and_update(
+            {"_id": name},
+            {"$inc": {"version": 1}, "$setOnInsert": {"epoch": str(ObjectId())}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+
+    async def current(self, name: str) -> Dict[str, Any]:
+        # A plain read: only the first lookup of a collection ever writes
+        version = await self.collection.find_one({"_id": name})
+        if version is not None:
+            return version
+        version = {"_id": name, "version": 0, "epoch": str(ObjectId())}
+        try:
+            await self.collection.insert_one(version)
+        except DuplicateKeyError:
+            # Another worker created the counter first; use theirs
+            return await self.collection.find_one({"_id": name})
+        return version
+
+    async def etag(self, name: str, resource_id: Optional[str] = None) -> str:
+        """Strong ETag for a collection listing, or for one of its documents."""
+        version = await self.current(name)
+        tag = f"{name}-{version['epoch']}-{version['version']}"
+        if resource_id:
+            tag = f"{tag}-{resource_id}"
+        return f'"{tag}"'
@@ -1,16 +1,25 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
+from .core.compression import CompressionMiddleware
+from .core.container import lifespan
 from .core.database import Database
+from .core.metrics import REGISTRY, MetricsMiddleware
+from .core.profiling import ProfilingMiddleware
 from .core.config import settings
+from .core.responses import ORJSONResponse
 from .api.v1 import auth
 from .api.v1 import technologies
 from .api.v1 import news_sources
 from .api.v1 import technology_discoveries
+from .api.v1 import search
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
-    openapi_url=f"{settings.API_V1_STR}/openapi.json"
+    openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Set up CORS middleware
@@ -20,21 +29,18 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
 )
+app.add_middleware(CompressionMiddleware)
+app.add_middleware(ProfilingMiddleware)
+app.add_middleware(MetricsMiddleware, fastapi_app=app)
 
 # Include routers
 app.include_router(auth.router, prefix=f"{settings.API_V1_STR}/auth", tags=["auth"])
 app.include_router(technologies.router, prefix=f"{settings.API_V1_STR}/technologies", tags=["technologies"])
 app.include_router(news_sources.router, prefix=f"{settings.API_V1_STR}/news-sources", tags=["news-sources"])
 app.include_router(technology_discoveries.router, prefix=f"{settings.API_V1_STR}/technology-discoveries", tags=["technology-discoveries"])
-
-@app.on_event("startup")
-async def startup_db_client():
-    await Database.connect_db()
-
-@app.on_event("shutdown")
-async def shutdown_db_client():
-    await Database.close_db()
+app.include_router(search.router, prefix=f"{settings.API_V1_STR}/search", tags=["search"])
 
 @app.get("/")
 async def root():
@@ -42,7 +48,19 @@ async def root():
 
 @app.get("/health")
 async def health_check():
+    if Database.client is None:
+        return ORJSONResponse({"status": "unhealthy", "database": "disconnected"}, status_code=503)
+    try:
+        latency_ms = await Database.ping()
+    except Exception as e:
+        return ORJSONResponse({"status": "unhealthy", "database": "unreachable", "error": str(e)}, status_code=503)
     return {
         "status": "healthy",
-        "database": "connected" if Database.client is not None else "disconnected"
-    } 
\ No newline at end of file
+        "database": "connected",
+        "database_latency_ms": round(latency_ms, 2)
+    }
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus text exposition of route, Mongo, outbound call, cache and auth metrics"""
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
@@ -0,0 +1,32 @@
+"""Build the daily discovery rollups behind /technology-discoveries/trending.
+
+Discoveries saved before the rollups existed are not counted until this runs.
+It rebuilds every bucket from scratch, so it is also the repair path if the
+rollups ever drift (from the backend directory):
+    python -m app.migrations.backfill_discovery_rollups
+"""
+import asyncio
+import logging
+from typing import Any
+from ..services.discovery_rollup_service import DiscoveryRollupService
+
+logger = logging.getLogger(__name__)
+
+async def migrate(db: Any) -> int:
+    """Replace the rollups with buckets computed from every discovery. Safe to run repeatedly."""
+    buckets = await DiscoveryRollupService(db).rebuild()
+    logger.info(f"Rebuilt {buckets} discovery rollup buckets")
+    return buckets
+
+if __name__ == "__main__":
+    from ..core.database import Database
+
+    async def main() -> None:
+        await Database.connect_db()
+        try:
+            print(f"Rebuilt {await migrate(Database.get_db())} rollup buckets")
+        finally:
+            await Database.close_db()
+
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
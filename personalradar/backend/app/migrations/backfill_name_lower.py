@@ -0,0 +1,46 @@
+"""Backfill name_lower on technologies and discoveries saved before it was stored.
+
+Search matches name prefixes on name_lower, so older documents are only found
+by whole words until this runs (from the backend directory):
+    python -m app.migrations.backfill_name_lower
+"""
+import asyncio
+import logging
+from typing import Any
+from pymongo import UpdateOne
+from ..models import technology, technology_discovery
+from ..services.search_service import search_name
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 1000
+
+async def migrate(db: Any) -> int:
+    """Set name_lower wherever it is missing. Safe to run repeatedly."""
+    # Lowercased in Python rather than with $toLower, which only folds ASCII
+    updated = 0
+    for collection_name in (technology.COLLECTION, technology_discovery.COLLECTION):
+        collection = db[collection_name]
+        operations = []
+        async for doc in collection.find({"name_lower": {"$exists": False}, "name": {"$type": "string"}}, {"name": 1}):
+            operations.append(UpdateOne({"_id": doc["_id"]}, {"$set": {"name_lower": search_name(doc["name"])}}))
+            if len(operations) >= BATCH_SIZE:
+                updated += (await collection.bulk_write(operations, ordered=False)).modified_count
+                operations = []
+        if operations:
+            updated += (await collection.bulk_write(operations, ordered=False)).modified_count
+    logger.info(f"Backfilled name_lower on {updated} documents")
+    return updated
+
+if __name__ == "__main__":
+    from ..core.database import Database
+
+    async def main() -> None:
+        await Database.connect_db()
+        try:
+            print(f"Backfilled {await migrate(Database.get_db())} documents")
+        finally:
+            await Database.close_db()
+
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
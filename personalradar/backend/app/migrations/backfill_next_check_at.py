@@ -0,0 +1,34 @@
+"""Backfill next_check_at on news sources created before it was stored.
+
+Run once after deploying (from the backend directory):
+    python -m app.migrations.backfill_next_check_at
+"""
+import asyncio
+import logging
+from typing import Any
+from ..models import news_source
+from ..services.news_source_service import NEXT_CHECK_AT_EXPR
+
+logger = logging.getLogger(__name__)
+
+async def migrate(db: Any) -> int:
+    """Set next_check_at on every news source that lacks it. Safe to run repeatedly."""
+    result = await db[news_source.COLLECTION].update_many(
+        {"next_check_at": {"$exists": False}},
+        [{"$set": {"next_check_at": NEXT_CHECK_AT_EXPR}}]
+    )
+    logger.info(f"Backfilled next_check_at on {result.modified_count} news sources")
+    return result.modified_count
+
+if __name__ == "__main__":
+    from ..core.database import Database
+
+    async def main() -> None:
+        await Database.connect_db()
+        try:
+            print(f"Backfilled {await migrate(Database.get_db())} news sources")
+        finally:
+            await Database.close_db()
+
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
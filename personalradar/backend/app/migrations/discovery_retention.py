@@ -0,0 +1,43 @@
+"""Prepare existing discoveries for the retention rules.
+
+Starts the TTL clock on discoveries ignored before ignored_at existed, drops the
+status index the per-status partial indexes replace, and runs the archiver once,
+which can take a while on a large backlog. Run once after deploying (from the
+backend directory):
+    python -m app.migrations.discovery_retention
+"""
+import asyncio
+import logging
+from typing import Any, Dict
+from ..models import technology_discovery
+from ..services.technology_discovery_service import TechnologyDiscoveryService
+
+logger = logging.getLogger(__name__)
+
+SUPERSEDED_INDEX = "status_1_discovered_at_-1_confidence_score_1"
+
+async def migrate(db: Any) -> Dict[str, int]:
+    """Safe to run repeatedly."""
+    service = TechnologyDiscoveryService(db)
+    stamped = await service.stamp_ignored()
+    collection = db[technology_discovery.COLLECTION]
+    if SUPERSEDED_INDEX in await collection.index_information():
+        await collection.drop_index(SUPERSEDED_INDEX)
+        logger.info(f"Dropped {SUPERSEDED_INDEX}")
+    archived = await service.archive_stale()
+    logger.info(f"Stamped ignored_at on {stamped} discoveries and archived {archived}")
+    return {"stamped": stamped, "archived": archived}
+
+if __name__ == "__main__":
+    from ..core.database import Database
+
+    async def main() -> None:
+        await Database.connect_db()
+        try:
+            # connect_db has created the new indexes by now
+            print(await migrate(Database.get_db()))
+        finally:
+            await Database.close_db()
+
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
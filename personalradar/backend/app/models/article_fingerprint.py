@@ -0,0 +1,14 @@
+from pymongo import ASCENDING, IndexModel
+from ..core.config import settings
+
+COLLECTION = "article_fingerprints"
+
+# One document per processed article:
+# {url, news_source_id, title, simhash (16 hex digits), bands, technologies, created_at}
+INDEXES = [
+    # LSH lookup: a near-duplicate shares at least one band with the article it copies
+    IndexModel([("bands", ASCENDING)]),
+    IndexModel([("url", ASCENDING)]),
+]
+if settings.ARTICLE_FINGERPRINT_TTL_DAYS:
+    INDEXES.append(IndexModel([("created_at", ASCENDING)], expireAfterSeconds=settings.ARTICLE_FINGERPRINT_TTL_DAYS * 86400))
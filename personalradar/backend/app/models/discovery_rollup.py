@@ -0,0 +1,28 @@
+from datetime import datetime
+from typing import List
+from pydantic import BaseModel
+from pymongo import ASCENDING, IndexModel
+
+COLLECTION = "discovery_rollups"
+
+# One document per normalized technology name and UTC day:
+# {name, day, display_name, count, confidence_sum, sources: {<news_source_id>: count}}
+INDEXES = [
+    IndexModel([("name", ASCENDING), ("day", ASCENDING)], unique=True),
+    # Trending reads every bucket in the last two windows
+    IndexModel([("day", ASCENDING)]),
+]
+
+class TrendingTechnology(BaseModel):
+    name: str
+    mentions: int
+    previous_mentions: int
+    sources: int  # distinct news sources in the window
+    previous_sources: int
+    mean_confidence: float
+    score: float
+
+class TrendingTechnologies(BaseModel):
+    window_days: int
+    since: datetime  # start of the current window; the previous window is the same length before it
+    technologies: List[TrendingTechnology]
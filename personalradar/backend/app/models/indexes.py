@@ -0,0 +1,31 @@
+from typing import Dict, List
+from pymongo import ASCENDING, IndexModel
+from . import (
+    article_fingerprint, discovery_rollup, news_source, page_archive, radar_history, technology, technology_discovery, user
+)
+
+# Collections without a model module of their own
+USER_PREFERENCES_INDEXES = [
+    IndexModel([("user_id", ASCENDING)], unique=True),
+]
+
+ASSESSMENT_INDEXES = [
+    IndexModel([("technology_id", ASCENDING), ("user_id", ASCENDING)], unique=True),
+    IndexModel([("assessment_date", ASCENDING)]),
+]
+
+# Declared indexes per collection, created at startup and compared against the live database
+INDEX_REGISTRY: Dict[str, List[IndexModel]] = {
+    technology.COLLECTION: technology.INDEXES,
+    technology_discovery.COLLECTION: technology_discovery.INDEXES,
+    technology_discovery.ARCHIVE_COLLECTION: technology_discovery.ARCHIVE_INDEXES,
+    discovery_rollup.COLLECTION: discovery_rollup.INDEXES,
+    article_fingerprint.COLLECTION: article_fingerprint.INDEXES,
+    page_archive.COLLECTION: page_archive.INDEXES,
+    news_source.COLLECTION: news_source.INDEXES,
+    user.COLLECTION: user.INDEXES,
+    radar_history.CHANGES_COLLECTION: radar_history.CHANGE_INDEXES,
+    radar_history.SNAPSHOTS_COLLECTION: radar_history.SNAPSHOT_INDEXES,
+    "user_preferences": USER_PREFERENCES_INDEXES,
+    "assessments": ASSESSMENT_INDEXES,
+}
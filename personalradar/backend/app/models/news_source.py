@@ -1,6 +1,15 @@
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
+from pymongo import ASCENDING, IndexModel
+
+# NewsSourceService resolves its collection as `db.database.news_sources`
+COLLECTION = "database.news_sources"
+
+INDEXES = [
+    IndexModel([("is_active", ASCENDING), ("next_check_at", ASCENDING)]),
+    IndexModel([("name", ASCENDING)]),
+]
 
 class NewsSourceBase(BaseModel):
     name: str
@@ -9,19 +18,33 @@ class NewsSourceBase(BaseModel):
     cadence_days: int = Field(ge=1, le=365, description="How often to check this source in days")
     is_active: bool = True
     last_checked: Optional[datetime] = None
+    # Adaptive mode stretches or shortens cadence_days from recent crawl yield, within the bounds
+    adaptive_cadence: bool = False
+    min_cadence_days: int = Field(1, ge=1, le=365, description="Shortest adaptive check interval in days")
+    max_cadence_days: int = Field(30, ge=1, le=365, description="Longest adaptive check interval in days")
 
 class NewsSourceCreate(NewsSourceBase):
-    pass
+    @model_validator(mode="after")
+    def check_cadence_bounds(self) -> "NewsSourceCreate":
+        if self.min_cadence_days > self.max_cadence_days:
+            raise ValueError("min_cadence_days must not exceed max_cadence_days")
+        return self
 
 class NewsSourceInDB(NewsSourceBase):
     id: str = Field(alias="_id")
     created_at: datetime
     updated_at: datetime
+    next_check_at: Optional[datetime] = None
+    effective_cadence_days: Optional[float] = None
+    cadence_reason: Optional[str] = None
 
 class NewsSource(NewsSourceBase):
     id: str = Field(alias="_id")
     created_at: datetime
     updated_at: datetime
+    next_check_at: Optional[datetime] = None
+    effective_cadence_days: Optional[float] = None  # the interval next_check_at is based on
+    cadence_reason: Optional[str] = None
 
     class Config:
         populate_by_name = True
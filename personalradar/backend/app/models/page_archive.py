@@ -0,0 +1,14 @@
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from ..core.config import settings
+
+COLLECTION = "page_archive"
+
+# One document per fetch: {url, fetched_at, content_hash, encoding, charset, size, stored_size}.
+# The page itself is a file named by content_hash, shared by every fetch of the same bytes
+INDEXES = [
+    # Replay reads the latest fetch of a URL at or before a point in time
+    IndexModel([("url", ASCENDING), ("fetched_at", DESCENDING)]),
+    IndexModel([("content_hash", ASCENDING)]),
+]
+if settings.PAGE_ARCHIVE_RETENTION_DAYS:
+    INDEXES.append(IndexModel([("fetched_at", ASCENDING)], expireAfterSeconds=settings.PAGE_ARCHIVE_RETENTION_DAYS * 86400))
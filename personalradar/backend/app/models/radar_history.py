@@ -0,0 +1,47 @@
+from datetime import datetime
+from typing import List, Optional
+from pydantic import BaseModel
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
+CHANGES_COLLECTION = "technology_changes"
+SNAPSHOTS_COLLECTION = "radar_snapshots"
+
+CHANGE_INDEXES = [
+    # Replay from a snapshot: every change after a point in time
+    IndexModel([("at", ASCENDING)]),
+    # Movements between two dates touch only placement changes
+    IndexModel([("at", ASCENDING)], name="moved_at", partialFilterExpression={"moved": True}),
+    IndexModel([("technology_id", ASCENDING), ("at", ASCENDING)]),
+]
+
+SNAPSHOT_INDEXES = [
+    IndexModel([("at", DESCENDING)]),
+]
+
+class RadarEntry(BaseModel):
+    technology_id: str
+    name: str
+    quadrant: str
+    ring: str
+
+class TechnologyChange(BaseModel):
+    technology_id: str
+    name: str
+    op: str  # create, update, delete
+    at: datetime
+    before: Optional[RadarEntry] = None
+    after: Optional[RadarEntry] = None
+    moved: bool = False  # placement changed: created, deleted, or new quadrant/ring
+
+class RadarSnapshot(BaseModel):
+    at: datetime
+    technologies: List[RadarEntry]
+
+class RadarMovement(BaseModel):
+    technology_id: str
+    name: str
+    from_quadrant: Optional[str] = None
+    from_ring: Optional[str] = None
+    to_quadrant: Optional[str] = None
+    to_ring: Optional[str] = None
+    changed_at: datetime
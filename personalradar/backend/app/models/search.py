@@ -0,0 +1,23 @@
+from datetime import datetime
+from typing import List, Optional
+from pydantic import BaseModel
+
+class SearchHit(BaseModel):
+    type: str  # technology or discovery
+    id: str
+    name: str
+    description: Optional[str] = None
+    score: float
+    quadrant: Optional[str] = None
+    ring: Optional[str] = None
+    status: Optional[str] = None
+    category: Optional[str] = None
+    article_title: Optional[str] = None
+    discovered_at: Optional[datetime] = None
+
+class SearchResults(BaseModel):
+    query: str
+    skip: int
+    limit: int
+    has_more: bool
+    results: List[SearchHit]
@@ -1,6 +1,21 @@
 from datetime import datetime
 from typing import Optional
 from pydantic import BaseModel, Field
+from pymongo import ASCENDING, TEXT, IndexModel
+
+COLLECTION = "technologies"
+
+INDEXES = [
+    IndexModel([("name", ASCENDING)], unique=True),
+    IndexModel([("quadrant", ASCENDING), ("ring", ASCENDING)]),
+    IndexModel([("source", ASCENDING)]),
+    IndexModel([("date_of_assessment", ASCENDING)]),
+    IndexModel([("uri", ASCENDING)]),
+    # Search: case-insensitive name prefixes
+    IndexModel([("name_lower", ASCENDING)]),
+    # Ranked search; a name match outweighs a description match
+    IndexModel([("name", TEXT), ("description", TEXT)], weights={"name": 10, "description": 1}, name="text_search"),
+]
 
 class TechnologyBase(BaseModel):
     name: str
@@ -1,6 +1,57 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Literal, Optional
 from pydantic import BaseModel, Field
+from pymongo import ASCENDING, DESCENDING, TEXT, IndexModel
+from ..core.config import settings
+
+COLLECTION = "technology_discoveries"
+# Old and low-confidence discoveries moved out of the hot collection, with the same _id
+ARCHIVE_COLLECTION = "technology_discoveries_archive"
+
+# promoted: copied onto the radar as a technology
+DiscoveryStatus = Literal["discovered", "assessed", "ignored", "promoted"]
+# Statuses still under review; only these get the status-led list indexes
+ACTIVE_STATUSES = ("discovered", "assessed")
+
+# Equality fields first, then the discovered_at sort, then the confidence range,
+# so every filter combination accepted by the list endpoint is served by an index
+INDEXES = [
+    IndexModel([("news_source_id", ASCENDING), ("discovered_at", DESCENDING), ("confidence_score", ASCENDING)]),
+    IndexModel([("news_source_id", ASCENDING), ("status", ASCENDING), ("discovered_at", DESCENDING), ("confidence_score", ASCENDING)]),
+    *(
+        IndexModel(
+            [("status", ASCENDING), ("discovered_at", DESCENDING), ("confidence_score", ASCENDING)],
+            name=f"{status}_queue",
+            partialFilterExpression={"status": status}
+        )
+        for status in ACTIVE_STATUSES
+    ),
+    IndexModel([("status", ASCENDING), ("category", ASCENDING), ("discovered_at", DESCENDING), ("confidence_score", ASCENDING)]),
+    IndexModel([("category", ASCENDING), ("discovered_at", DESCENDING), ("confidence_score", ASCENDING)]),
+    IndexModel([("discovered_at", DESCENDING), ("confidence_score", ASCENDING)]),
+    # Bulk import upserts by source and name
+    IndexModel([("news_source_id", ASCENDING), ("name", ASCENDING)]),
+    # Search: case-insensitive name prefixes, then ranked text over name, article title and description
+    IndexModel([("name_lower", ASCENDING)]),
+    IndexModel(
+        [("name", TEXT), ("article_title", TEXT), ("description", TEXT)],
+        weights={"name": 10, "article_title": 3, "description": 1},
+        name="text_search"
+    ),
+]
+if settings.DISCOVERY_IGNORED_TTL_DAYS:
+    # ignored_at is set whenever a discovery is ignored; the partial filter spares it if un-ignored
+    INDEXES.append(IndexModel(
+        [("ignored_at", ASCENDING)],
+        name="ignored_ttl",
+        expireAfterSeconds=settings.DISCOVERY_IGNORED_TTL_DAYS * 86400,
+        partialFilterExpression={"status": "ignored"}
+    ))
+
+ARCHIVE_INDEXES = [
+    IndexModel([("discovered_at", DESCENDING)]),
+    IndexModel([("news_source_id", ASCENDING), ("name", ASCENDING)]),
+]
 
 class TechnologyDiscoveryBase(BaseModel):
     name: str
@@ -12,7 +63,7 @@ class TechnologyDiscoveryBase(BaseModel):
     article_url: Optional[str] = None
     confidence_score: float = Field(ge=0.0, le=1.0, description="AI confidence in technology detection")
     category: Optional[str] = None  # e.g., "AI/ML", "Programming Language", "Framework", "Tool"
-    status: str = "discovered"  # discovered, assessed, ignored
+    status: str = "discovered"  # discovered, assessed, ignored, promoted
 
 class TechnologyDiscoveryCreate(TechnologyDiscoveryBase):
     pass
@@ -26,9 +77,19 @@ class TechnologyDiscovery(TechnologyDiscoveryBase):
     id: str = Field(alias="_id")
     created_at: datetime
     updated_at: datetime
+    archived_at: Optional[datetime] = None  # set on discoveries read from the archive
 
     class Config:
         populate_by_name = True
         json_encoders = {
             datetime: lambda v: v.isoformat()
-        } 
\ No newline at end of file
+        } 
+
+class DiscoveryStatusUpdate(BaseModel):
+    ids: List[str] = Field(min_length=1, max_length=1000)
+    status: DiscoveryStatus
+
+class DiscoveryPromotion(BaseModel):
+    ids: List[str] = Field(min_length=1, max_length=1000)
+    quadrant: str
+    ring: str
@@ -1,6 +1,14 @@
 from datetime import datetime
 from typing import Optional
 from pydantic import BaseModel, EmailStr, Field
+from pymongo import ASCENDING, IndexModel
+
+COLLECTION = "users"
+
+INDEXES = [
+    IndexModel([("google_id", ASCENDING)], unique=True),
+    IndexModel([("email", ASCENDING)]),
+]
 
 class UserBase(BaseModel):
     email: EmailStr
@@ -0,0 +1,70 @@
+import hashlib
+import re
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from ..core.config import settings
+from ..models.article_fingerprint import COLLECTION
+
+SIMHASH_BITS = 64
+SHINGLE_WORDS = 3
+
+def simhash(text: str) -> Optional[int]:
+    """64-bit SimHash over three-word shingles, or None if the text is too short to compare"""
+    words = re.findall(r"\w+", text.lower())
+    if len(words) < max(settings.ARTICLE_DEDUP_MIN_WORDS, SHINGLE_WORDS):
+        return None
+    weights = [0] * SIMHASH_BITS
+    for i in range(len(words) - SHINGLE_WORDS + 1):
+        shingle = " ".join(words[i:i + SHINGLE_WORDS]).encode()
+        value = int.from_bytes(hashlib.blake2b(shingle, digest_size=8).digest(), "big")
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if value >> bit & 1 else -1
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+def lsh_bands(fingerprint: int, max_distance: int) -> List[str]:
+    """Split the hash into max_distance + 1 bands.
+
+    Two hashes at most max_distance bits apart cannot differ in every band, so
+    they always share at least one: an exact match on any band finds them.
+    """
+    count = max_distance + 1
+    bands = []
+    for band in range(count):
+        start, end = band * SIMHASH_BITS // count, (band + 1) * SIMHASH_BITS // count
+        bands.append(f"{band}:{fingerprint >> start & ((1 << (end - start)) - 1):x}")
+    return bands
+
+class ArticleFingerprintService:
+    """Finds articles already processed from any source that an article nearly duplicates."""
+
+    def __init__(self, db: Any):
+        self.collection = db[COLLECTION]
+
+    async def find_duplicate(self, fingerprint: int) -> Optional[Dict[str, Any]]:
+        """The closest stored article within ARTICLE_SIMHASH_MAX_DISTANCE bits, if any"""
+        max_distance = settings.ARTICLE_SIMHASH_MAX_DISTANCE
+        best: Optional[Dict[str, Any]] = None
+        best_distance = max_distance + 1
+        cursor = self.collection.find({"bands": {"$in": lsh_bands(fingerprint, max_distance)}})
+        async for candidate in cursor:
+            distance = bin(fingerprint ^ int(candidate["simhash"], 16)).count("1")
+            if distance < best_distance:
+                best, best_distance = candidate, distance
+        return best
+
+    async def record(
+        self, url: str, news_source_id: str, title: str, fingerprint: int, technologies: List[Dict[str, Any]]
+    ) -> None:
+        """Store an article's fingerprint with the raw extraction result it produced"""
+        await self.collection.update_one(
+            {"url": url},
+            {"$set": {
+                "news_source_id": news_source_id,
+                "title": title,
+                "simhash": f"{fingerprint:016x}",
+                "bands": lsh_bands(fingerprint, settings.ARTICLE_SIMHASH_MAX_DISTANCE),
+                "technologies": technologies,
+                "created_at": datetime.utcnow(),
+            }},
+            upsert=True
+        )
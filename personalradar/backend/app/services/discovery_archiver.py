@@ -0,0 +1,36 @@
+import asyncio
+import logging
+from typing import Optional
+from .technology_discovery_service import TechnologyDiscoveryService
+
+logger = logging.getLogger(__name__)
+
+class DiscoveryArchiver:
+    """Background task applying the discovery retention rules every interval_seconds.
+
+    Several API workers may each run one; archive_stale is safe to run concurrently.
+    """
+
+    def __init__(self, discovery_service: TechnologyDiscoveryService, interval_seconds: float) -> None:
+        self.discovery_service = discovery_service
+        self.interval_seconds = interval_seconds
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self.interval_seconds > 0 and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                archived = await self.discovery_service.archive_stale()
+                if archived:
+                    logger.info(f"Archived {archived} discoveries")
+            except Exception as e:
+                logger.error(f"Discovery archiving failed: {e}")
+            await asyncio.sleep(self.interval_seconds)
+
+    async def aclose(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
@@ -0,0 +1,159 @@
+import math
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Optional, Tuple
+from pymongo import UpdateOne
+from ..models.discovery_rollup import COLLECTION, TrendingTechnologies, TrendingTechnology
+from ..models.technology_discovery import ARCHIVE_COLLECTION, COLLECTION as DISCOVERIES_COLLECTION
+
+MAX_WINDOW_DAYS = 90
+# A tenfold jump in mentions from one source is worth less than one new source
+MENTION_GROWTH_WEIGHT = 0.5
+ROLLUP_FIELDS = {"name": 1, "news_source_id": 1, "discovered_at": 1, "confidence_score": 1}
+BATCH_SIZE = 1000
+
+def rollup_name(name: str) -> str:
+    """Mentions of "Bun", "bun" and " Bun " count towards the same technology"""
+    return " ".join(name.split()).lower()
+
+def rollup_day(at: datetime) -> datetime:
+    return datetime(at.year, at.month, at.day)
+
+def window_days(window: str) -> int:
+    """Parse a window such as "7d" or "2w" into days"""
+    if len(window) < 2 or window[-1] not in "dw" or not window[:-1].isdigit():
+        raise ValueError("window must look like 7d or 2w")
+    days = int(window[:-1]) * (7 if window[-1] == "w" else 1)
+    if not 1 <= days <= MAX_WINDOW_DAYS:
+        raise ValueError(f"window must be between 1 and {MAX_WINDOW_DAYS} days")
+    return days
+
+def _source_key(news_source_id: str) -> str:
+    # Source IDs become field names in the rollup document
+    return news_source_id.replace("$", "\uff04").replace(".", "\uff0e")
+
+def _rollup_fields(doc: Optional[Dict[str, Any]]) -> Optional[Tuple[str, datetime, str, float]]:
+    if doc is None:
+        return None
+    return (doc["name"], rollup_day(doc["discovered_at"]), doc["news_source_id"], doc.get("confidence_score", 0.0))
+
+class DiscoveryRollupService:
+    """Daily per-technology mention counts, maintained as discoveries are saved.
+
+    Trending reads the buckets of the last two windows, so its cost depends on
+    the number of technologies and days involved, not on the number of discoveries.
+    Archiving or expiring a discovery does not take back its mention.
+    """
+
+    def __init__(self, db: Any):
+        self.collection = db[COLLECTION]
+        self.discoveries = db[DISCOVERIES_COLLECTION]
+        self.archive = db[ARCHIVE_COLLECTION]
+
+    async def record(self, docs: Iterable[Dict[str, Any]], delta: int = 1) -> None:
+        """Count saved discoveries in (delta=1) or deleted ones out (delta=-1)"""
+        await self.record_changes([(None, doc) if delta > 0 else (doc, None) for doc in docs])
+
+    async def record_changes(self, pairs: Iterable[Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]]) -> None:
+        """Apply (before, after) discovery documents; None marks an insert or a delete"""
+        increments: Dict[Tuple[str, datetime], Dict[str, Any]] = defaultdict(lambda: defaultdict(float))
+        display_names: Dict[Tuple[str, datetime], str] = {}
+        for before, after in pairs:
+            before_fields, after_fields = _rollup_fields(before), _rollup_fields(after)
+            if before_fields == after_fields:
+                continue
+            for fields, delta in ((before_fields, -1), (after_fields, 1)):
+                if fields is None:
+                    continue
+                name, day, source_id, confidence = fields
+                key = (rollup_name(name), day)
+                bucket = increments[key]
+                bucket["count"] += delta
+                bucket["confidence_sum"] += delta * confidence
+                bucket[f"sources.{_source_key(source_id)}"] += delta
+                if delta > 0:
+                    display_names[key] = name
+
+        operations = []
+        for (name, day), bucket in increments.items():
+            bucket = {field: value for field, value in bucket.items() if value}
+            if not bucket:
+                continue
+            for field in bucket:
+                if field != "confidence_sum":
+                    bucket[field] = int(bucket[field])
+            update: Dict[str, Any] = {"$inc": bucket}
+            if (name, day) in display_names:
+                update["$set"] = {"display_name": display_names[(name, day)]}
+            # Only additions create buckets; a decrement for a missing bucket has nothing to undo
+            operations.append(UpdateOne({"name": name, "day": day}, update, upsert=bucket.get("count", 0) > 0))
+        if operations:
+            await self.collection.bulk_write(operations, ordered=False)
+
+    async def rebuild(self) -> int:
+        """Recompute every bucket from live and archived discoveries; returns the bucket count"""
+        buckets: Dict[Tuple[str, datetime], Dict[str, Any]] = {}
+        for collection in (self.discoveries, self.archive):
+            async for doc in collection.find({}, ROLLUP_FIELDS):
+                name, day, source_id, confidence = _rollup_fields(doc)
+                bucket = buckets.setdefault((rollup_name(name), day), {
+                    "display_name": name, "count": 0, "confidence_sum": 0.0, "sources": defaultdict(int),
+                })
+                bucket["count"] += 1
+                bucket["confidence_sum"] += confidence
+                bucket["sources"][_source_key(source_id)] += 1
+
+        await self.collection.delete_many({})
+        docs = [{"name": name, "day": day, **bucket, "sources": dict(bucket["sources"])} for (name, day), bucket in buckets.items()]
+        for start in range(0, len(docs), BATCH_SIZE):
+            await self.collection.insert_many(docs[start:start + BATCH_SIZE], ordered=False)
+        return len(docs)
+
+    async def trending(
+        self,
+        days: int,
+        limit: int = 20,
+        min_sources: int = 1,
+        now: Optional[datetime] = None,
+    ) -> TrendingTechnologies:
+        """Rank technologies by growth in distinct sources, then in mentions, against the previous window.
+
+        The current window is today plus the days - 1 days before it.
+        """
+        since = rollup_day(now or datetime.utcnow()) - timedelta(days=days - 1)
+        previous_since = since - timedelta(days=days)
+        totals: Dict[str, Dict[str, Any]] = {}
+        cursor = self.collection.find({"day": {"$gte": previous_since}, "count": {"$gt": 0}}).sort("day", 1)
+        async for bucket in cursor:
+            period = "current" if bucket["day"] >= since else "previous"
+            total = totals.setdefault(bucket["name"], {
+                "display_name": bucket["name"],
+                "current": 0, "previous": 0, "confidence_sum": 0.0,
+                "current_sources": set(), "previous_sources": set(),
+            })
+            total[period] += bucket["count"]
+            total[f"{period}_sources"].update(source for source, count in bucket.get("sources", {}).items() if count > 0)
+            if period == "current":
+                total["confidence_sum"] += bucket.get("confidence_sum", 0.0)
+            # Buckets are read oldest first, so the newest spelling wins
+            total["display_name"] = bucket.get("display_name") or total["display_name"]
+
+        technologies = []
+        for total in totals.values():
+            sources, previous_sources = len(total["current_sources"]), len(total["previous_sources"])
+            if not total["current"] or sources < min_sources:
+                continue
+            score = (sources - previous_sources) + MENTION_GROWTH_WEIGHT * math.log2((total["current"] + 1) / (total["previous"] + 1))
+            if score <= 0:
+                continue
+            technologies.append(TrendingTechnology(
+                name=total["display_name"],
+                mentions=total["current"],
+                previous_mentions=total["previous"],
+                sources=sources,
+                previous_sources=previous_sources,
+                mean_confidence=round(total["confidence_sum"] / total["current"], 4),
+                score=round(score, 4),
+            ))
+        technologies.sort(key=lambda t: (-t.score, -t.sources, t.name.lower()))
+        return TrendingTechnologies(window_days=days, since=since, technologies=technologies[:limit])
@@ -1,97 +1,187 @@
-from datetime import datetime
-from typing import List, Optional
-from bson import ObjectId
-from ..models.news_source import NewsSource, NewsSourceCreate, NewsSourceInDB
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from pymongo import ReturnDocument
+from ..models.news_source import COLLECTION, NewsSource, NewsSourceCreate, NewsSourceInDB
+from ..core.config import settings
 from ..core.database import Database
+from ..core.repository import MongoRepository
+
+MS_PER_DAY = 1000 * 60 * 60 * 24
+
+NO_HISTORY_REASON = "not enough crawl history yet"
+FIXED_REASON = "fixed cadence_days"
+
+# Adaptive sources scale cadence_days by the factor of their last crawls, within their bounds
+EFFECTIVE_CADENCE_EXPR = {
+    "$cond": {
+        "if": {"$eq": ["$adaptive_cadence", True]},
+        "then": {"$min": [
+            {"$max": [
+                {"$multiply": ["$cadence_days", {"$ifNull": ["$cadence_factor", 1]}]},
+                {"$ifNull": ["$min_cadence_days", 1]}
+            ]},
+            {"$ifNull": ["$max_cadence_days", 365]}
+        ]},
+        "else": "$cadence_days"
+    }
+}
+
+CADENCE_REASON_EXPR = {
+    "$cond": {
+        "if": {"$eq": ["$adaptive_cadence", True]},
+        "then": {"$ifNull": ["$yield_reason", NO_HISTORY_REASON]},
+        "else": FIXED_REASON
+    }
+}
+
+# next_check_at = last_checked + effective cadence; sources never checked are due from creation
+NEXT_CHECK_AT_EXPR = {
+    "$cond": {
+        "if": {"$eq": [{"$ifNull": ["$last_checked", None]}, None]},
+        "then": "$created_at",
+        "else": {"$add": [
+            {"$toDate": "$last_checked"},
+            {"$multiply": [{"$ifNull": ["$effective_cadence_days", "$cadence_days"]}, MS_PER_DAY]}
+        ]}
+    }
+}
+
+# Pipeline stages deriving the schedule from the stored cadence settings and crawl history
+SCHEDULE_STAGES = [
+    {"$set": {"effective_cadence_days": EFFECTIVE_CADENCE_EXPR, "cadence_reason": CADENCE_REASON_EXPR}},
+    {"$set": {"next_check_at": NEXT_CHECK_AT_EXPR}}
+]
+
+# Fields whose change moves next_check_at
+SCHEDULE_FIELDS = (
+    "last_checked", "cadence_days", "adaptive_cadence", "min_cadence_days", "max_cadence_days"
+)
+
+def next_check_at(last_checked: Optional[datetime], cadence_days: float, created_at: datetime) -> datetime:
+    if last_checked is None:
+        return created_at
+    return last_checked + timedelta(days=cadence_days)
+
+def cadence_factor(history: List[Dict[str, Any]]) -> Tuple[float, str]:
+    """Multiplier for cadence_days from recent crawls, with the reason shown to users.
+
+    Each history entry holds the crawl's new_discoveries and whether its article
+    list differed from the crawl before (content_changed).
+    """
+    if len(history) < settings.CADENCE_MIN_RUNS:
+        return 1.0, NO_HISTORY_REASON
+    runs = len(history)
+    mean_yield = sum(entry.get("new_discoveries", 0) for entry in history) / runs
+    change_rate = sum(1 for entry in history if entry.get("content_changed")) / runs
+    summary = f"{mean_yield:.1f} new discoveries per crawl over the last {runs} crawls"
+    if mean_yield == 0 and change_rate < 0.25:
+        return 4.0, f"no new discoveries and the article list rarely changes ({summary})"
+    if mean_yield == 0:
+        return 2.0, f"no new discoveries ({summary})"
+    if mean_yield < 1:
+        return 1.5, f"low yield ({summary})"
+    if mean_yield >= settings.CADENCE_HIGH_YIELD and change_rate >= 0.75:
+        return 0.5, f"high yield ({summary})"
+    return 1.0, f"steady yield ({summary})"
+
+def effective_cadence_days(news_source: Dict[str, Any]) -> float:
+    """Python counterpart of EFFECTIVE_CADENCE_EXPR"""
+    if not news_source.get("adaptive_cadence"):
+        return news_source["cadence_days"]
+    scaled = news_source["cadence_days"] * news_source.get("cadence_factor", 1)
+    return min(max(scaled, news_source.get("min_cadence_days", 1)), news_source.get("max_cadence_days", 365))
+
+class NewsSourceService(MongoRepository[NewsSource]):
+    model = NewsSource
 
-class NewsSourceService:
     def __init__(self, db: Database):
+        super().__init__(db[COLLECTION])
         self.db = db
-        self.collection = db.database.news_sources
-
-    def _fix_id(self, doc):
-        if doc and '_id' in doc and isinstance(doc['_id'], ObjectId):
-            doc['_id'] = str(doc['_id'])
-        return doc
 
     async def create_news_source(self, news_source: NewsSourceCreate) -> NewsSource:
         now = datetime.utcnow()
-        news_source_dict = news_source.dict()
+        news_source_dict = news_source.model_dump()
         news_source_dict["created_at"] = now
         news_source_dict["updated_at"] = now
-        
-        result = await self.collection.insert_one(news_source_dict)
-        created_news_source = await self.collection.find_one({"_id": result.inserted_id})
-        return NewsSource(**self._fix_id(created_news_source))
+        news_source_dict["effective_cadence_days"] = effective_cadence_days(news_source_dict)
+        news_source_dict["cadence_reason"] = NO_HISTORY_REASON if news_source.adaptive_cadence else FIXED_REASON
+        news_source_dict["next_check_at"] = next_check_at(
+            news_source_dict.get("last_checked"), news_source_dict["effective_cadence_days"], now
+        )
+        return await self._insert(news_source_dict)
 
     async def get_news_source(self, news_source_id: str) -> Optional[NewsSource]:
-        news_source = await self.collection.find_one({"_id": ObjectId(news_source_id)})
-        return NewsSource(**self._fix_id(news_source)) if news_source else None
+        return await self._get(news_source_id)
 
     async def list_news_sources(self) -> List[NewsSource]:
-        news_sources = []
-        cursor = self.collection.find({})
-        async for doc in cursor:
-            news_sources.append(NewsSource(**self._fix_id(doc)))
-        return news_sources
+        return await self._find_models(self.collection.find({}))
 
     async def update_news_source(self, news_source_id: str, news_source_data: dict) -> Optional[NewsSource]:
         news_source_data["updated_at"] = datetime.utcnow()
-        result = await self.collection.update_one(
-            {"_id": ObjectId(news_source_id)},
-            {"$set": news_source_data}
-        )
-        if result.modified_count:
-            updated_news_source = await self.collection.find_one({"_id": ObjectId(news_source_id)})
-            return NewsSource(**self._fix_id(updated_news_source))
-        return None
+        for derived in ("next_check_at", "effective_cadence_days", "cadence_reason"):
+            news_source_data.pop(derived, None)
+        update: Any = {"$set": news_source_data}
+        if any(field in news_source_data for field in SCHEDULE_FIELDS):
+            # Pipeline update so the schedule is derived from the stored values atomically
+            update = [
+                {"$set": {key: {"$literal": value} for key, value in news_source_data.items()}},
+                *SCHEDULE_STAGES
+            ]
+        return self._to_model(await self._update(news_source_id, update))
 
     async def delete_news_source(self, news_source_id: str) -> bool:
-        result = await self.collection.delete_one({"_id": ObjectId(news_source_id)})
-        return result.deleted_count > 0
+        return await self._delete(news_source_id) is not None
 
     async def update_last_checked(self, news_source_id: str) -> Optional[NewsSource]:
-        result = await self.collection.update_one(
-            {"_id": ObjectId(news_source_id)},
-            {"$set": {"last_checked": datetime.utcnow(), "updated_at": datetime.utcnow()}}
+        now = datetime.utcnow()
+        return self._to_model(await self._update(news_source_id, [
+            {"$set": {"last_checked": now, "updated_at": now}},
+            *SCHEDULE_STAGES
+        ]))
+
+    async def record_crawl(
+        self, news_source_id: str, new_discoveries: int, articles: int, content_hash: str
+    ) -> Optional[NewsSource]:
+        """Mark a source as checked and append the crawl to the history adaptive cadence learns from.
+
+        content_hash identifies the crawled article list, so an unchanged listing
+        counts against the source's change rate.
+        """
+        now = datetime.utcnow()
+        entry = {
+            "at": now,
+            "new_discoveries": new_discoveries,
+            "articles": articles,
+            "content_hash": {"$literal": content_hash},
+            # An empty history has no last hash, which counts as changed
+            "content_changed": {"$ne": [{"$arrayElemAt": ["$crawl_history.content_hash", -1]}, {"$literal": content_hash}]},
+        }
+        # Appended and trimmed in one pipeline update, so concurrent crawls never drop each other's entry
+        stored = await self._update(news_source_id, [{"$set": {
+            "last_checked": now,
+            "updated_at": now,
+            "crawl_history": {"$slice": [
+                {"$concatArrays": [{"$ifNull": ["$crawl_history", []]}, [entry]]},
+                -settings.CADENCE_HISTORY_RUNS
+            ]},
+        }}])
+        if stored is None:
+            return None
+        factor, reason = cadence_factor(stored["crawl_history"])
+        # Skipped if a later crawl was recorded meanwhile: its own update sets the newer factor
+        scheduled = await self.collection.find_one_and_update(
+            {"_id": stored["_id"], "last_checked": stored["last_checked"]},
+            [{"$set": {"cadence_factor": factor, "yield_reason": reason}}, *SCHEDULE_STAGES],
+            return_document=ReturnDocument.AFTER
         )
-        if result.modified_count:
-            updated_news_source = await self.collection.find_one({"_id": ObjectId(news_source_id)})
-            return NewsSource(**self._fix_id(updated_news_source))
-        return None
+        if scheduled is not None:
+            await self._changed()
+        return self._to_model(scheduled or await self.collection.find_one({"_id": stored["_id"]}))
 
     async def get_sources_due_for_checking(self) -> List[NewsSource]:
-        """Get sources that are due for checking based on their cadence"""
-        now = datetime.utcnow()
-        pipeline = [
-            {
-                "$addFields": {
-                    "days_since_last_check": {
-                        "$cond": {
-                            "if": {"$eq": ["$last_checked", None]},
-                            "then": 999,  # Never checked, so it's due
-                            "else": {
-                                "$divide": [
-                                    {"$subtract": [now, "$last_checked"]},
-                                    1000 * 60 * 60 * 24  # Convert milliseconds to days
-                                ]
-                            }
-                        }
-                    }
-                }
-            },
-            {
-                "$match": {
-                    "$expr": {
-                        "$gte": ["$days_since_last_check", "$cadence_days"]
-                    },
-                    "is_active": True
-                }
-            }
-        ]
-        
-        news_sources = []
-        cursor = self.collection.aggregate(pipeline)
-        async for doc in cursor:
-            news_sources.append(NewsSource(**self._fix_id(doc)))
-        return news_sources 
\ No newline at end of file
+        """Get active sources whose next_check_at has passed, most overdue first"""
+        cursor = self.collection.find({
+            "is_active": True,
+            "next_check_at": {"$lte": datetime.utcnow()}
+        }).sort("next_check_at", 1)
+        return await self._find_models(cursor)
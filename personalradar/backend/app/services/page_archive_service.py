@@ -0,0 +1,133 @@
+import asyncio
+import gzip
+import hashlib
+import logging
+import os
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Set, Tuple
+from ..core.config import settings
+from ..models.page_archive import COLLECTION
+
+try:
+    import zstandard
+except ImportError:  # pages are gzipped when zstandard is missing
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+EXTENSIONS = {"zstd": ".html.zst", "gzip": ".html.gz"}
+# Blobs younger than this are never swept: their fetch record may not be written yet
+SWEEP_GRACE_SECONDS = 3600
+
+ENCODING = "zstd" if zstandard is not None else "gzip"
+
+def _compress(raw: bytes) -> bytes:
+    if ENCODING == "zstd":
+        return zstandard.ZstdCompressor(level=settings.PAGE_ARCHIVE_ZSTD_LEVEL).compress(raw)
+    return gzip.compress(raw)
+
+def _decompress(data: bytes, encoding: str) -> bytes:
+    if encoding == "zstd":
+        if zstandard is None:
+            raise RuntimeError("Archived page is zstd-compressed but zstandard is not installed")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+class PageArchiveService:
+    """Fetched pages kept compressed in a content-addressed directory, with a record per fetch.
+
+    Identical bytes fetched again, from any URL, add a record but no file.
+    """
+
+    def __init__(self, db: Any, root: Optional[str] = None):
+        self.collection = db[COLLECTION]
+        self.root = Path(root or settings.PAGE_ARCHIVE_DIR)
+
+    def _blob_path(self, content_hash: str, encoding: str) -> Path:
+        return self.root / content_hash[:2] / f"{content_hash}{EXTENSIONS[encoding]}"
+
+    def _write_blob(self, content_hash: str, raw: bytes) -> Tuple[str, int]:
+        path = self._blob_path(content_hash, ENCODING)
+        if path.exists():
+            return ENCODING, path.stat().st_size
+        data = _compress(raw)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Written beside the target and renamed, so readers never see a partial file
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+        return ENCODING, len(data)
+
+    async def store(self, url: str, content: bytes, charset: Optional[str] = None) -> Optional[str]:
+        """Archive one fetch of url and return its content hash; None if the page is over the size limit"""
+        if settings.PAGE_ARCHIVE_MAX_PAGE_BYTES and len(content) > settings.PAGE_ARCHIVE_MAX_PAGE_BYTES:
+            return None
+        content_hash = hashlib.sha256(content).hexdigest()
+        known = await self.collection.find_one({"content_hash": content_hash}, {"encoding": 1, "stored_size": 1})
+        if known is not None and self._blob_path(content_hash, known["encoding"]).exists():
+            encoding, stored_size = known["encoding"], known["stored_size"]
+        else:
+            encoding, stored_size = await asyncio.to_thread(self._write_blob, content_hash, content)
+        await self.collection.insert_one({
+            "url": url,
+            "fetched_at": datetime.utcnow(),
+            "content_hash": content_hash,
+            "encoding": encoding,
+            "charset": charset or "utf-8",
+            "size": len(content),
+            "stored_size": stored_size,
+        })
+        return content_hash
+
+    async def load(self, url: str, as_of: Optional[datetime] = None) -> Optional[str]:
+        """HTML of the latest fetch of url at or before as_of (default: now), if archived"""
+        record = await self.collection.find_one(
+            {"url": url, "fetched_at": {"$lte": as_of or datetime.utcnow()}},
+            sort=[("fetched_at", -1)]
+        )
+        if record is None:
+            return None
+        path = self._blob_path(record["content_hash"], record["encoding"])
+        try:
+            data = await asyncio.to_thread(path.read_bytes)
+        except FileNotFoundError:
+            logger.warning(f"Archived page for {url} is missing from {path}")
+            return None
+        return _decompress(data, record["encoding"]).decode(record["charset"], errors="replace")
+
+    def _sweep(self, keep: Set[str]) -> int:
+        """Delete blob files no fetch record refers to"""
+        removed = 0
+        cutoff = time.time() - SWEEP_GRACE_SECONDS
+        if not self.root.is_dir():
+            return 0
+        for path in self.root.glob("*/*.html.*"):
+            content_hash = path.name.split(".", 1)[0]
+            if content_hash not in keep and path.stat().st_mtime < cutoff:
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+    async def prune(self) -> Dict[str, int]:
+        """Evict the least recently fetched pages over PAGE_ARCHIVE_MAX_BYTES and delete unreferenced files"""
+        cursor = self.collection.aggregate([
+            {"$group": {"_id": "$content_hash", "last_fetched_at": {"$max": "$fetched_at"}, "size": {"$first": "$stored_size"}}},
+            {"$sort": {"last_fetched_at": 1}},
+        ])
+        pages = [page async for page in cursor]
+        keep = {page["_id"] for page in pages}
+        evicted = 0
+        total = sum(page["size"] for page in pages)
+        for page in pages:
+            if not settings.PAGE_ARCHIVE_MAX_BYTES or total <= settings.PAGE_ARCHIVE_MAX_BYTES:
+                break
+            await self.collection.delete_many({"content_hash": page["_id"]})
+            keep.discard(page["_id"])
+            total -= page["size"]
+            evicted += 1
+        removed = await asyncio.to_thread(self._sweep, keep)
+        return {"evicted": evicted, "files_removed": removed, "stored_bytes": total}
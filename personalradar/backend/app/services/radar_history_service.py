@@ -0,0 +1,163 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from pymongo import ReturnDocument
+from ..core.config import settings
+from ..models.radar_history import (
+    CHANGES_COLLECTION,
+    SNAPSHOTS_COLLECTION,
+    RadarMovement,
+    RadarSnapshot,
+    TechnologyChange,
+)
+from ..models.technology import COLLECTION as TECHNOLOGIES_COLLECTION
+
+def radar_entry(doc: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """The part of a technology document the radar history tracks"""
+    if doc is None:
+        return None
+    return {
+        "technology_id": str(doc["_id"]),
+        "name": doc.get("name"),
+        "quadrant": doc.get("quadrant"),
+        "ring": doc.get("ring"),
+    }
+
+def _placement(entry: Optional[Dict[str, Any]]) -> Optional[tuple]:
+    return (entry["quadrant"], entry["ring"]) if entry else None
+
+class RadarHistoryService:
+    """Append-only log of radar changes with periodic compacted snapshots.
+
+    "Radar at X" loads the newest snapshot taken at or before X and replays the
+    changes logged after it, so the replay cost is bounded by RADAR_SNAPSHOT_EVERY.
+    """
+
+    def __init__(self, db: Any):
+        self.db = db
+        self.changes = db[CHANGES_COLLECTION]
+        self.snapshots = db[SNAPSHOTS_COLLECTION]
+
+    async def record_changes(self, pairs: List[tuple], at: Optional[datetime] = None) -> None:
+        """Log (before, after) technology documents; None marks a create or a delete"""
+        at = at or datetime.utcnow()
+        docs = []
+        for before_doc, after_doc in pairs:
+            before, after = radar_entry(before_doc), radar_entry(after_doc)
+            if before is not None and before == after:
+                continue
+            current = after or before
+            docs.append({
+                "technology_id": current["technology_id"],
+                "name": current["name"],
+                "op": "create" if before is None else "delete" if after is None else "update",
+                "at": at,
+                "before": before,
+                "after": after,
+                "moved": _placement(before) != _placement(after),
+            })
+        if not docs:
+            return
+        # The latest snapshot counts the changes logged since it, so no write has to count the log
+        latest = await self.snapshots.find_one_and_update(
+            {},
+            {"$inc": {"pending_changes": len(docs)}},
+            projection={"pending_changes": 1},
+            sort=[("at", -1)],
+            return_document=ReturnDocument.AFTER
+        )
+        if latest is None:
+            # Baseline for technologies that predate the log; replaying a change twice is harmless
+            await self.take_snapshot()
+        await self.changes.insert_many(docs)
+        if latest is not None and latest["pending_changes"] >= settings.RADAR_SNAPSHOT_EVERY:
+            await self.take_snapshot()
+
+    async def record_change(self, before: Optional[Dict[str, Any]], after: Optional[Dict[str, Any]]) -> None:
+        await self.record_changes([(before, after)])
+
+    async def _latest_snapshot(
+        self, at: Optional[datetime] = None, projection: Optional[Dict[str, int]] = None
+    ) -> Optional[Dict[str, Any]]:
+        query = {"at": {"$lte": at}} if at else {}
+        return await self.snapshots.find_one(query, projection, sort=[("at", -1)])
+
+    async def take_snapshot(self) -> RadarSnapshot:
+        """Compact the log: the previous snapshot plus its replayed changes become a new snapshot.
+
+        Without any snapshot the baseline is read from the technologies collection.
+        """
+        latest = await self._latest_snapshot()
+        if latest is None:
+            at = datetime.utcnow()
+            state = {}
+            async for doc in self.db[TECHNOLOGIES_COLLECTION].find({}, {"name": 1, "quadrant": 1, "ring": 1}):
+                entry = radar_entry(doc)
+                state[entry["technology_id"]] = entry
+        else:
+            state = {entry["technology_id"]: entry for entry in latest["technologies"]}
+            at = latest["at"]
+            async for change in self.changes.find({"at": {"$gt": latest["at"]}}).sort("at", 1):
+                self._apply(state, change)
+                at = change["at"]
+            if at == latest["at"]:
+                return RadarSnapshot(**latest)
+        snapshot = {
+            "at": at,
+            "technologies": sorted(state.values(), key=lambda entry: entry["name"]),
+            "pending_changes": 0,
+        }
+        await self.snapshots.insert_one(snapshot)
+        return RadarSnapshot(**snapshot)
+
+    def _apply(self, state: Dict[str, Dict[str, Any]], change: Dict[str, Any]) -> None:
+        if change["after"] is None:
+            state.pop(change["technology_id"], None)
+        else:
+            state[change["technology_id"]] = change["after"]
+
+    async def radar_at(self, at: Optional[datetime] = None) -> Optional[RadarSnapshot]:
+        """The radar as it stood at the given time (default: now).
+
+        None if the time predates the baseline snapshot, the first state the history knows.
+        """
+        if at is None:
+            at = datetime.utcnow()
+            snapshot = await self._latest_snapshot() or (await self.take_snapshot()).model_dump()
+        else:
+            snapshot = await self._latest_snapshot(at)
+            if snapshot is None:
+                return None
+        state = {entry["technology_id"]: entry for entry in snapshot["technologies"]}
+        async for change in self.changes.find({"at": {"$gt": snapshot["at"], "$lte": at}}).sort("at", 1):
+            self._apply(state, change)
+        return RadarSnapshot(at=at, technologies=sorted(state.values(), key=lambda entry: entry["name"]))
+
+    async def movements(self, since: datetime, until: datetime) -> List[RadarMovement]:
+        """Technologies whose placement differs between two dates, read from placement changes only"""
+        first: Dict[str, Dict[str, Any]] = {}
+        last: Dict[str, Dict[str, Any]] = {}
+        cursor = self.changes.find({"moved": True, "at": {"$gt": since, "$lte": until}}).sort("at", 1)
+        async for change in cursor:
+            first.setdefault(change["technology_id"], change)
+            last[change["technology_id"]] = change
+
+        movements = []
+        for technology_id, opening in first.items():
+            closing = last[technology_id]
+            before, after = opening["before"], closing["after"]
+            if _placement(before) == _placement(after):
+                continue
+            movements.append(RadarMovement(
+                technology_id=technology_id,
+                name=closing["name"],
+                from_quadrant=before["quadrant"] if before else None,
+                from_ring=before["ring"] if before else None,
+                to_quadrant=after["quadrant"] if after else None,
+                to_ring=after["ring"] if after else None,
+                changed_at=closing["at"],
+            ))
+        return movements
+
+    async def technology_history(self, technology_id: str) -> List[TechnologyChange]:
+        cursor = self.changes.find({"technology_id": technology_id}).sort("at", 1)
+        return [TechnologyChange(**doc) async for doc in cursor]
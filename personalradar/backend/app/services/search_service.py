@@ -0,0 +1,91 @@
+import asyncio
+import re
+from typing import Any, Dict, List, Optional
+from ..models import technology, technology_discovery
+from ..models.search import SearchHit, SearchResults
+
+# A name that starts with the query ranks above text matches elsewhere in the document
+NAME_EXACT_BONUS = 20.0
+NAME_PREFIX_BONUS = 10.0
+
+TECHNOLOGY_FIELDS = {"name": 1, "description": 1, "quadrant": 1, "ring": 1}
+DISCOVERY_FIELDS = {"name": 1, "description": 1, "status": 1, "category": 1, "article_title": 1, "discovered_at": 1}
+
+def search_name(name: str) -> str:
+    """The name_lower key stored beside name, so prefix lookups ignore case"""
+    return name.lower()
+
+def _prefix_pattern(prefix: str) -> re.Pattern:
+    # Anchored and case-sensitive on the lowercased key, so the name_lower index bounds the scan
+    return re.compile("^" + re.escape(search_name(prefix)))
+
+class SearchService:
+    """Ranked search over technologies and discoveries.
+
+    Each collection is searched with its weighted text index (whole words, stemmed)
+    and with a prefix lookup on the lowercased name_lower index, so partially typed names match
+    too. Hits are merged by score and paginated across both collections.
+    """
+
+    def __init__(self, db: Any):
+        self.technologies = db[technology.COLLECTION]
+        self.discoveries = db[technology_discovery.COLLECTION]
+
+    async def _search_collection(
+        self, collection: Any, query: str, filters: Dict[str, Any], projection: Dict[str, int], window: int
+    ) -> List[Dict[str, Any]]:
+        hits: Dict[Any, Dict[str, Any]] = {}
+        text_cursor = collection.find(
+            {"$text": {"$search": query}, **filters},
+            {**projection, "score": {"$meta": "textScore"}}
+        ).sort([("score", {"$meta": "textScore"})]).limit(window)
+        async for doc in text_cursor:
+            hits[doc["_id"]] = doc
+
+        prefix_cursor = collection.find(
+            {"name_lower": _prefix_pattern(query), **filters}, projection
+        ).sort("name_lower", 1).limit(window)
+        async for doc in prefix_cursor:
+            hit = hits.setdefault(doc["_id"], {**doc, "score": 0.0})
+            hit["score"] += NAME_EXACT_BONUS if search_name(doc["name"]) == search_name(query) else NAME_PREFIX_BONUS
+        return list(hits.values())
+
+    async def search(
+        self,
+        query: str,
+        kind: Optional[str] = None,
+        quadrant: Optional[str] = None,
+        ring: Optional[str] = None,
+        status: Optional[str] = None,
+        category: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 20,
+    ) -> SearchResults:
+        query = query.strip()
+        # Technology filters rule out discoveries and vice versa
+        technology_filters = {k: v for k, v in {"quadrant": quadrant, "ring": ring}.items() if v}
+        discovery_filters = {k: v for k, v in {"status": status, "category": category}.items() if v}
+        window = skip + limit + 1
+
+        searches = []
+        if kind in (None, "technology") and not discovery_filters:
+            searches.append(("technology", self._search_collection(
+                self.technologies, query, technology_filters, TECHNOLOGY_FIELDS, window)))
+        if kind in (None, "discovery") and not technology_filters:
+            searches.append(("discovery", self._search_collection(
+                self.discoveries, query, discovery_filters, DISCOVERY_FIELDS, window)))
+
+        results = await asyncio.gather(*(search for _, search in searches))
+        hits = [
+            SearchHit(type=hit_type, id=str(doc.pop("_id")), **doc)
+            for (hit_type, _), docs in zip(searches, results)
+            for doc in docs
+        ]
+        hits.sort(key=lambda hit: (-hit.score, hit.name.lower()))
+        return SearchResults(
+            query=query,
+            skip=skip,
+            limit=limit,
+            has_more=len(hits) > skip + limit,
+            results=hits[skip:skip + limit],
+        )
@@ -1,123 +1,198 @@
 import asyncio
-from curl_cffi.requests import AsyncSession
+import copy
+import hashlib
 import logging
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
-from bs4 import BeautifulSoup
 import re
 from urllib.parse import urljoin, urlparse
-import openai
 from ..models.news_source import NewsSource
 from ..models.technology_discovery import TechnologyDiscoveryCreate
+from ..services.article_fingerprint_service import ArticleFingerprintService, simhash
 from ..services.news_source_service import NewsSourceService
+from ..services.page_archive_service import PageArchiveService
 from ..services.technology_discovery_service import TechnologyDiscoveryService
 from ..core.config import settings
+from ..core.metrics import DISCOVERY_ARTICLES, outbound_call
+from ..core.profiling import profile_block
 
 logger = logging.getLogger(__name__)
 
 class TechDiscoveryAgent:
-    def __init__(self, news_source_service: NewsSourceService, discovery_service: TechnologyDiscoveryService):
+    # In replay mode pages are read from the page archive instead of the network; see replaying()
+    replay: bool = False
+    replay_as_of: Optional[datetime] = None
+
+    def __init__(
+        self,
+        news_source_service: NewsSourceService,
+        discovery_service: TechnologyDiscoveryService,
+        fingerprints: Optional[ArticleFingerprintService] = None,
+        page_archive: Optional[PageArchiveService] = None,
+    ):
         self.news_source_service = news_source_service
         self.discovery_service = discovery_service
+        self.fingerprints = fingerprints
+        self.page_archive = page_archive
+        # The crawler stack is imported on first use so API-only workers never load it
+        try:
+            import openai
+        except ImportError as e:
+            raise RuntimeError("Technology discovery requires the crawler extras: pip install -r requirements-crawler.txt") from e
         self.openai_client = openai.AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
         
-    async def discover_technologies_from_source(self, news_source: NewsSource) -> List[TechnologyDiscoveryCreate]:
-        """Main method to discover technologies from a news source"""
+    def replaying(self, as_of: Optional[datetime] = None) -> "TechDiscoveryAgent":
+        """A copy of this agent that re-runs parsing and extraction over archived pages, without network access.
+
+        Each page is read as last fetched at or before as_of (default: now). Near-duplicate
+        articles are extracted again rather than reusing the stored extraction.
+        """
+        if self.page_archive is None:
+            raise RuntimeError("Replay needs the page archive (PAGE_ARCHIVE_ENABLED)")
+        agent = copy.copy(self)
+        agent.replay = True
+        agent.replay_as_of = as_of or datetime.utcnow()
+        return agent
+
+    async def discover_technologies_from_source(
+        self, news_source: NewsSource, profile: bool = False, run_stats: Optional[Dict[str, Any]] = None
+    ) -> List[TechnologyDiscoveryCreate]:
+        """Main method to discover technologies from a news source.
+
+        Per-run counters such as duplicate_articles_skipped are added to run_stats when given,
+        along with the crawl's articles, new_discoveries and content_hash.
+        """
+        run_stats = run_stats if run_stats is not None else {}
+        run_stats.setdefault("duplicate_articles_skipped", 0)
+        async with profile_block(f"discovery {news_source.name}", force=profile):
+            try:
+                logger.info(f"Starting technology discovery for {news_source.name}")
+
+                # Scrape articles from the news source
+                articles = await self._scrape_articles(news_source.url)
+                logger.info(f"Found {len(articles)} articles from {news_source.name}")
+                run_stats["articles"] = len(articles)
+                run_stats["content_hash"] = hashlib.sha1(
+                    "\n".join(sorted(article["url"] for article in articles)).encode()
+                ).hexdigest()
+
+                discoveries = []
+
+                for article in articles:
+                    try:
+                        # Extract technologies from each article using AI
+                        article_discoveries = await self._extract_technologies_from_article(
+                            article, news_source, run_stats
+                        )
+                        discoveries.extend(article_discoveries)
+                    except Exception as e:
+                        logger.error(f"Error processing article {article.get('url', 'unknown')}: {e}")
+                        continue
+
+                # Filter out duplicates and save discoveries
+                unique_discoveries = await self._deduplicate_discoveries(discoveries, news_source.id)
+
+                # Save to database
+                saved_discoveries = []
+                for discovery in unique_discoveries:
+                    try:
+                        saved_discovery = await self.discovery_service.create_discovery(discovery)
+                        saved_discoveries.append(saved_discovery)
+                    except Exception as e:
+                        logger.error(f"Error saving discovery {discovery.name}: {e}")
+                run_stats["new_discoveries"] = len(saved_discoveries)
+
+                logger.info(
+                    f"Successfully discovered {len(saved_discoveries)} new technologies from {news_source.name}; "
+                    f"reused the extraction of {run_stats['duplicate_articles_skipped']} near-duplicate articles"
+                )
+                return saved_discoveries
+
+            except Exception as e:
+                logger.error(f"Error discovering technologies from {news_source.name}: {e}")
+                return []
+
+    async def _fetch(self, session: Any, url: str) -> Any:
+        with outbound_call("http") as call:
+            response = await session.get(url, impersonate="chrome120", timeout=30)
+            call.failed = response.status_code != 200
+        return response
+
+    async def _get_html(self, url: str) -> Optional[str]:
+        """HTML of a page fetched with status 200, archiving it; in replay mode, from the archive"""
+        if self.replay:
+            html = await self.page_archive.load(url, self.replay_as_of)
+            if html is None:
+                logger.info(f"No archived page for {url}")
+            return html
+        from curl_cffi.requests import AsyncSession
+        async with AsyncSession() as session:
+            response = await self._fetch(session, url)
+        if response.status_code != 200:
+            logger.error(f"Failed to fetch {url}: {response.status_code}")
+            return None
+        if self.page_archive is not None:
+            try:
+                await self.page_archive.store(url, response.content, response.encoding)
+            except Exception as e:
+                logger.error(f"Error archiving {url}: {e}")
+        return response.text
+
+    async def _scrape_articles(self, base_url: str) -> List[Dict[str, Any]]:
+        """Scrape articles from a news source"""
         try:
-            logger.info(f"Starting technology discovery for {news_source.name}")
-            
-            # Scrape articles from the news source
-            articles = await self._scrape_articles(news_source.url)
-            logger.info(f"Found {len(articles)} articles from {news_source.name}")
+            from bs4 import BeautifulSoup
+            html = await self._get_html(base_url)
+            if html is None:
+                return []
+            soup = BeautifulSoup(html, 'html.parser')
             
-            discoveries = []
+            articles = []
             
-            for article in articles:
-                try:
-                    # Extract technologies from each article using AI
-                    article_discoveries = await self._extract_technologies_from_article(
-                        article, news_source
-                    )
-                    discoveries.extend(article_discoveries)
-                except Exception as e:
-                    logger.error(f"Error processing article {article.get('url', 'unknown')}: {e}")
-                    continue
+            # Common selectors for article links
+            selectors = [
+                'a[href*="/article"]',
+                'a[href*="/post"]',
+                'a[href*="/story"]',
+                'a[href*="/news"]',
+                'article a',
+                '.article a',
+                '.post a',
+                '.story a'
+            ]
             
-            # Filter out duplicates and save discoveries
-            unique_discoveries = await self._deduplicate_discoveries(discoveries, news_source.id)
+            for selector in selectors:
+                links = soup.select(selector)
+                for link in links[:20]:  # Limit to first 20 articles
+                    href = link.get('href')
+                    if href:
+                        full_url = urljoin(base_url, href)
+                        title = link.get_text(strip=True)
+                        
+                        if self._is_valid_article_url(full_url, base_url) and title:
+                            articles.append({
+                                'url': full_url,
+                                'title': title,
+                                'base_url': base_url
+                            })
             
-            # Save to database
-            saved_discoveries = []
-            for discovery in unique_discoveries:
-                try:
-                    saved_discovery = await self.discovery_service.create_discovery(discovery)
-                    saved_discoveries.append(saved_discovery)
-                except Exception as e:
-                    logger.error(f"Error saving discovery {discovery.name}: {e}")
+            # Remove duplicates
+            unique_articles = []
+            seen_urls = set()
+            for article in articles:
+                if article['url'] not in seen_urls:
+                    unique_articles.append(article)
+                    seen_urls.add(article['url'])
             
-            logger.info(f"Successfully discovered {len(saved_discoveries)} new technologies from {news_source.name}")
-            return saved_discoveries
+            return unique_articles[:10]  # Return max 10 articles
             
-        except Exception as e:
-            logger.error(f"Error discovering technologies from {news_source.name}: {e}")
-            return []
-
-    async def _scrape_articles(self, base_url: str) -> List[Dict[str, Any]]:
-        """Scrape articles from a news source"""
-        try:
-            async with AsyncSession() as session:
-                response = await session.get(base_url, impersonate="chrome120", timeout=30)
-                if response.status_code != 200:
-                    logger.error(f"Failed to fetch {base_url}: {response.status_code}")
-                    return []
-                
-                html = response.text
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                articles = []
-                
-                # Common selectors for article links
-                selectors = [
-                    'a[href*="/article"]',
-                    'a[href*="/post"]',
-                    'a[href*="/story"]',
-                    'a[href*="/news"]',
-                    'article a',
-                    '.article a',
-                    '.post a',
-                    '.story a'
-                ]
-                
-                for selector in selectors:
-                    links = soup.select(selector)
-                    for link in links[:20]:  # Limit to first 20 articles
-                        href = link.get('href')
-                        if href:
-                            full_url = urljoin(base_url, href)
-                            title = link.get_text(strip=True)
-                            
-                            if self._is_valid_article_url(full_url, base_url) and title:
-                                articles.append({
-                                    'url': full_url,
-                                    'title': title,
-                                    'base_url': base_url
-                                })
-                
-                # Remove duplicates
-                unique_articles = []
-                seen_urls = set()
-                for article in articles:
-                    if article['url'] not in seen_urls:
-                        unique_articles.append(article)
-                        seen_urls.add(article['url'])
-                
-                return unique_articles[:10]  # Return max 10 articles
-                
         except Exception as e:
             logger.error(f"Error scraping {base_url}: {e}")
             return []
 
-    async def _extract_technologies_from_article(self, article: Dict[str, Any], news_source: NewsSource) -> List[TechnologyDiscoveryCreate]:
+    async def _extract_technologies_from_article(
+        self, article: Dict[str, Any], news_source: NewsSource, run_stats: Dict[str, int]
+    ) -> List[TechnologyDiscoveryCreate]:
         """Use AI to extract technologies from an article"""
         try:
             # Get article content
@@ -125,12 +200,29 @@ class TechDiscoveryAgent:
             if not content:
                 return []
             
-            # Use AI to extract technologies
-            technologies = await self._ai_extract_technologies(
-                article['title'], 
-                content, 
-                article['url']
-            )
+            # A near-duplicate of an article already processed, from any source, reuses its extraction
+            technologies = None
+            fingerprint = simhash(content) if self.fingerprints is not None and settings.ARTICLE_DEDUP_ENABLED else None
+            if fingerprint is not None and not self.replay:
+                duplicate = await self.fingerprints.find_duplicate(fingerprint)
+                if duplicate is not None:
+                    logger.info(f"Reusing extraction of {duplicate['url']} for near-duplicate {article['url']}")
+                    technologies = duplicate["technologies"]
+                    run_stats["duplicate_articles_skipped"] = run_stats.get("duplicate_articles_skipped", 0) + 1
+                    DISCOVERY_ARTICLES.inc(outcome="duplicate")
+
+            if technologies is None:
+                # Use AI to extract technologies
+                technologies = await self._ai_extract_technologies(
+                    article['title'], 
+                    content, 
+                    article['url']
+                )
+                DISCOVERY_ARTICLES.inc(outcome="extracted")
+                if technologies is None:
+                    return []
+                if fingerprint is not None:
+                    await self.fingerprints.record(article['url'], news_source.id, article['title'], fingerprint, technologies)
             
             discoveries = []
             for tech in technologies:
@@ -156,50 +248,48 @@ class TechDiscoveryAgent:
     async def _get_article_content(self, url: str) -> Optional[str]:
         """Get the main content of an article"""
         try:
-            async with AsyncSession() as session:
-                response = await session.get(url, impersonate="chrome120", timeout=30)
-                if response.status_code != 200:
-                    return None
-                
-                html = response.text
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                # Remove script and style elements
-                for script in soup(["script", "style"]):
-                    script.decompose()
-                
-                # Try to find main content
-                content_selectors = [
-                    'article',
-                    '.article-content',
-                    '.post-content',
-                    '.story-content',
-                    '.entry-content',
-                    'main',
-                    '.content'
-                ]
-                
-                content = ""
-                for selector in content_selectors:
-                    elements = soup.select(selector)
-                    if elements:
-                        content = ' '.join([elem.get_text() for elem in elements])
-                        break
-                
-                if not content:
-                    # Fallback to body text
-                    content = soup.get_text()
-                
-                # Clean up content
-                content = re.sub(r'\s+', ' ', content).strip()
-                return content[:5000]  # Limit content length
-        
+            from bs4 import BeautifulSoup
+            html = await self._get_html(url)
+            if html is None:
+                return None
+            soup = BeautifulSoup(html, 'html.parser')
+            
+            # Remove script and style elements
+            for script in soup(["script", "style"]):
+                script.decompose()
+            
+            # Try to find main content
+            content_selectors = [
+                'article',
+                '.article-content',
+                '.post-content',
+                '.story-content',
+                '.entry-content',
+                'main',
+                '.content'
+            ]
+            
+            content = ""
+            for selector in content_selectors:
+                elements = soup.select(selector)
+                if elements:
+                    content = ' '.join([elem.get_text() for elem in elements])
+                    break
+            
+            if not content:
+                # Fallback to body text
+                content = soup.get_text()
+            
+            # Clean up content
+            content = re.sub(r'\s+', ' ', content).strip()
+            return content[:5000]  # Limit content length
+
         except Exception as e:
             logger.error(f"Error getting article content from {url}: {e}")
             return None
 
-    async def _ai_extract_technologies(self, title: str, content: str, url: str) -> List[Dict[str, Any]]:
-        """Use OpenAI to extract technologies from article content"""
+    async def _ai_extract_technologies(self, title: str, content: str, url: str) -> Optional[List[Dict[str, Any]]]:
+        """Use OpenAI to extract technologies from article content; None if the call or its JSON failed"""
         try:
             prompt = f"""
             Analyze the following technology article and extract any new or emerging technologies mentioned.
@@ -228,37 +318,36 @@ class TechDiscoveryAgent:
             If no relevant technologies are found, return an empty array.
             """
             
-            response = await self.openai_client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are a technology analyst. Extract only new or emerging technologies from articles. Be precise and avoid false positives."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3,
-                max_tokens=1000
-            )
+            with outbound_call("openai"):
+                response = await self.openai_client.chat.completions.create(
+                    model="gpt-4",
+                    messages=[
+                        {"role": "system", "content": "You are a technology analyst. Extract only new or emerging technologies from articles. Be precise and avoid false positives."},
+                        {"role": "user", "content": prompt}
+                    ],
+                    temperature=0.3,
+                    max_tokens=1000
+                )
             
             result = response.choices[0].message.content
-            if result:
-                import json
-                try:
-                    technologies = json.loads(result)
-                    if isinstance(technologies, list):
-                        return technologies
-                except json.JSONDecodeError:
-                    logger.error(f"Failed to parse AI response as JSON: {result}")
-            
-            return []
+            if not result:
+                return []
+            import json
+            try:
+                technologies = json.loads(result)
+            except json.JSONDecodeError:
+                logger.error(f"Failed to parse AI response as JSON: {result}")
+                return None
+            return technologies if isinstance(technologies, list) else None
             
         except Exception as e:
             logger.error(f"Error in AI extraction: {e}")
-            return []
+            return None
 
     async def _deduplicate_discoveries(self, discoveries: List[TechnologyDiscoveryCreate], news_source_id: str) -> List[TechnologyDiscoveryCreate]:
         """Remove duplicate discoveries based on name and source"""
-        # Get existing discoveries for this source
-        existing_discoveries = await self.discovery_service.list_discoveries(news_source_id=news_source_id)
-        existing_names = {d.name.lower() for d in existing_discoveries}
+        # Names already discovered from this source, archived ones included
+        existing_names = await self.discovery_service.known_names(news_source_id)
         
         unique_discoveries = []
         seen_names = set()
@@ -300,8 +389,8 @@ class TechDiscoveryAgent:
         except Exception:
             return False
 
-    async def run_discovery_for_all_sources(self) -> Dict[str, List[TechnologyDiscoveryCreate]]:
-        """Run technology discovery for all active news sources"""
+    async def run_discovery_for_all_sources(self, run_stats: Optional[Dict[str, Any]] = None) -> Dict[str, List[TechnologyDiscoveryCreate]]:
+        """Run technology discovery for all active news sources; run_stats sums the per-source counters"""
         try:
             # Get all active news sources
             news_sources = await self.news_source_service.list_news_sources()
@@ -311,15 +400,37 @@ class TechDiscoveryAgent:
             
             for source in active_sources:
                 try:
-                    discoveries = await self.discover_technologies_from_source(source)
+                    source_stats: Dict[str, Any] = {}
+                    discoveries = await self.discover_technologies_from_source(source, run_stats=source_stats)
                     results[source.name] = discoveries
+                    if run_stats is not None:
+                        run_stats["duplicate_articles_skipped"] = (
+                            run_stats.get("duplicate_articles_skipped", 0) + source_stats["duplicate_articles_skipped"]
+                        )
                     
-                    # Update last checked time
-                    await self.news_source_service.update_last_checked(source.id)
+                    # Update last checked time; the crawl's yield feeds adaptive cadence. A replay is no crawl
+                    if self.replay:
+                        continue
+                    if "content_hash" in source_stats:
+                        await self.news_source_service.record_crawl(
+                            source.id,
+                            new_discoveries=source_stats.get("new_discoveries", 0),
+                            articles=source_stats["articles"],
+                            content_hash=source_stats["content_hash"],
+                        )
+                    else:
+                        await self.news_source_service.update_last_checked(source.id)
                     
                 except Exception as e:
                     logger.error(f"Error processing source {source.name}: {e}")
                     results[source.name] = []
+
+            if self.page_archive is not None and not self.replay:
+                try:
+                    pruned = await self.page_archive.prune()
+                    logger.info(f"Page archive pruned: {pruned}")
+                except Exception as e:
+                    logger.error(f"Error pruning the page archive: {e}")
             
             return results
             
@@ -1,82 +1,513 @@
-from datetime import datetime
-from typing import List, Optional
-from bson import ObjectId
-from ..models.technology_discovery import TechnologyDiscovery, TechnologyDiscoveryCreate, TechnologyDiscoveryInDB
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError
+from ..models.discovery_rollup import TrendingTechnologies
+from ..models.technology_discovery import ARCHIVE_COLLECTION, COLLECTION, TechnologyDiscovery, TechnologyDiscoveryCreate, TechnologyDiscoveryInDB
+from ..core.config import settings
 from ..core.database import Database
+from ..core.repository import MongoRepository, to_object_id
+from .discovery_rollup_service import ROLLUP_FIELDS, DiscoveryRollupService
+from .search_service import search_name
+from .technology_service import TechnologyService
+
+STATS_COLLECTION = "discovery_stats"
+STATS_ID = "summary"
+
+def confidence_bucket(score: float) -> str:
+    if score >= 0.8:
+        return "high"
+    if score >= 0.5:
+        return "medium"
+    return "low"
+
+def _stats_key(value: str) -> str:
+    # Status and category values become field names in the stats document
+    return value.replace("$", "\uff04").replace(".", "\uff0e")
+
+def _stats_value(key: str) -> str:
+    return key.replace("\uff04", "$").replace("\uff0e", ".")
+
+class TechnologyDiscoveryService(MongoRepository[TechnologyDiscovery]):
+    model = TechnologyDiscovery
 
-class TechnologyDiscoveryService:
     def __init__(self, db: Database):
+        super().__init__(db[COLLECTION])
         self.db = db
-        self.collection = db.technology_discoveries
+        self.stats_collection = db[STATS_COLLECTION]
+        self.archive = db[ARCHIVE_COLLECTION]
+        self.rollups = DiscoveryRollupService(db)
 
-    def _fix_id(self, doc):
-        if doc and '_id' in doc and isinstance(doc['_id'], ObjectId):
-            doc['_id'] = str(doc['_id'])
-        return doc
+    def _derived_fields(self, fields: Dict[str, Any]) -> Dict[str, Any]:
+        return {"name_lower": search_name(fields["name"])} if "name" in fields else {}
 
     async def create_discovery(self, discovery: TechnologyDiscoveryCreate) -> TechnologyDiscovery:
         now = datetime.utcnow()
         discovery_dict = discovery.model_dump()
         discovery_dict["created_at"] = now
         discovery_dict["updated_at"] = now
+        if discovery_dict["status"] == "ignored":
+            discovery_dict["ignored_at"] = now
         
-        result = await self.collection.insert_one(discovery_dict)
-        created_discovery = await self.collection.find_one({"_id": result.inserted_id})
-        return TechnologyDiscovery(**self._fix_id(created_discovery))
+        created_discovery = await self._insert(discovery_dict)
+        await self._count_in_stats(discovery_dict, 1)
+        await self.rollups.record([discovery_dict])
+        return created_discovery
 
-    async def get_discovery(self, discovery_id: str) -> Optional[TechnologyDiscovery]:
-        discovery = await self.collection.find_one({"_id": ObjectId(discovery_id)})
-        return TechnologyDiscovery(**self._fix_id(discovery)) if discovery else None
+    async def get_discovery(self, discovery_id: str, include_archived: bool = False) -> Optional[TechnologyDiscovery]:
+        discovery = await self._get(discovery_id)
+        if discovery is None and include_archived:
+            discovery = self._to_model(await self.archive.find_one({"_id": to_object_id(discovery_id)}))
+        return discovery
 
-    async def list_discoveries(self, news_source_id: Optional[str] = None, status: Optional[str] = None) -> List[TechnologyDiscovery]:
-        filter_query = {}
+    def build_list_query(
+        self,
+        news_source_id: Optional[str] = None,
+        status: Optional[str] = None,
+        category: Optional[str] = None,
+        min_confidence: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Build the Mongo filter for any combination of list filters"""
+        filter_query: Dict[str, Any] = {}
         if news_source_id:
             filter_query["news_source_id"] = news_source_id
         if status:
             filter_query["status"] = status
-        
-        discoveries = []
+        if category:
+            filter_query["category"] = category
+        if min_confidence:
+            filter_query["confidence_score"] = {"$gte": min_confidence}
+        return filter_query
+
+    async def query_discoveries(
+        self,
+        news_source_id: Optional[str] = None,
+        status: Optional[str] = None,
+        category: Optional[str] = None,
+        min_confidence: Optional[float] = None,
+        skip: int = 0,
+        limit: Optional[int] = None,
+        include_archived: bool = False,
+    ) -> List[TechnologyDiscovery]:
+        """Filter, sort and paginate discoveries in a single query, newest first"""
+        return await self._find_models(self._list_cursor(
+            news_source_id, status, category, min_confidence, skip, limit, include_archived
+        ))
+
+    def stream_discoveries(
+        self,
+        news_source_id: Optional[str] = None,
+        status: Optional[str] = None,
+        category: Optional[str] = None,
+        min_confidence: Optional[float] = None,
+        skip: int = 0,
+        limit: Optional[int] = None,
+        include_archived: bool = False,
+    ) -> AsyncIterator[List[TechnologyDiscovery]]:
+        """Same query as query_discoveries, yielded in validated batches"""
+        return self._iter_models(self._list_cursor(
+            news_source_id, status, category, min_confidence, skip, limit, include_archived
+        ))
+
+    def _list_cursor(
+        self,
+        news_source_id: Optional[str],
+        status: Optional[str],
+        category: Optional[str],
+        min_confidence: Optional[float],
+        skip: int,
+        limit: Optional[int],
+        include_archived: bool = False,
+    ) -> Any:
+        filter_query = self.build_list_query(news_source_id, status, category, min_confidence)
+        if include_archived:
+            # Both collections are filtered by their own indexes before the merge sort; with a
+            # limit, neither side needs more than skip + limit documents of its own
+            branch: List[Dict[str, Any]] = [{"$match": filter_query}]
+            if limit:
+                branch += [{"$sort": {"discovered_at": -1}}, {"$limit": skip + limit}]
+            pipeline: List[Dict[str, Any]] = [
+                *branch,
+                {"$unionWith": {"coll": ARCHIVE_COLLECTION, "pipeline": branch}},
+                {"$sort": {"discovered_at": -1}},
+            ]
+            if skip:
+                pipeline.append({"$skip": skip})
+            if limit:
+                pipeline.append({"$limit": limit})
+            return self.collection.aggregate(pipeline)
         cursor = self.collection.find(filter_query).sort("discovered_at", -1)
-        async for doc in cursor:
-            discoveries.append(TechnologyDiscovery(**self._fix_id(doc)))
-        return discoveries
+        if skip:
+            cursor = cursor.skip(skip)
+        if limit:
+            cursor = cursor.limit(limit)
+        return cursor
+
+    async def list_discoveries(self, news_source_id: Optional[str] = None, status: Optional[str] = None) -> List[TechnologyDiscovery]:
+        return await self.query_discoveries(news_source_id=news_source_id, status=status)
+
+    def export_cursor(self, **filters: Any) -> Any:
+        return self.collection.find(self.build_list_query(**filters)).sort("discovered_at", -1)
+
+    async def bulk_upsert_discoveries(self, rows: List[Tuple[int, Any]]) -> List[Dict[str, Any]]:
+        """Upsert a chunk of discoveries by (news_source_id, name); call refresh_stats once afterwards"""
+        keys = [
+            {"news_source_id": row["news_source_id"], "name": row["name"]}
+            for _, row in rows
+            if isinstance(row, dict) and isinstance(row.get("news_source_id"), str) and isinstance(row.get("name"), str)
+        ]
+        before = await self._find_by_keys(keys)
+        outcomes = await self._bulk_upsert(rows, TechnologyDiscoveryCreate, ["news_source_id", "name"])
+        written = [(outcome["news_source_id"], outcome["name"]) for outcome in outcomes if outcome["status"] != "error"]
+        if written:
+            after = await self._find_by_keys([{"news_source_id": source_id, "name": name} for source_id, name in written])
+            await self.rollups.record_changes([(before.get(key), after.get(key)) for key in dict.fromkeys(written)])
+            await self.stamp_ignored()
+        return outcomes
+
+    async def stamp_ignored(self) -> int:
+        """Start the TTL clock on ignored discoveries written without going through a status change"""
+        result = await self.collection.update_many(
+            {"status": "ignored", "ignored_at": {"$exists": False}},
+            [{"$set": {"ignored_at": "$updated_at"}}]
+        )
+        return result.modified_count
+
+    async def known_names(self, news_source_id: str) -> Set[str]:
+        """Lower-cased names already discovered from a source, archived ones included"""
+        names: Set[str] = set()
+        for collection in (self.collection, self.archive):
+            names.update(name.lower() for name in await collection.distinct("name", {"news_source_id": news_source_id}))
+        return names
+
+    def archive_query(self, now: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
+        """Discoveries the retention settings move out of the hot collection, or None if archiving is off"""
+        now = now or datetime.utcnow()
+        rules = []
+        if settings.DISCOVERY_ARCHIVE_AFTER_DAYS:
+            rules.append({"discovered_at": {"$lt": now - timedelta(days=settings.DISCOVERY_ARCHIVE_AFTER_DAYS)}})
+        if settings.DISCOVERY_LOW_CONFIDENCE_ARCHIVE_AFTER_DAYS and settings.DISCOVERY_LOW_CONFIDENCE_BELOW:
+            rules.append({
+                "discovered_at": {"$lt": now - timedelta(days=settings.DISCOVERY_LOW_CONFIDENCE_ARCHIVE_AFTER_DAYS)},
+                "confidence_score": {"$lt": settings.DISCOVERY_LOW_CONFIDENCE_BELOW},
+            })
+        if not rules:
+            return None
+        return {"status": {"$ne": "promoted"}, "$or": rules}
+
+    async def archive_stale(self, now: Optional[datetime] = None) -> int:
+        """Move discoveries matching the retention rules into the archive, one batch at a time.
+
+        Each batch is copied before it is deleted and copies keep their _id, so a run
+        interrupted between the two steps, or racing another worker, archives nothing twice.
+        Discoveries changed in between so they no longer match stay live and lose their copy.
+        """
+        query = self.archive_query(now)
+        archived = 0
+        while query is not None:
+            batch = await self.collection.find(query).limit(settings.DISCOVERY_ARCHIVE_BATCH_SIZE).to_list(length=None)
+            if not batch:
+                break
+            archived_at = datetime.utcnow()
+            try:
+                await self.archive.insert_many([{**doc, "archived_at": archived_at} for doc in batch], ordered=False)
+            except BulkWriteError as e:
+                if any(error.get("code") != 11000 for error in e.details.get("writeErrors", [])):
+                    raise
+            ids = [doc["_id"] for doc in batch]
+            # Re-checking the rules spares discoveries promoted or assessed since the find
+            result = await self.collection.delete_many({**query, "_id": {"$in": ids}})
+            archived += result.deleted_count
+            if result.deleted_count < len(ids):
+                kept = await self.collection.distinct("_id", {"_id": {"$in": ids}})
+                if kept:
+                    await self.archive.delete_many({"_id": {"$in": kept}})
+        # The TTL monitor deletes ignored discoveries without telling us, so while it runs
+        # every pass moves the version on, or list and stats ETags would outlive the deletions
+        if archived or settings.DISCOVERY_IGNORED_TTL_DAYS:
+            await self._changed()
+        # Also picks up documents the TTL monitor deleted since the last run
+        await self.refresh_stats()
+        return archived
+
+    async def _find_by_keys(self, keys: List[Dict[str, str]]) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        if not keys:
+            return {}
+        cursor = self.collection.find({"$or": keys}, ROLLUP_FIELDS)
+        return {(doc["news_source_id"], doc["name"]): doc async for doc in cursor}
+
+    async def refresh_stats(self) -> None:
+        """Rebuild materialized stats after writes whose per-document deltas are unknown"""
+        if settings.DISCOVERY_STATS_MATERIALIZED:
+            await self.rebuild_stats()
 
     async def get_new_discoveries_since(self, news_source_id: str, since_date: datetime) -> List[TechnologyDiscovery]:
         """Get discoveries for a news source since a specific date"""
-        discoveries = []
         cursor = self.collection.find({
             "news_source_id": news_source_id,
             "discovered_at": {"$gte": since_date}
         }).sort("discovered_at", -1)
-        
-        async for doc in cursor:
-            discoveries.append(TechnologyDiscovery(**self._fix_id(doc)))
-        return discoveries
+        return await self._find_models(cursor)
 
     async def update_discovery_status(self, discovery_id: str, status: str) -> Optional[TechnologyDiscovery]:
-        result = await self.collection.update_one(
-            {"_id": ObjectId(discovery_id)},
-            {"$set": {"status": status, "updated_at": datetime.utcnow()}}
+        changes = self._status_changes(status)
+        # The previous document carries the old status for the stats delta; the response is built from it
+        previous = await self._update(discovery_id, {"$set": changes}, ReturnDocument.BEFORE)
+        if previous is None:
+            return None
+        if previous.get("status") != status:
+            await self._inc_stats({
+                f"by_status.{_stats_key(previous.get('status') or 'discovered')}": -1,
+                f"by_status.{_stats_key(status)}": 1,
+            })
+        return self._to_model({**previous, **changes})
+
+    def _status_changes(self, status: str) -> Dict[str, Any]:
+        now = datetime.utcnow()
+        changes: Dict[str, Any] = {"status": status, "updated_at": now}
+        if status == "ignored":
+            # Starts the TTL clock, restarting it if the discovery was ignored before
+            changes["ignored_at"] = now
+        return changes
+
+    async def bulk_update_status(self, ids: List[str], status: str) -> List[Dict[str, Any]]:
+        """Set one status on many discoveries with a single bulk_write; one result per ID, in order"""
+        ids = list(dict.fromkeys(ids))
+        object_ids = {discovery_id: to_object_id(discovery_id) for discovery_id in ids}
+        cursor = self.collection.find({"_id": {"$in": list(object_ids.values())}}, {"status": 1})
+        previous = {str(doc["_id"]): doc.get("status") async for doc in cursor}
+
+        changes = self._status_changes(status)
+        operations = []
+        pending: List[str] = []
+        results = []
+        for discovery_id in ids:
+            if discovery_id not in previous:
+                results.append({"id": discovery_id, "result": "not_found"})
+                continue
+            if previous[discovery_id] == status:
+                results.append({"id": discovery_id, "result": "unchanged"})
+                continue
+            # Matching on the previous status keeps the stats deltas exact under concurrent edits
+            operations.append(UpdateOne({"_id": object_ids[discovery_id], "status": previous[discovery_id]}, {"$set": changes}))
+            pending.append(discovery_id)
+            results.append({"id": discovery_id, "result": "updated"})
+
+        if operations:
+            result = await self.collection.bulk_write(operations, ordered=False)
+            await self._changed()
+            updated = set(pending)
+            if result.matched_count < len(operations):
+                # bulk_write only counts matches; our writes are the ones carrying this exact timestamp
+                cursor = self.collection.find(
+                    {"_id": {"$in": [object_ids[discovery_id] for discovery_id in pending]}, "status": status, "updated_at": changes["updated_at"]},
+                    {"_id": 1}
+                )
+                updated = {str(doc["_id"]) async for doc in cursor}
+                for item in results:
+                    if item["result"] == "updated" and item["id"] not in updated:
+                        item["result"] = "conflict"
+            increments: Dict[str, int] = {}
+            for discovery_id in updated:
+                for key, delta in ((_stats_key(previous[discovery_id] or "discovered"), -1), (_stats_key(status), 1)):
+                    increments[f"by_status.{key}"] = increments.get(f"by_status.{key}", 0) + delta
+            increments = {k: v for k, v in increments.items() if v}
+            if increments:
+                await self._inc_stats(increments)
+        return results
+
+    async def promote_discoveries(
+        self, ids: List[str], quadrant: str, ring: str, technologies: TechnologyService
+    ) -> List[Dict[str, Any]]:
+        """Upsert discoveries onto the radar by name, then mark them promoted.
+
+        Technologies are written first with one bulk upsert and the statuses second,
+        so a failed batch can simply be retried: both steps are idempotent.
+        """
+        ids = list(dict.fromkeys(ids))
+        cursor = self.collection.find(
+            {"_id": {"$in": [to_object_id(discovery_id) for discovery_id in ids]}},
+            {"name": 1, "description": 1, "article_url": 1, "source_url": 1}
         )
-        if result.modified_count:
-            updated_discovery = await self.collection.find_one({"_id": ObjectId(discovery_id)})
-            return TechnologyDiscovery(**self._fix_id(updated_discovery))
-        return None
+        found = {str(doc["_id"]): doc async for doc in cursor}
+        names = list(dict.fromkeys(doc["name"] for doc in found.values()))
+        existing = await technologies.existing_names(names)
+
+        now = datetime.utcnow()
+        rows: Dict[str, Dict[str, Any]] = {}
+        for doc in found.values():
+            row = rows.setdefault(doc["name"], {
+                "name": doc["name"],
+                "quadrant": quadrant,
+                "ring": ring,
+                "date_of_assessment": now,
+            })
+            # A curated description, source and link on an existing technology are kept
+            if doc["name"] not in existing:
+                row.setdefault("description", doc.get("description"))
+                row.setdefault("source", "Technology discovery")
+                row.setdefault("uri", doc.get("article_url") or doc.get("source_url"))
+        outcomes = await technologies.bulk_upsert_technologies(list(enumerate(rows.values())))
+        technology_results = {outcome["name"]: outcome for outcome in outcomes}
+
+        promoted = [
+            discovery_id for discovery_id in ids
+            if discovery_id in found and technology_results[found[discovery_id]["name"]]["status"] != "error"
+        ]
+        conflicts = set()
+        if promoted:
+            status_results = await self.bulk_update_status(promoted, "promoted")
+            conflicts = {item["id"] for item in status_results if item["result"] == "conflict"}
+
+        results = []
+        for discovery_id in ids:
+            if discovery_id not in found:
+                results.append({"id": discovery_id, "result": "not_found"})
+                continue
+            outcome = technology_results[found[discovery_id]["name"]]
+            if outcome["status"] == "error":
+                results.append({"id": discovery_id, "result": "error", "error": outcome["error"]})
+            elif discovery_id in conflicts:
+                # On the radar, but the discovery changed status meanwhile and was left as it is
+                results.append({"id": discovery_id, "result": "conflict", "technology": outcome["name"], "technology_result": outcome["status"]})
+            else:
+                results.append({"id": discovery_id, "result": "promoted", "technology": outcome["name"], "technology_result": outcome["status"]})
+        return results
 
     async def delete_discovery(self, discovery_id: str) -> bool:
-        result = await self.collection.delete_one({"_id": ObjectId(discovery_id)})
-        return result.deleted_count > 0
+        deleted = await self._delete(discovery_id)
+        if deleted is None:
+            return False
+        await self._count_in_stats(deleted, -1)
+        await self.rollups.record([deleted], -1)
+        return True
+
+    async def compute_stats(self) -> Dict[str, Any]:
+        """Count discoveries by status, category and confidence bucket in one aggregation"""
+        pipeline = [
+            {
+                "$facet": {
+                    "total": [{"$count": "count"}],
+                    "by_status": [{"$group": {"_id": "$status", "count": {"$sum": 1}}}],
+                    "by_category": [
+                        {"$match": {"category": {"$nin": [None, ""]}}},
+                        {"$group": {"_id": "$category", "count": {"$sum": 1}}}
+                    ],
+                    "by_confidence": [
+                        {
+                            "$group": {
+                                "_id": {
+                                    "$switch": {
+                                        "branches": [
+                                            {"case": {"$gte": ["$confidence_score", 0.8]}, "then": "high"},
+                                            {"case": {"$gte": ["$confidence_score", 0.5]}, "then": "medium"}
+                                        ],
+                                        "default": "low"
+                                    }
+                                },
+                                "count": {"$sum": 1}
+                            }
+                        }
+                    ]
+                }
+            }
+        ]
+        facets = {}
+        async for doc in self.collection.aggregate(pipeline):
+            facets = doc
+        total = facets.get("total") or [{"count": 0}]
+        by_confidence = {"high": 0, "medium": 0, "low": 0}
+        by_confidence.update({row["_id"]: row["count"] for row in facets.get("by_confidence", [])})
+        return {
+            "total_discoveries": total[0]["count"],
+            "by_status": {row["_id"]: row["count"] for row in facets.get("by_status", [])},
+            "by_category": {row["_id"]: row["count"] for row in facets.get("by_category", [])},
+            "by_confidence": by_confidence
+        }
+
+    async def rebuild_stats(self) -> Dict[str, Any]:
+        """Recompute the materialized stats document from the collection.
+
+        While the counts are aggregated the document is marked rebuilding and writers
+        skip their increments, marking it stale instead. The result is only saved if
+        nothing was skipped and no newer rebuild started; otherwise the stale mark makes
+        the next read rebuild again. A write whose discovery lands before the aggregate
+        but whose increment lands after the save is counted twice until the next
+        rebuild, so the document is eventually consistent, not exact.
+        """
+        started = await self.stats_collection.find_one_and_update(
+            {"_id": STATS_ID},
+            {"$inc": {"generation": 1}, "$set": {"rebuilding": True, "stale": False, "rebuild_started_at": datetime.utcnow()}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        generation = started["generation"]
+        stats = await self.compute_stats()
+        result = await self.stats_collection.replace_one(
+            {"_id": STATS_ID, "generation": generation, "stale": False},
+            {
+                "total_discoveries": stats["total_discoveries"],
+                "by_status": {_stats_key(k): v for k, v in stats["by_status"].items()},
+                "by_category": {_stats_key(k): v for k, v in stats["by_category"].items()},
+                "by_confidence": stats["by_confidence"],
+                "generation": generation,
+                "rebuilding": False,
+                "stale": False,
+                "rebuilt_at": datetime.utcnow()
+            }
+        )
+        if not result.matched_count:
+            # Increments were skipped meanwhile: hand over to the next read, unless a newer rebuild owns it
+            await self.stats_collection.update_one(
+                {"_id": STATS_ID, "generation": generation},
+                {"$set": {"rebuilding": False, "stale": True}}
+            )
+        return stats
+
+    async def get_stats(self) -> Dict[str, Any]:
+        """Read the materialized stats document when enabled, otherwise aggregate"""
+        if not settings.DISCOVERY_STATS_MATERIALIZED:
+            return await self.compute_stats()
+        doc = await self.stats_collection.find_one({"_id": STATS_ID})
+        if doc is None or doc.get("stale"):
+            return await self.rebuild_stats()
+        if doc.get("rebuilding"):
+            timeout = timedelta(seconds=settings.DISCOVERY_STATS_REBUILD_TIMEOUT_SECONDS)
+            if doc["rebuild_started_at"] < datetime.utcnow() - timeout:
+                return await self.rebuild_stats()
+            # Another worker is rebuilding; its counts are not ready yet
+            return await self.compute_stats()
+        return {
+            "total_discoveries": doc.get("total_discoveries", 0),
+            "by_status": {_stats_value(k): v for k, v in doc.get("by_status", {}).items() if v},
+            "by_category": {_stats_value(k): v for k, v in doc.get("by_category", {}).items() if v},
+            "by_confidence": {"high": 0, "medium": 0, "low": 0, **doc.get("by_confidence", {})}
+        }
+
+    async def _count_in_stats(self, doc: Dict[str, Any], delta: int) -> None:
+        increments = {
+            "total_discoveries": delta,
+            f"by_status.{_stats_key(doc.get('status') or 'discovered')}": delta,
+            f"by_confidence.{confidence_bucket(doc.get('confidence_score', 0.0))}": delta,
+        }
+        if doc.get("category"):
+            increments[f"by_category.{_stats_key(doc['category'])}"] = delta
+        await self._inc_stats(increments)
+
+    async def _inc_stats(self, increments: Dict[str, int]) -> None:
+        # Without upsert: a missing document is rebuilt from the collection on the next read
+        if not settings.DISCOVERY_STATS_MATERIALIZED:
+            return
+        result = await self.stats_collection.update_one({"_id": STATS_ID, "rebuilding": {"$ne": True}}, {"$inc": increments})
+        if not result.matched_count:
+            # A rebuild is aggregating and may not see this write; it must not save its counts
+            await self.stats_collection.update_one({"_id": STATS_ID}, {"$set": {"stale": True}})
+
+    async def trending(self, days: int, limit: int = 20, min_sources: int = 1) -> TrendingTechnologies:
+        return await self.rollups.trending(days, limit, min_sources)
 
     async def get_discoveries_by_category(self, category: str) -> List[TechnologyDiscovery]:
-        discoveries = []
-        cursor = self.collection.find({"category": category}).sort("discovered_at", -1)
-        async for doc in cursor:
-            discoveries.append(TechnologyDiscovery(**self._fix_id(doc)))
-        return discoveries
+        return await self.query_discoveries(category=category)
 
     async def get_high_confidence_discoveries(self, min_confidence: float = 0.7) -> List[TechnologyDiscovery]:
-        discoveries = []
-        cursor = self.collection.find({"confidence_score": {"$gte": min_confidence}}).sort("discovered_at", -1)
-        async for doc in cursor:
-            discoveries.append(TechnologyDiscovery(**self._fix_id(doc)))
-        return discoveries 
\ No newline at end of file
+        return await self.query_discoveries(min_confidence=min_confidence)
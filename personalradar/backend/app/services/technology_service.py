@@ -1,13 +1,38 @@
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
 from motor.motor_asyncio import AsyncIOMotorClient
-from ..models.technology import Technology, TechnologyCreate
+from ..models.technology import COLLECTION, Technology, TechnologyCreate
+from ..core.cache import ReadThroughCache
+from ..core.repository import MongoRepository
+from .radar_history_service import RadarHistoryService
+from .search_service import search_name
+from pymongo import ReturnDocument
 from pymongo.errors import DuplicateKeyError
-from bson import ObjectId
 
-class TechnologyService:
-    def __init__(self, db: AsyncIOMotorClient) -> None:
-        self.collection = db.technologies
+class TechnologyService(MongoRepository[Technology]):
+    model = Technology
+
+    def __init__(self, db: AsyncIOMotorClient, cache: Optional[ReadThroughCache] = None) -> None:
+        super().__init__(db[COLLECTION])
+        self.cache = cache
+        self.history = RadarHistoryService(db)
+
+    async def _changed(self) -> None:
+        await super()._changed()
+        if self.cache is not None:
+            await self.cache.invalidate(f"{COLLECTION}:")
+
+    def _derived_fields(self, fields: Dict[str, Any]) -> Dict[str, Any]:
+        return {"name_lower": search_name(fields["name"])} if "name" in fields else {}
+
+    def _prepare_doc(self, doc: Dict[str, Any]) -> Dict[str, Any]:
+        # Fix date_of_assessment if it's a string Pydantic cannot parse
+        if "date_of_assessment" in doc and isinstance(doc["date_of_assessment"], str):
+            try:
+                doc["date_of_assessment"] = datetime.fromisoformat(doc["date_of_assessment"])
+            except Exception:
+                doc["date_of_assessment"] = None
+        return doc
 
     async def create_technology(self, tech_data: TechnologyCreate) -> Technology:
         tech_dict = tech_data.model_dump()
@@ -18,25 +43,26 @@ class TechnologyService:
         tech_dict.setdefault("date_of_assessment", datetime.utcnow())
         tech_dict.setdefault("uri", None)
         try:
-            result = await self.collection.insert_one(tech_dict)
-            tech_dict["_id"] = str(result.inserted_id)
-            return Technology(**tech_dict)
+            technology = await self._insert(tech_dict)
         except DuplicateKeyError:
             # Optionally, you can raise a custom exception or return None or a message
             raise ValueError(f"Technology with name '{tech_data.name}' already exists.")
+        await self.history.record_change(None, tech_dict)
+        return technology
+
+    async def list_technologies(self, etag: Optional[str] = None) -> List[Technology]:
+        """All technologies; pass the listing's etag when the caller already has it"""
+        if self.cache is None:
+            return await self._find_models(self.collection.find())
+        return await self.cache.get_or_load(
+            f"{COLLECTION}:list",
+            etag or await self.etag(),
+            lambda: self._find_models(self.collection.find())
+        )
 
-    async def list_technologies(self) -> List[Technology]:
-        techs = []
-        async for doc in self.collection.find():
-            doc["_id"] = str(doc["_id"])
-            # Fix date_of_assessment if it's a string
-            if "date_of_assessment" in doc and isinstance(doc["date_of_assessment"], str):
-                try:
-                    doc["date_of_assessment"] = datetime.fromisoformat(doc["date_of_assessment"])
-                except Exception:
-                    doc["date_of_assessment"] = None
-            techs.append(Technology(**doc))
-        return techs
+    def stream_technologies(self) -> AsyncIterator[List[Technology]]:
+        """Every technology straight from the cursor, in validated batches"""
+        return self._iter_models(self.collection.find())
 
     async def update_technology(self, tech_id: str, update_data: Dict[str, Any]) -> Optional[Technology]:
         update_data["updated_at"] = datetime.utcnow()
@@ -44,27 +70,37 @@ class TechnologyService:
         update_data.setdefault("source", "")
         update_data.setdefault("date_of_assessment", datetime.utcnow())
         update_data.setdefault("uri", None)
-        result = await self.collection.find_one_and_update(
-            {"_id": ObjectId(tech_id)},
-            {"$set": update_data},
-            return_document=True
-        )
-        if result:
-            result["_id"] = str(result["_id"])
-            # Fix date_of_assessment if it's a string
-            if "date_of_assessment" in result and isinstance(result["date_of_assessment"], str):
-                try:
-                    result["date_of_assessment"] = datetime.fromisoformat(result["date_of_assessment"])
-                except Exception:
-                    result["date_of_assessment"] = None
-            return Technology(**result)
-        return None
+        # The pre-image feeds the radar history; the response is the merged document
+        before = await self._update(tech_id, {"$set": update_data}, ReturnDocument.BEFORE)
+        if before is None:
+            return None
+        after = {**before, **update_data}
+        await self.history.record_change(before, after)
+        return self._to_model(after)
 
     async def delete_technology(self, tech_id: str) -> Optional[Technology]:
-        result = await self.collection.find_one_and_delete({"_id": ObjectId(tech_id)})
-        if result:
-            result["_id"] = str(result["_id"])
-            return Technology(**result)
-        return None
+        deleted = await self._delete(tech_id)
+        if deleted is not None:
+            await self.history.record_change(deleted, None)
+        return self._to_model(deleted)
+
+    async def _find_by_names(self, names: List[str]) -> Dict[str, Dict[str, Any]]:
+        cursor = self.collection.find({"name": {"$in": names}}, {"name": 1, "quadrant": 1, "ring": 1})
+        return {doc["name"]: doc async for doc in cursor}
+
+    async def existing_names(self, names: List[str]) -> Set[str]:
+        return set(await self._find_by_names(names))
+
+    async def bulk_upsert_technologies(self, rows: List[Tuple[int, Any]]) -> List[Dict[str, Any]]:
+        """Upsert a chunk of technologies by name"""
+        names = [row["name"] for _, row in rows if isinstance(row, dict) and isinstance(row.get("name"), str)]
+        before = await self._find_by_names(names)
+        outcomes = await self._bulk_upsert(rows, TechnologyCreate, ["name"])
+        written = [outcome["name"] for outcome in outcomes if outcome["status"] != "error"]
+        if written:
+            after = await self._find_by_names(written)
+            await self.history.record_changes([(before.get(name), after.get(name)) for name in written])
+        return outcomes
 
-    # Optionally, add update and delete methods here 
\ No newline at end of file
+    def export_cursor(self) -> Any:
+        return self.collection.find().sort("name", 1)
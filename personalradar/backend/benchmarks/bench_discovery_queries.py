@@ -0,0 +1,103 @@
+"""Benchmark the discoveries list query against a seeded local MongoDB.
+
+Usage (from the backend directory):
+    PYTHONPATH=. python benchmarks/bench_discovery_queries.py --docs 1000000
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+from motor.motor_asyncio import AsyncIOMotorClient
+from app.core.indexes import ensure_indexes
+from app.core.query_audit import AuditedQuery, explain_query
+from app.models import technology_discovery
+from app.services.technology_discovery_service import TechnologyDiscoveryService
+
+STATUSES = ["discovered", "assessed", "ignored"]
+CATEGORIES = ["AI/ML", "Programming Language", "Framework", "Tool", "Platform", "Database"]
+SOURCES = [f"source-{i}" for i in range(500)]
+
+# Representative filter combinations sent by the discoveries page
+CASES: Dict[str, Dict[str, Any]] = {
+    "unfiltered": {},
+    "source": {"news_source_id": "source-7"},
+    "status": {"status": "discovered"},
+    "category": {"category": "Tool"},
+    "min_confidence": {"min_confidence": 0.9},
+    "source+status": {"news_source_id": "source-7", "status": "discovered"},
+    "status+category+confidence": {"status": "discovered", "category": "Tool", "min_confidence": 0.8},
+    "source+category": {"news_source_id": "source-7", "category": "Tool"},
+}
+
+def _seed_batch(start: int, size: int, now: datetime) -> List[Dict[str, Any]]:
+    docs = []
+    for i in range(start, start + size):
+        discovered_at = now - timedelta(minutes=i)
+        docs.append({
+            "name": f"Tech {i}",
+            "description": "Seeded for benchmarking",
+            "source_url": "https://example.com",
+            "news_source_id": random.choice(SOURCES),
+            "discovered_at": discovered_at,
+            "article_title": f"Article {i}",
+            "article_url": f"https://example.com/article/{i}",
+            "confidence_score": round(random.random(), 3),
+            "category": random.choice(CATEGORIES),
+            "status": random.choices(STATUSES, weights=[70, 20, 10])[0],
+            "created_at": discovered_at,
+            "updated_at": discovered_at,
+        })
+    return docs
+
+async def seed(db: Any, docs: int, batch_size: int = 10000) -> None:
+    collection = db[technology_discovery.COLLECTION]
+    await collection.drop()
+    now = datetime.utcnow()
+    for start in range(0, docs, batch_size):
+        await collection.insert_many(_seed_batch(start, min(batch_size, docs - start), now), ordered=False)
+    await ensure_indexes(db)
+
+async def run(args: argparse.Namespace) -> None:
+    client = AsyncIOMotorClient(args.mongodb_url)
+    db = client[args.db]
+    try:
+        count = await db[technology_discovery.COLLECTION].estimated_document_count()
+        if args.reseed or count != args.docs:
+            print(f"Seeding {args.docs} discoveries...")
+            started = time.perf_counter()
+            await seed(db, args.docs)
+            print(f"Seeded in {time.perf_counter() - started:.1f}s")
+
+        service = TechnologyDiscoveryService(db)
+        print(f"{'case':30} {'p50 ms':>9} {'p95 ms':>9} {'rows':>6}  plan")
+        for name, filters in CASES.items():
+            timings = []
+            rows = 0
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                rows = len(await service.query_discoveries(**filters, skip=args.skip, limit=args.limit))
+                timings.append((time.perf_counter() - started) * 1000)
+            plan = await explain_query(db, AuditedQuery(
+                name,
+                technology_discovery.COLLECTION,
+                service.build_list_query(**filters),
+                {"discovered_at": -1},
+            ))
+            p95 = statistics.quantiles(timings, n=20)[-1] if len(timings) > 1 else timings[0]
+            print(f"{name:30} {statistics.median(timings):9.2f} {p95:9.2f} {rows:6}  {','.join(plan['stages'])}")
+    finally:
+        client.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mongodb-url", default="mongodb://localhost:27017")
+    parser.add_argument("--db", default="bench_radar_db")
+    parser.add_argument("--docs", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--skip", type=int, default=0)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--reseed", action="store_true")
+    asyncio.run(run(parser.parse_args()))
@@ -0,0 +1,82 @@
+"""Benchmark radar history reads against a seeded local MongoDB.
+
+For each radar size and number of logged changes this seeds the technologies,
+takes a baseline snapshot, logs moves through RadarHistoryService and times
+radar_at and movements. Movement cost should follow the changes in the window,
+not the radar size; radar_at is one snapshot read plus at most
+RADAR_SNAPSHOT_EVERY replayed changes.
+
+Usage (from the backend directory):
+    PYTHONPATH=. python benchmarks/bench_radar_history.py --radar 1000 10000 --changes 100 1000
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, List
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorClient
+from app.core.indexes import ensure_indexes
+from app.models import radar_history, technology
+from app.services.radar_history_service import RadarHistoryService
+
+QUADRANTS = ["Techniques", "Tools", "Platforms", "Languages & Frameworks"]
+RINGS = ["Adopt", "Trial", "Assess", "Hold"]
+
+async def timed(fn: Callable[[], Awaitable[Any]], repeat: int) -> List[float]:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+async def seed(db: Any, radar_size: int, changes: int, start: datetime) -> RadarHistoryService:
+    for name in (technology.COLLECTION, radar_history.CHANGES_COLLECTION, radar_history.SNAPSHOTS_COLLECTION):
+        await db[name].delete_many({})
+    techs = [
+        {"_id": ObjectId(), "name": f"Tech {i}", "quadrant": random.choice(QUADRANTS), "ring": random.choice(RINGS)}
+        for i in range(radar_size)
+    ]
+    await db[technology.COLLECTION].insert_many(techs)
+    history = RadarHistoryService(db)
+    await history.take_snapshot()
+    # Logged after the baseline, one second apart
+    for i in range(changes):
+        index = random.randrange(radar_size)
+        before = techs[index]
+        after = {**before, "ring": random.choice([ring for ring in RINGS if ring != before["ring"]])}
+        await history.record_changes([(before, after)], at=start + timedelta(seconds=i + 1))
+        techs[index] = after
+    return history
+
+async def run(args: argparse.Namespace) -> None:
+    client = AsyncIOMotorClient(args.mongodb_url)
+    db = client[args.db]
+    try:
+        await ensure_indexes(db)
+        print(f"{'radar':>7} {'changes':>8} {'radar_at p50':>13} {'movements p50':>14} {'moved':>6}")
+        for radar_size in args.radar:
+            for changes in args.changes:
+                start = datetime.utcnow() + timedelta(days=1)
+                history = await seed(db, radar_size, changes, start)
+                middle = start + timedelta(seconds=changes // 2)
+                end = start + timedelta(seconds=changes)
+                radar_at = await timed(lambda: history.radar_at(middle), args.repeat)
+                movements = await timed(lambda: history.movements(middle, end), args.repeat)
+                moved = len(await history.movements(middle, end))
+                print(f"{radar_size:7} {changes:8} {statistics.median(radar_at):13.2f} "
+                      f"{statistics.median(movements):14.2f} {moved:6}")
+    finally:
+        client.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mongodb-url", default="mongodb://localhost:27017")
+    parser.add_argument("--db", default="bench_radar_db")
+    parser.add_argument("--radar", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument("--changes", type=int, nargs="+", default=[100, 1_000])
+    parser.add_argument("--repeat", type=int, default=20)
+    asyncio.run(run(parser.parse_args()))
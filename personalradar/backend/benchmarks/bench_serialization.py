@@ -0,0 +1,83 @@
+"""Compare list-response serialization before and after the bulk conversion path.
+
+"before" builds each model in a Python loop, then lets FastAPI re-validate the
+list against response_model and render it with json.dumps. "after" validates the
+batch with one TypeAdapter call and dumps it straight to JSON bytes.
+
+Usage (from the backend directory):
+    PYTHONPATH=. python benchmarks/bench_serialization.py --rows 10000 100000
+"""
+import argparse
+import asyncio
+import copy
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List
+from bson import ObjectId
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from app.core.responses import model_list_response
+from app.models.technology import Technology
+from app.services.technology_service import TechnologyService
+
+class _Collection:
+    pass
+
+class _Database(dict):
+    def __missing__(self, name: str) -> _Collection:
+        return _Collection()
+
+def make_docs(rows: int) -> List[Dict[str, Any]]:
+    now = datetime.utcnow()
+    return [
+        {
+            "_id": ObjectId(),
+            "name": f"Technology {i}",
+            "quadrant": "Tools",
+            "ring": "Trial",
+            "description": "A seeded technology used to measure serialization cost",
+            "source": "Thoughtworks Radar",
+            "date_of_assessment": now - timedelta(days=i % 365),
+            "uri": f"https://example.com/tech/{i}",
+            "created_at": now,
+            "updated_at": now,
+        }
+        for i in range(rows)
+    ]
+
+async def before(docs: List[Dict[str, Any]]) -> bytes:
+    techs = []
+    for doc in docs:
+        doc["_id"] = str(doc["_id"])
+        techs.append(Technology(**doc))
+    field = create_response_field(name="Response_list_technologies", type_=List[Technology])
+    content = await serialize_response(field=field, response_content=techs, is_coroutine=True)
+    return JSONResponse(content).body
+
+async def after(docs: List[Dict[str, Any]]) -> bytes:
+    service = TechnologyService(_Database())
+    return model_list_response(service._to_models(docs), Technology).body
+
+async def measure(fn: Callable, docs: List[Dict[str, Any]], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        batch = copy.deepcopy(docs)
+        started = time.perf_counter()
+        await fn(batch)
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+async def run(args: argparse.Namespace) -> None:
+    print(f"{'rows':>8} {'before ms':>10} {'after ms':>10} {'speedup':>8}")
+    for rows in args.rows:
+        docs = make_docs(rows)
+        before_ms = await measure(before, docs, args.repeat)
+        after_ms = await measure(after, docs, args.repeat)
+        print(f"{rows:8} {before_ms:10.1f} {after_ms:10.1f} {before_ms / after_ms:7.1f}x")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    asyncio.run(run(parser.parse_args()))
@@ -0,0 +1,62 @@
+"""Measure the import time and resident memory of app.main in fresh interpreters.
+
+Each run imports app.main in a new process and reports wall time and max RSS.
+"--eager" also imports the crawler stack that app.main used to pull in through
+the routers (openai, bs4, curl_cffi, google.auth), to compare against the lazy
+startup. Modules that are not installed are skipped.
+
+Usage (from the backend directory):
+    PYTHONPATH=. python benchmarks/bench_startup.py --runs 5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+CRAWLER_MODULES = ["openai", "bs4", "curl_cffi.requests", "google.auth.transport.requests", "google.oauth2.id_token"]
+
+PROBE = """
+import importlib, json, resource, sys, time
+started = time.perf_counter()
+import app.main
+for name in {eager}:
+    try:
+        importlib.import_module(name)
+    except ImportError:
+        pass
+elapsed = time.perf_counter() - started
+print(json.dumps({{
+    "ms": elapsed * 1000,
+    "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "loaded": sorted(name for name in {crawler} if name in sys.modules),
+}}))
+"""
+
+def probe(eager: bool) -> dict:
+    code = PROBE.format(eager=CRAWLER_MODULES if eager else [], crawler=CRAWLER_MODULES)
+    env = {
+        "GOOGLE_CLIENT_ID": "bench",
+        "GOOGLE_CLIENT_SECRET": "bench",
+        "OPENAI_API_KEY": "bench",
+        **os.environ,
+        "PYTHONPATH": os.getcwd(),
+    }
+    output = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+def main(args: argparse.Namespace) -> None:
+    modes = [("lazy", False), ("eager", True)] if args.eager else [("lazy", False)]
+    print(f"{'mode':6} {'import ms p50':>14} {'max RSS MB':>11}  crawler modules loaded")
+    for label, eager in modes:
+        runs = [probe(eager) for _ in range(args.runs)]
+        loaded = runs[-1]["loaded"]
+        print(f"{label:6} {statistics.median(r['ms'] for r in runs):14.1f} "
+              f"{statistics.median(r['rss_mb'] for r in runs):11.1f}  {', '.join(loaded) or '-'}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--eager", action="store_true", help="also measure with the crawler stack imported")
+    main(parser.parse_args())
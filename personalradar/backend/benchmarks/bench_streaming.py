@@ -0,0 +1,85 @@
+"""Compare peak memory and time to first byte of buffered and streamed list responses.
+
+"buffered" reads the whole cursor, validates it and serializes one JSON body.
+"streamed" validates and serializes one cursor batch at a time. The cursor
+generates documents on demand, like a Mongo cursor fetching batches, so memory
+held by the source itself does not count towards either side.
+
+Usage (from the backend directory):
+    PYTHONPATH=. python benchmarks/bench_streaming.py --rows 10000 100000
+"""
+import argparse
+import asyncio
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Dict, List, Tuple
+from bson import ObjectId
+from app.core.responses import model_list_response, model_stream_response
+from app.models.technology_discovery import TechnologyDiscovery
+from app.services.technology_discovery_service import TechnologyDiscoveryService
+
+class _Cursor:
+    def __init__(self, rows: int) -> None:
+        self.rows = rows
+        self.now = datetime.utcnow()
+
+    def batch_size(self, size: int) -> "_Cursor":
+        return self
+
+    async def __aiter__(self) -> AsyncIterator[Dict[str, Any]]:
+        for i in range(self.rows):
+            yield {
+                "_id": ObjectId(),
+                "name": f"Discovery {i}",
+                "description": "A seeded discovery used to measure response streaming",
+                "source_url": "https://example.com",
+                "news_source_id": "source",
+                "discovered_at": self.now - timedelta(minutes=i),
+                "article_title": f"Article {i}",
+                "article_url": f"https://example.com/article/{i}",
+                "confidence_score": 0.75,
+                "category": "Tool",
+                "status": "discovered",
+                "created_at": self.now,
+                "updated_at": self.now,
+            }
+
+    async def to_list(self, length: Any = None) -> List[Dict[str, Any]]:
+        return [doc async for doc in self]
+
+async def buffered(service: TechnologyDiscoveryService, rows: int) -> Tuple[float, int]:
+    started = time.perf_counter()
+    body = model_list_response(await service._find_models(_Cursor(rows)), TechnologyDiscovery).body
+    return time.perf_counter() - started, len(body)
+
+async def streamed(service: TechnologyDiscoveryService, rows: int) -> Tuple[float, int]:
+    started = time.perf_counter()
+    first_byte = None
+    size = 0
+    async for chunk in model_stream_response(service._iter_models(_Cursor(rows)), TechnologyDiscovery).body_iterator:
+        if first_byte is None and len(chunk) > 1:
+            first_byte = time.perf_counter() - started
+        size += len(chunk)
+    return first_byte or 0.0, size
+
+async def measure(fn: Any, service: TechnologyDiscoveryService, rows: int) -> Tuple[float, float]:
+    tracemalloc.start()
+    first_byte, _ = await fn(service, rows)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return first_byte * 1000, peak / 1024 / 1024
+
+async def run(args: argparse.Namespace) -> None:
+    # Only the conversion helpers are used, so no database is needed
+    service = TechnologyDiscoveryService.__new__(TechnologyDiscoveryService)
+    print(f"{'rows':>8} {'buffered ttfb ms':>17} {'peak MB':>8} {'streamed ttfb ms':>17} {'peak MB':>8}")
+    for rows in args.rows:
+        buffered_ms, buffered_mb = await measure(buffered, service, rows)
+        streamed_ms, streamed_mb = await measure(streamed, service, rows)
+        print(f"{rows:8} {buffered_ms:17.1f} {buffered_mb:8.1f} {streamed_ms:17.1f} {streamed_mb:8.1f}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    asyncio.run(run(parser.parse_args()))
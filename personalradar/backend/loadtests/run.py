@@ -0,0 +1,228 @@
+"""Drive the real ASGI app with concurrent clients against a seeded local MongoDB.
+
+Every scenario is requested --requests times by --concurrency workers sharing
+one queue. Per endpoint the run reports throughput and p50/p95/p99 latency and
+writes them to --out as JSON. With --baseline, any endpoint whose p95 is more
+than --tolerance slower than the stored run, or whose error count grew, is
+reported and the exit code is 1.
+
+Usage (from the backend directory):
+    PYTHONPATH=. python loadtests/run.py --seed-if-needed --out loadtests/results.json
+    PYTHONPATH=. python loadtests/run.py --baseline loadtests/baseline.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+from httpx import ASGITransport, AsyncClient
+from motor.motor_asyncio import AsyncIOMotorClient
+from seed import LOADTEST_USER, add_volume_arguments, check_target, is_seeded, seed
+
+class Scenario(NamedTuple):
+    name: str
+    method: str
+    path: Callable[["Fixtures"], str]
+    body: Optional[Callable[["Fixtures"], Any]] = None
+    params: Optional[Callable[["Fixtures"], Dict[str, Any]]] = None
+    authenticated: bool = False
+
+class Fixtures:
+    """IDs sampled from the seeded data so detail and write scenarios hit real documents"""
+
+    def __init__(self, technology_ids: List[str], discovery_ids: List[str], source_ids: List[str], token: str) -> None:
+        self.technology_ids = technology_ids
+        self.discovery_ids = discovery_ids
+        self.source_ids = source_ids
+        self.token = token
+
+    def technology(self) -> str:
+        return random.choice(self.technology_ids)
+
+    def discovery(self) -> str:
+        return random.choice(self.discovery_ids)
+
+    def source(self) -> str:
+        return random.choice(self.source_ids)
+
+API = "/api/v1"
+
+SCENARIOS = [
+    Scenario("health", "GET", lambda f: "/health"),
+    Scenario("auth.me", "GET", lambda f: f"{API}/auth/me", authenticated=True),
+    Scenario("technologies.list", "GET", lambda f: f"{API}/technologies/"),
+    Scenario("technologies.update", "PATCH", lambda f: f"{API}/technologies/{f.technology()}",
+             body=lambda f: {"ring": random.choice(["Adopt", "Trial", "Assess", "Hold"])}),
+    Scenario("technologies.history", "GET", lambda f: f"{API}/technologies/{f.technology()}/history"),
+    Scenario("technologies.radar_at", "GET", lambda f: f"{API}/technologies/history/radar",
+             params=lambda f: {"at": (datetime.utcnow() - timedelta(minutes=5)).isoformat()}),
+    Scenario("technologies.movements", "GET", lambda f: f"{API}/technologies/history/movements",
+             params=lambda f: {"since": (datetime.utcnow() - timedelta(days=1)).isoformat()}),
+    Scenario("news_sources.list", "GET", lambda f: f"{API}/news-sources/"),
+    Scenario("news_sources.get", "GET", lambda f: f"{API}/news-sources/{f.source()}"),
+    Scenario("news_sources.due", "GET", lambda f: f"{API}/news-sources/due/checking"),
+    Scenario("discoveries.list", "GET", lambda f: f"{API}/technology-discoveries/", params=lambda f: {"limit": 50}),
+    Scenario("discoveries.list_filtered", "GET", lambda f: f"{API}/technology-discoveries/",
+             params=lambda f: {"news_source_id": f.source(), "status": "discovered", "min_confidence": 0.5, "limit": 50}),
+    Scenario("discoveries.list_page", "GET", lambda f: f"{API}/technology-discoveries/",
+             params=lambda f: {"category": "Tool", "skip": 500, "limit": 50}),
+    Scenario("discoveries.get", "GET", lambda f: f"{API}/technology-discoveries/{f.discovery()}"),
+    Scenario("discoveries.update_status", "PATCH", lambda f: f"{API}/technology-discoveries/{f.discovery()}/status",
+             params=lambda f: {"status": random.choice(["discovered", "assessed", "ignored"])}),
+    Scenario("discoveries.bulk_status", "POST", lambda f: f"{API}/technology-discoveries/bulk-status",
+             body=lambda f: {"ids": random.sample(f.discovery_ids, 50), "status": random.choice(["discovered", "assessed", "ignored"])}),
+    Scenario("discoveries.new_since", "GET", lambda f: f"{API}/technology-discoveries/new-since/{f.source()}"),
+    Scenario("discoveries.trending", "GET", lambda f: f"{API}/technology-discoveries/trending",
+             params=lambda f: {"window": random.choice(["7d", "30d"])}),
+    Scenario("discoveries.stats", "GET", lambda f: f"{API}/technology-discoveries/stats/summary"),
+]
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+async def load_fixtures(db: Any) -> Fixtures:
+    from app.core.auth import AuthService
+    from app.models import news_source, technology, technology_discovery, user
+
+    async def sample_ids(collection: str, size: int = 1000) -> List[str]:
+        cursor = db[collection].aggregate([{"$sample": {"size": size}}, {"$project": {"_id": 1}}])
+        return [str(doc["_id"]) async for doc in cursor]
+
+    loadtest_user = await db[user.COLLECTION].find_one({"google_id": LOADTEST_USER["google_id"]})
+    token = AuthService(db).create_access_token({"sub": str(loadtest_user["_id"])}, timedelta(hours=1))
+    return Fixtures(
+        await sample_ids(technology.COLLECTION),
+        await sample_ids(technology_discovery.COLLECTION),
+        await sample_ids(news_source.COLLECTION),
+        token,
+    )
+
+async def drive(client: AsyncClient, fixtures: Fixtures, scenarios: List[Scenario], requests: int, concurrency: int) -> Dict[str, Any]:
+    queue: asyncio.Queue = asyncio.Queue()
+    work = [scenario for scenario in scenarios for _ in range(requests)]
+    random.shuffle(work)
+    for scenario in work:
+        queue.put_nowait(scenario)
+    latencies: Dict[str, List[float]] = {scenario.name: [] for scenario in scenarios}
+    errors: Dict[str, int] = {scenario.name: 0 for scenario in scenarios}
+
+    async def worker() -> None:
+        while not queue.empty():
+            scenario = queue.get_nowait()
+            headers = {"Authorization": f"Bearer {fixtures.token}"} if scenario.authenticated else {}
+            started = time.perf_counter()
+            try:
+                response = await client.request(
+                    scenario.method,
+                    scenario.path(fixtures),
+                    params=scenario.params(fixtures) if scenario.params else None,
+                    json=scenario.body(fixtures) if scenario.body else None,
+                    headers=headers,
+                )
+                failed = response.status_code >= 400
+            except Exception:
+                failed = True
+            latencies[scenario.name].append((time.perf_counter() - started) * 1000)
+            errors[scenario.name] += failed
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    endpoints = {}
+    for name, values in latencies.items():
+        values.sort()
+        endpoints[name] = {
+            "requests": len(values),
+            "errors": errors[name],
+            "mean_ms": statistics.fmean(values) if values else 0.0,
+            "p50_ms": percentile(values, 50),
+            "p95_ms": percentile(values, 95),
+            "p99_ms": percentile(values, 99),
+        }
+    return {"elapsed_seconds": elapsed, "throughput_rps": len(work) / elapsed, "endpoints": endpoints}
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    regressions = []
+    for name, base in baseline["endpoints"].items():
+        current = results["endpoints"].get(name)
+        if current is None:
+            continue
+        if current["p95_ms"] > base["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {base['p95_ms']:.1f} -> {current['p95_ms']:.1f} ms")
+        if current["errors"] > base["errors"]:
+            regressions.append(f"{name}: errors {base['errors']} -> {current['errors']}")
+    return regressions
+
+def print_report(results: Dict[str, Any]) -> None:
+    print(f"{'endpoint':30} {'reqs':>6} {'errs':>5} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for name, stats in results["endpoints"].items():
+        print(f"{name:30} {stats['requests']:6} {stats['errors']:5} {stats['p50_ms']:8.1f} {stats['p95_ms']:8.1f} {stats['p99_ms']:8.1f}")
+    print(f"\n{results['throughput_rps']:.1f} req/s over {results['elapsed_seconds']:.1f}s")
+
+async def run(args: argparse.Namespace) -> int:
+    # The app reads its connection settings from the environment when the lifespan starts
+    os.environ["MONGODB_URL"] = args.mongodb_url
+    os.environ["MONGODB_DB"] = args.db
+    seed_client = AsyncIOMotorClient(args.mongodb_url)
+    db = seed_client[args.db]
+    try:
+        if args.reseed or (args.seed_if_needed and not await is_seeded(db, args.technologies, args.discoveries, args.sources)):
+            check_target(args.db, args.force)
+            print(f"Seeding {args.db}...")
+            await seed(db, args.technologies, args.discoveries, args.sources)
+
+        from app.core.container import lifespan
+        from app.main import app
+        fixtures = await load_fixtures(db)
+        scenarios = [s for s in SCENARIOS if not args.only or any(s.name.startswith(prefix) for prefix in args.only)]
+        async with lifespan(app):
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://loadtest") as client:
+                # Warm caches and connection pools before measuring
+                await drive(client, fixtures, scenarios, 2, args.concurrency)
+                results = await drive(client, fixtures, scenarios, args.requests, args.concurrency)
+    finally:
+        seed_client.close()
+
+    results["meta"] = {
+        "at": datetime.utcnow().isoformat(),
+        "python": platform.python_version(),
+        "concurrency": args.concurrency,
+        "requests_per_endpoint": args.requests,
+        "volumes": {"technologies": args.technologies, "discoveries": args.discoveries, "sources": args.sources},
+    }
+    print_report(results)
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.out}")
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            print("\nRegressions against baseline:\n  " + "\n  ".join(regressions))
+            return 1
+        print("\nNo regressions against baseline")
+    return 0
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_volume_arguments(parser)
+    parser.add_argument("--seed-if-needed", action="store_true", help="seed when the collection sizes differ")
+    parser.add_argument("--reseed", action="store_true")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=200, help="requests per endpoint")
+    parser.add_argument("--only", nargs="*", help="scenario name prefixes to run, e.g. discoveries technologies.list")
+    parser.add_argument("--out", default="loadtests/results.json")
+    parser.add_argument("--baseline", help="results file to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed p95 slowdown, 0.2 = 20%%")
+    sys.exit(asyncio.run(run(parser.parse_args())))
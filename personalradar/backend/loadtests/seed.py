@@ -0,0 +1,137 @@
+"""Seed a local MongoDB with a configurable volume of radar data for load tests.
+
+Usage (from the backend directory):
+    PYTHONPATH=. python loadtests/seed.py --technologies 5000 --discoveries 1000000 --sources 500
+"""
+import argparse
+import asyncio
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorClient
+from app.core.indexes import ensure_indexes
+from app.models import news_source, technology, technology_discovery, user
+from app.services.discovery_rollup_service import DiscoveryRollupService
+from app.services.news_source_service import next_check_at
+from app.services.radar_history_service import RadarHistoryService
+from app.services.technology_discovery_service import TechnologyDiscoveryService
+
+QUADRANTS = ["Techniques", "Tools", "Platforms", "Languages & Frameworks"]
+RINGS = ["Adopt", "Trial", "Assess", "Hold"]
+STATUSES = ["discovered", "assessed", "ignored"]
+CATEGORIES = ["AI/ML", "Programming Language", "Framework", "Tool", "Platform", "Database"]
+BATCH_SIZE = 10_000
+
+LOADTEST_USER = {"email": "loadtest@example.com", "full_name": "Load Test", "google_id": "loadtest"}
+
+def _technologies(count: int, now: datetime) -> List[Dict[str, Any]]:
+    return [
+        {
+            "name": f"Technology {i}",
+            "quadrant": random.choice(QUADRANTS),
+            "ring": random.choice(RINGS),
+            "description": "Seeded for load testing",
+            "source": "Load test",
+            "date_of_assessment": now - timedelta(days=i % 365),
+            "uri": f"https://example.com/tech/{i}",
+            "created_at": now,
+            "updated_at": now,
+        }
+        for i in range(count)
+    ]
+
+def _sources(count: int, now: datetime) -> List[Dict[str, Any]]:
+    docs = []
+    for i in range(count):
+        cadence = random.choice([1, 3, 7, 14, 30])
+        last_checked = now - timedelta(days=random.randint(0, 30))
+        docs.append({
+            "_id": ObjectId(),
+            "name": f"Source {i}",
+            "url": f"https://news.example.com/{i}",
+            "description": "Seeded for load testing",
+            "cadence_days": cadence,
+            "is_active": random.random() < 0.9,
+            "last_checked": last_checked,
+            "next_check_at": next_check_at(last_checked, cadence, now),
+            "created_at": now,
+            "updated_at": now,
+        })
+    return docs
+
+def _discoveries(start: int, size: int, source_ids: List[str], now: datetime) -> List[Dict[str, Any]]:
+    docs = []
+    for i in range(start, start + size):
+        discovered_at = now - timedelta(minutes=i)
+        docs.append({
+            "name": f"Discovery {i % 5000}",  # repeated names give trending realistic buckets
+            "description": "Seeded for load testing",
+            "source_url": "https://example.com",
+            "news_source_id": random.choice(source_ids),
+            "discovered_at": discovered_at,
+            "article_title": f"Article {i}",
+            "article_url": f"https://example.com/article/{i}",
+            "confidence_score": round(random.random(), 3),
+            "category": random.choice(CATEGORIES),
+            "status": random.choices(STATUSES, weights=[70, 20, 10])[0],
+            "created_at": discovered_at,
+            "updated_at": discovered_at,
+        })
+    return docs
+
+async def is_seeded(db: Any, technologies: int, discoveries: int, sources: int) -> bool:
+    return (
+        await db[technology.COLLECTION].estimated_document_count() == technologies
+        and await db[technology_discovery.COLLECTION].estimated_document_count() == discoveries
+        and await db[news_source.COLLECTION].estimated_document_count() == sources
+    )
+
+async def seed(db: Any, technologies: int, discoveries: int, sources: int) -> None:
+    """Replace the radar collections with freshly generated data and rebuild derived state"""
+    for name in await db.list_collection_names():
+        await db[name].drop()
+    now = datetime.utcnow()
+    await ensure_indexes(db)
+
+    await db[technology.COLLECTION].insert_many(_technologies(technologies, now), ordered=False)
+    source_docs = _sources(sources, now)
+    await db[news_source.COLLECTION].insert_many(source_docs, ordered=False)
+    source_ids = [str(doc["_id"]) for doc in source_docs]
+    for start in range(0, discoveries, BATCH_SIZE):
+        batch = _discoveries(start, min(BATCH_SIZE, discoveries - start), source_ids, now)
+        await db[technology_discovery.COLLECTION].insert_many(batch, ordered=False)
+    await db[user.COLLECTION].insert_one({**LOADTEST_USER, "is_active": True, "created_at": now, "updated_at": now})
+
+    await TechnologyDiscoveryService(db).rebuild_stats()
+    await DiscoveryRollupService(db).rebuild()
+    await RadarHistoryService(db).take_snapshot()
+
+def check_target(db_name: str, force: bool) -> None:
+    # Seeding drops every collection, so refuse databases that do not look disposable
+    if "test" not in db_name and not force:
+        raise SystemExit(f"Refusing to seed '{db_name}': use a database name containing 'test' or pass --force")
+
+async def main(args: argparse.Namespace) -> None:
+    check_target(args.db, args.force)
+    client = AsyncIOMotorClient(args.mongodb_url)
+    try:
+        started = time.perf_counter()
+        await seed(client[args.db], args.technologies, args.discoveries, args.sources)
+        print(f"Seeded {args.db} in {time.perf_counter() - started:.1f}s")
+    finally:
+        client.close()
+
+def add_volume_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--mongodb-url", default="mongodb://localhost:27017")
+    parser.add_argument("--db", default="loadtest_radar_db")
+    parser.add_argument("--technologies", type=int, default=5_000)
+    parser.add_argument("--discoveries", type=int, default=1_000_000)
+    parser.add_argument("--sources", type=int, default=500)
+    parser.add_argument("--force", action="store_true", help="seed even if the database name lacks 'test'")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_volume_arguments(parser)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,76 @@
+import pytest
+import pytest_asyncio
+from datetime import datetime
+from motor.motor_asyncio import AsyncIOMotorClient
+from app.models.news_source import NewsSource
+from app.services.article_fingerprint_service import ArticleFingerprintService, lsh_bands, simhash
+from app.services.tech_discovery_agent import TechDiscoveryAgent
+import os
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# Test database configuration
+TEST_MONGODB_URL = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
+TEST_DB_NAME = "test_radar_db"
+
+ARTICLE = " ".join(
+    f"Bun {i} is a fast JavaScript runtime bundler and package manager that ships as one binary"
+    for i in range(12)
+)
+SYNDICATED = "Republished from our partner site. " + ARTICLE.replace("fast", "quick", 1) + " Read more on our newsletter."
+UNRELATED = " ".join(f"Qdrant {i} stores vectors for similarity search over embeddings in Rust" for i in range(12))
+
+@pytest_asyncio.fixture(scope="function")
+async def test_db():
+    client = AsyncIOMotorClient(TEST_MONGODB_URL)
+    db = client[TEST_DB_NAME]
+    await db.article_fingerprints.delete_many({})
+    yield db
+    await db.article_fingerprints.delete_many({})
+    client.close()
+
+def test_simhash_separates_near_duplicates_from_other_articles():
+    original, syndicated, unrelated = simhash(ARTICLE), simhash(SYNDICATED), simhash(UNRELATED)
+    assert bin(original ^ syndicated).count("1") <= 3
+    assert bin(original ^ unrelated).count("1") > 10
+    assert simhash("too short to fingerprint") is None
+    # Hashes within the distance always share a band
+    for flipped in ([0, 1, 2], [5, 30, 63], [15, 16, 47]):
+        other = original
+        for bit in flipped:
+            other ^= 1 << bit
+        assert set(lsh_bands(original, 3)) & set(lsh_bands(other, 3))
+
+@pytest.mark.asyncio
+async def test_agent_reuses_extraction_for_near_duplicate_articles(test_db, monkeypatch):
+    agent = TechDiscoveryAgent.__new__(TechDiscoveryAgent)
+    agent.fingerprints = ArticleFingerprintService(test_db)
+    contents = {"https://a.example.com/article/bun": ARTICLE, "https://b.example.com/story/bun": SYNDICATED}
+    calls = []
+
+    async def get_content(url):
+        return contents[url]
+
+    async def extract(title, content, url):
+        calls.append(url)
+        return [{"name": "Bun", "description": "JavaScript runtime", "category": "Tool", "confidence": 0.9}]
+
+    monkeypatch.setattr(agent, "_get_article_content", get_content)
+    monkeypatch.setattr(agent, "_ai_extract_technologies", extract)
+    now = datetime.utcnow()
+    run_stats = {"duplicate_articles_skipped": 0}
+    discoveries = []
+    for source_id, url in (("source-a", "https://a.example.com/article/bun"), ("source-b", "https://b.example.com/story/bun")):
+        source = NewsSource(
+            _id=source_id, name=source_id, url=url, cadence_days=1, is_active=True, created_at=now, updated_at=now
+        )
+        discoveries += await agent._extract_technologies_from_article({"url": url, "title": "Bun"}, source, run_stats)
+
+    assert calls == ["https://a.example.com/article/bun"]
+    assert run_stats["duplicate_articles_skipped"] == 1
+    assert [(d.name, d.news_source_id, d.article_url) for d in discoveries] == [
+        ("Bun", "source-a", "https://a.example.com/article/bun"),
+        ("Bun", "source-b", "https://b.example.com/story/bun"),
+    ]
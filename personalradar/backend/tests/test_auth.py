@@ -0,0 +1,66 @@
+import pytest
+import pytest_asyncio
+from datetime import timedelta
+from fastapi import HTTPException
+from motor.motor_asyncio import AsyncIOMotorClient
+from app.core import auth as auth_module
+from app.core.auth import AuthService, auth_metrics, user_cache
+from app.models.user import UserCreate
+import os
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# Test database configuration
+TEST_MONGODB_URL = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
+TEST_DB_NAME = "test_radar_db"
+
+@pytest_asyncio.fixture(scope="function")
+async def test_db():
+    client = AsyncIOMotorClient(TEST_MONGODB_URL)
+    db = client[TEST_DB_NAME]
+    await db.users.delete_many({})
+    await user_cache.delete_prefix("")
+    yield db
+    await db.users.delete_many({})
+    client.close()
+
+async def create_user_and_token(service: AuthService):
+    user = await service.create_user(UserCreate(
+        email="ada@example.com", full_name="Ada Lovelace", google_id="google-ada"
+    ))
+    token = service.create_access_token({"sub": user.id}, timedelta(minutes=5))
+    return user, token
+
+@pytest.mark.asyncio
+async def test_verify_token_caches_user_until_changed(test_db):
+    service = AuthService(test_db)
+    user, token = await create_user_and_token(service)
+    lookups = auth_metrics.db_lookups
+
+    assert (await service.verify_token(token)).id == user.id
+    assert (await service.verify_token(token)).id == user.id
+    assert auth_metrics.db_lookups == lookups + 1
+
+    await service.update_user(user.id, {"full_name": "Augusta Ada King"})
+    assert (await service.verify_token(token)).full_name == "Augusta Ada King"
+    assert auth_metrics.db_lookups == lookups + 2
+
+    await service.deactivate_user(user.id)
+    with pytest.raises(HTTPException) as exc:
+        await service.verify_token(token)
+    assert exc.value.status_code == 401
+
+@pytest.mark.asyncio
+async def test_verify_token_trusts_fresh_claims(test_db, monkeypatch):
+    monkeypatch.setattr(auth_module.settings, "AUTH_TRUST_CLAIMS_SECONDS", 30.0)
+    service = AuthService(test_db)
+    user, _ = await create_user_and_token(service)
+    token = service.create_access_token(
+        {"sub": user.id, "usr": service.user_claims(user)}, timedelta(minutes=5)
+    )
+    lookups = auth_metrics.db_lookups
+
+    assert (await service.verify_token(token)).email == user.email
+    assert auth_metrics.db_lookups == lookups
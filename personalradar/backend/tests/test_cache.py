@@ -0,0 +1,75 @@
+import asyncio
+import fnmatch
+import pytest
+from app.core.cache import LRUCache, ReadThroughCache, SharedCache
+
+class LocalRedis:
+    """Stand-in for redis.asyncio.Redis covering the calls SharedCache makes."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    async def scan_iter(self, match="*"):
+        for key in list(self.data):
+            if fnmatch.fnmatch(key, match):
+                yield key
+
+class Loader:
+    def __init__(self):
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(0)
+        return [f"value-{self.calls}"]
+
+@pytest.mark.asyncio
+async def test_lru_evicts_least_recently_used_and_expired():
+    cache = LRUCache(maxsize=2, ttl_seconds=60)
+    await cache.set("a", 1)
+    await cache.set("b", 2)
+    assert await cache.get("a") == 1
+    await cache.set("c", 3)
+    assert await cache.get("b") is None
+    assert await cache.get("a") == 1
+    await cache.set("d", 4, ttl_seconds=0)
+    assert await cache.get("d") is None
+    # b then a by size, d by TTL
+    assert cache.metrics.evictions == 3
+
+@pytest.mark.parametrize("backend_factory", [
+    lambda: LRUCache(maxsize=8, ttl_seconds=60),
+    lambda: SharedCache(LocalRedis(), ttl_seconds=60),
+])
+@pytest.mark.asyncio
+async def test_read_through_hits_until_version_changes(backend_factory):
+    cache = ReadThroughCache(backend_factory())
+    loader = Loader()
+    assert await cache.get_or_load("technologies:list", "v1", loader) == ["value-1"]
+    assert await cache.get_or_load("technologies:list", "v1", loader) == ["value-1"]
+    # Another worker bumped the collection version
+    assert await cache.get_or_load("technologies:list", "v2", loader) == ["value-2"]
+    await cache.invalidate("technologies:")
+    assert await cache.get_or_load("technologies:list", "v2", loader) == ["value-3"]
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["stale"] == 1
+    assert cache.stats()["misses"] == 2
+    assert cache.stats()["invalidations"] == 1
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_load_once():
+    cache = ReadThroughCache(LRUCache())
+    loader = Loader()
+    results = await asyncio.gather(*(cache.get_or_load("k", "v1", loader) for _ in range(10)))
+    assert loader.calls == 1
+    assert all(result == ["value-1"] for result in results)
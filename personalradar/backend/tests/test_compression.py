@@ -0,0 +1,72 @@
+import gzip
+import json
+import pytest
+import zstandard
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from httpx import AsyncClient, ASGITransport
+from app.core.compression import CompressionMiddleware, negotiate_encoding
+from app.core.responses import ORJSONResponse
+
+ITEMS = [{"name": f"Technology {i}", "ring": "Assess"} for i in range(200)]
+
+def build_app() -> FastAPI:
+    test_app = FastAPI()
+    test_app.add_middleware(CompressionMiddleware)
+
+    @test_app.get("/large")
+    async def large():
+        return ORJSONResponse(ITEMS, headers={"ETag": '"v1"'})
+
+    @test_app.get("/small")
+    async def small():
+        return ORJSONResponse({"status": "ok"})
+
+    @test_app.get("/stream")
+    async def stream():
+        async def lines():
+            for item in ITEMS:
+                yield (json.dumps(item) + "\n").encode()
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+    @test_app.get("/metrics")
+    async def metrics():
+        return PlainTextResponse("x" * 5000, headers={"Content-Encoding": "identity"})
+
+    return test_app
+
+def test_negotiate_encoding_honours_server_order_and_zero_quality():
+    assert negotiate_encoding("gzip, deflate, br, zstd", ["zstd", "gzip"]) == "zstd"
+    assert negotiate_encoding("zstd;q=0, gzip;q=0.5", ["zstd", "gzip"]) == "gzip"
+    assert negotiate_encoding("*", ["gzip"]) == "gzip"
+    assert negotiate_encoding("br", ["zstd", "gzip"]) is None
+
+@pytest.mark.asyncio
+async def test_compresses_above_threshold_and_streams_chunks():
+    async with AsyncClient(transport=ASGITransport(app=build_app()), base_url="http://test") as ac:
+        resp = await ac.get("/large", headers={"Accept-Encoding": "gzip"})
+        assert resp.headers["content-encoding"] == "gzip"
+        assert resp.headers["vary"] == "Accept-Encoding"
+        assert resp.headers["etag"] == 'W/"v1"'
+        assert resp.json() == ITEMS
+
+        resp = await ac.get("/small", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in resp.headers
+        assert resp.json() == {"status": "ok"}
+
+        resp = await ac.get("/large", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in resp.headers
+        assert int(resp.headers["content-length"]) == len(resp.content)
+
+        resp = await ac.get("/metrics", headers={"Accept-Encoding": "gzip"})
+        assert resp.headers["content-encoding"] == "identity"
+
+        async with ac.stream("GET", "/stream", headers={"Accept-Encoding": "zstd, gzip"}) as resp:
+            assert resp.headers["content-encoding"] == "zstd"
+            raw = b"".join([chunk async for chunk in resp.aiter_raw()])
+        body = zstandard.ZstdDecompressor().decompressobj().decompress(raw)
+        assert [json.loads(line) for line in body.splitlines()] == ITEMS
+
+        async with ac.stream("GET", "/stream", headers={"Accept-Encoding": "gzip"}) as resp:
+            raw = b"".join([chunk async for chunk in resp.aiter_raw()])
+        assert gzip.decompress(raw).count(b"\n") == len(ITEMS)
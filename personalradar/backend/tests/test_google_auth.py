@@ -0,0 +1,95 @@
+import asyncio
+import time
+import httpx
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwk, jwt
+from app.core.google_auth import GoogleTokenVerifier
+
+CLIENT_ID = "test-client.apps.googleusercontent.com"
+
+def make_key(kid: str):
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    )
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+    public_jwk = {**jwk.construct(public_pem, "RS256").to_dict(), "kid": kid, "alg": "RS256", "use": "sig"}
+    return private_pem, public_jwk
+
+def make_token(private_pem: bytes, kid: str, **overrides) -> str:
+    now = int(time.time())
+    claims = {
+        "iss": "https://accounts.google.com",
+        "aud": CLIENT_ID,
+        "sub": "google-ada",
+        "email": "ada@example.com",
+        "name": "Ada Lovelace",
+        "iat": now,
+        "exp": now + 600,
+        **overrides,
+    }
+    return jwt.encode(claims, private_pem, algorithm="RS256", headers={"kid": kid})
+
+class LocalKeySet:
+    """Stand-in for Google's certs endpoint"""
+
+    def __init__(self, *keys, max_age: int = 3600) -> None:
+        self.keys = list(keys)
+        self.max_age = max_age
+        self.requests = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        return httpx.Response(
+            200,
+            json={"keys": self.keys},
+            headers={"Cache-Control": f"public, max-age={self.max_age}, must-revalidate"},
+        )
+
+def make_verifier(key_set: LocalKeySet, **kwargs) -> GoogleTokenVerifier:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(key_set))
+    return GoogleTokenVerifier(CLIENT_ID, "https://certs.test/keys", client, **kwargs)
+
+@pytest.mark.asyncio
+async def test_login_burst_fetches_keys_once():
+    private_pem, public_jwk = make_key("k1")
+    key_set = LocalKeySet(public_jwk)
+    verifier = make_verifier(key_set)
+    token = make_token(private_pem, "k1")
+
+    results = await asyncio.gather(*(verifier.verify(token) for _ in range(20)))
+    assert {claims["sub"] for claims in results} == {"google-ada"}
+    assert key_set.requests == 1
+
+    with pytest.raises(ValueError):
+        await verifier.verify(make_token(private_pem, "k1", aud="someone-else"))
+    with pytest.raises(ValueError):
+        await verifier.verify(make_token(private_pem, "k1", iss="https://evil.example.com"))
+    await verifier.aclose()
+
+@pytest.mark.asyncio
+async def test_keys_refresh_in_background_and_on_rotation():
+    old_pem, old_jwk = make_key("k1")
+    new_pem, new_jwk = make_key("k2")
+    # max-age inside the refresh margin: every verification is due for a background refresh
+    key_set = LocalKeySet(old_jwk, max_age=30)
+    verifier = make_verifier(key_set, refresh_margin=60.0)
+
+    await verifier.verify(make_token(old_pem, "k1"))
+    await verifier.verify(make_token(old_pem, "k1"))
+    await asyncio.sleep(0.05)
+    assert key_set.requests == 2
+
+    # A rotated key is picked up on demand, but unknown kids cannot trigger a fetch per request
+    key_set.keys.append(new_jwk)
+    verifier._fetched_at -= 60
+    assert (await verifier.verify(make_token(new_pem, "k2")))["sub"] == "google-ada"
+    requests = key_set.requests
+    with pytest.raises(ValueError):
+        await verifier.verify(make_token(new_pem, "k3"))
+    assert key_set.requests == requests
+    await verifier.aclose()
@@ -0,0 +1,82 @@
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient, ASGITransport
+from fastapi import status
+from app.main import app
+from motor.motor_asyncio import AsyncIOMotorClient
+from app.api.v1 import technologies as technologies_module
+from app.core.metrics import HTTP_LATENCY, MONGO_COMMANDS, OUTBOUND_ERRORS, OUTBOUND_LATENCY, MongoCommandMetrics, outbound_call
+from app.core.cache import get_cache
+from app.services.technology_service import TechnologyService
+import os
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# Test database configuration
+TEST_MONGODB_URL = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
+TEST_DB_NAME = "test_radar_db"
+
+@pytest_asyncio.fixture(scope="function")
+async def test_db():
+    client = AsyncIOMotorClient(TEST_MONGODB_URL)
+    db = client[TEST_DB_NAME]
+    await db.technologies.delete_many({})
+    yield db
+    await db.technologies.delete_many({})
+    client.close()
+
+@pytest.mark.asyncio
+async def test_metrics_label_requests_by_route_template(test_db):
+    service = TechnologyService(test_db)
+    app.dependency_overrides[technologies_module.get_technology_service] = lambda: service
+    before = HTTP_LATENCY.count(method="DELETE", route="/api/v1/technologies/{tech_id}")
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        for tech_id in ("507f1f77bcf86cd799439011", "507f1f77bcf86cd799439012"):
+            resp = await ac.delete(f"/api/v1/technologies/{tech_id}")
+            assert resp.status_code == status.HTTP_404_NOT_FOUND
+        metrics = await ac.get("/metrics")
+    app.dependency_overrides.clear()
+
+    assert HTTP_LATENCY.count(method="DELETE", route="/api/v1/technologies/{tech_id}") == before + 2
+    body = metrics.text
+    assert 'http_requests_total{method="DELETE",route="/api/v1/technologies/{tech_id}",status="404"}' in body
+    assert "507f1f77bcf86cd799439011" not in body
+    assert "# TYPE http_request_duration_seconds histogram" in body
+
+def test_outbound_call_counts_errors():
+    errors = OUTBOUND_ERRORS.value(target="test")
+    with outbound_call("test") as call:
+        call.failed = True
+    with pytest.raises(RuntimeError):
+        with outbound_call("test"):
+            raise RuntimeError("connection reset")
+    with outbound_call("test"):
+        pass
+    assert OUTBOUND_ERRORS.value(target="test") == errors + 2
+    assert OUTBOUND_LATENCY.count(target="test") >= 3
+
+def test_get_more_is_labelled_with_its_collection():
+    class Event:
+        command_name = "getMore"
+        command = {"getMore": 8120934, "collection": "technologies"}
+        connection_id = ("localhost", 27017)
+        request_id = 41
+        duration_micros = 1500
+
+    before = MONGO_COMMANDS.value(command="getMore", collection="technologies", outcome="ok")
+    listener = MongoCommandMetrics()
+    listener.started(Event())
+    listener.succeeded(Event())
+    assert MONGO_COMMANDS.value(command="getMore", collection="technologies", outcome="ok") == before + 1
+
+@pytest.mark.asyncio
+async def test_cache_and_auth_counters_are_exported(test_db):
+    assert get_cache() is not None
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        body = (await ac.get("/metrics")).text
+        assert (await ac.get("/cache/metrics")).status_code == status.HTTP_404_NOT_FOUND
+    assert 'auth_user_lookups_total{source="database"}' in body
+    assert "# TYPE auth_requests_total counter" in body
+    assert 'cache_events_total{backend="LRUCache",event="hits"}' in body
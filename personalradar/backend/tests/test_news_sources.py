@@ -0,0 +1,70 @@
+import pytest
+from pydantic import ValidationError
+import pytest_asyncio
+from datetime import datetime, timedelta
+from motor.motor_asyncio import AsyncIOMotorClient
+from app.models import news_source
+from app.models.news_source import NewsSourceCreate
+from app.services.news_source_service import NewsSourceService, cadence_factor
+import os
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# Test database configuration
+TEST_MONGODB_URL = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
+TEST_DB_NAME = "test_radar_db"
+
+@pytest_asyncio.fixture(scope="function")
+async def test_db():
+    client = AsyncIOMotorClient(TEST_MONGODB_URL)
+    db = client[TEST_DB_NAME]
+    await db[news_source.COLLECTION].delete_many({})
+    yield db
+    await db[news_source.COLLECTION].delete_many({})
+    client.close()
+
+def test_cadence_factor_follows_yield_and_change_rate():
+    assert cadence_factor([{"new_discoveries": 5, "content_changed": True}] * 2)[0] == 1.0
+    assert cadence_factor([{"new_discoveries": 0, "content_changed": False}] * 5)[0] == 4.0
+    assert cadence_factor([{"new_discoveries": 0, "content_changed": True}] * 5)[0] == 2.0
+    assert cadence_factor([{"new_discoveries": 5, "content_changed": True}] * 5)[0] == 0.5
+    factor, reason = cadence_factor([{"new_discoveries": 2, "content_changed": True}] * 5)
+    assert factor == 1.0
+    assert "2.0 new discoveries per crawl" in reason
+
+@pytest.mark.asyncio
+async def test_record_crawl_stretches_idle_adaptive_sources(test_db):
+    service = NewsSourceService(test_db)
+    adaptive = await service.create_news_source(NewsSourceCreate(
+        name="Quiet blog", url="https://quiet.example.com", cadence_days=3,
+        adaptive_cadence=True, min_cadence_days=1, max_cadence_days=10
+    ))
+    fixed = await service.create_news_source(NewsSourceCreate(
+        name="Fixed blog", url="https://fixed.example.com", cadence_days=3
+    ))
+    assert adaptive.effective_cadence_days == 3
+    assert fixed.cadence_reason == "fixed cadence_days"
+
+    for _ in range(5):
+        adaptive = await service.record_crawl(adaptive.id, new_discoveries=0, articles=4, content_hash="same")
+        fixed = await service.record_crawl(fixed.id, new_discoveries=0, articles=4, content_hash="same")
+
+    # 3 days x 4 is clamped to the 10 day maximum; the fixed source keeps its cadence
+    assert adaptive.effective_cadence_days == 10
+    assert "no new discoveries" in adaptive.cadence_reason
+    assert adaptive.next_check_at - adaptive.last_checked == timedelta(days=10)
+    assert fixed.effective_cadence_days == 3
+    assert fixed.next_check_at - fixed.last_checked == timedelta(days=3)
+
+    # Turning adaptation off restores the configured cadence
+    adaptive = await service.update_news_source(adaptive.id, {"adaptive_cadence": False})
+    assert adaptive.effective_cadence_days == 3
+    assert adaptive.next_check_at - adaptive.last_checked == timedelta(days=3)
+    await test_db[news_source.COLLECTION].update_many({}, {"$set": {"next_check_at": datetime.utcnow() - timedelta(minutes=1)}})
+    assert {source.name for source in await service.get_sources_due_for_checking()} == {"Quiet blog", "Fixed blog"}
+
+def test_cadence_bounds_must_be_ordered():
+    with pytest.raises(ValidationError):
+        NewsSourceCreate(name="Blog", url="https://blog.example.com", cadence_days=3, min_cadence_days=10, max_cadence_days=5)
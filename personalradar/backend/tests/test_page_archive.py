@@ -0,0 +1,86 @@
+import pytest
+import pytest_asyncio
+from datetime import datetime, timedelta
+from motor.motor_asyncio import AsyncIOMotorClient
+from app.core.config import settings
+from app.models.news_source import NewsSource
+from app.services.page_archive_service import PageArchiveService
+from app.services.tech_discovery_agent import TechDiscoveryAgent
+import os
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# Test database configuration
+TEST_MONGODB_URL = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
+TEST_DB_NAME = "test_radar_db"
+
+LISTING = '<html><body><article><a href="/article/bun">Bun 1.1 released</a></article></body></html>'
+ARTICLE = "<html><body><article>Bun is a fast JavaScript runtime.</article></body></html>"
+
+@pytest_asyncio.fixture(scope="function")
+async def test_db():
+    client = AsyncIOMotorClient(TEST_MONGODB_URL)
+    db = client[TEST_DB_NAME]
+    await db.page_archive.delete_many({})
+    yield db
+    await db.page_archive.delete_many({})
+    client.close()
+
+@pytest.mark.asyncio
+async def test_archive_deduplicates_content_and_prunes_to_size(test_db, tmp_path, monkeypatch):
+    archive = PageArchiveService(test_db, str(tmp_path))
+    first = await archive.store("https://a.example.com/", b"<p>same page</p>" * 100)
+    again = await archive.store("https://b.example.com/", b"<p>same page</p>" * 100)
+    assert first == again
+    assert len(list(tmp_path.glob("*/*.html.*"))) == 1
+    assert await test_db.page_archive.count_documents({}) == 2
+
+    # Replay reads the latest fetch at or before the requested time
+    await test_db.page_archive.update_one({"url": "https://a.example.com/"}, {"$set": {"fetched_at": datetime(2026, 1, 1)}})
+    await archive.store("https://a.example.com/", "<p>changed é</p>".encode())
+    assert await archive.load("https://a.example.com/") == "<p>changed é</p>"
+    assert await archive.load("https://a.example.com/", datetime(2026, 1, 2)) == "<p>same page</p>" * 100
+    assert await archive.load("https://a.example.com/", datetime(2025, 1, 1)) is None
+
+    # Over the size limit, the least recently fetched content goes first
+    await test_db.page_archive.update_many({}, {"$set": {"fetched_at": datetime(2026, 1, 1)}})
+    await test_db.page_archive.update_one({"content_hash": {"$ne": first}}, {"$set": {"fetched_at": datetime(2026, 2, 1)}})
+    newest = await test_db.page_archive.find_one({"content_hash": {"$ne": first}})
+    monkeypatch.setattr(settings, "PAGE_ARCHIVE_MAX_BYTES", newest["stored_size"])
+    monkeypatch.setattr("app.services.page_archive_service.SWEEP_GRACE_SECONDS", 0)
+    pruned = await archive.prune()
+    assert pruned["evicted"] == 1
+    assert pruned["files_removed"] == 1
+    assert await test_db.page_archive.distinct("content_hash") == [newest["content_hash"]]
+    assert len(list(tmp_path.glob("*/*.html.*"))) == 1
+
+@pytest.mark.asyncio
+async def test_replay_reextracts_archived_pages_without_network(test_db, tmp_path, monkeypatch):
+    # Parsing needs the crawler extras (requirements-crawler.txt)
+    pytest.importorskip("bs4")
+    agent = TechDiscoveryAgent.__new__(TechDiscoveryAgent)
+    agent.fingerprints = None
+    agent.page_archive = PageArchiveService(test_db, str(tmp_path))
+    await agent.page_archive.store("https://news.example.com", LISTING.encode())
+    await agent.page_archive.store("https://news.example.com/article/bun", ARTICLE.encode())
+
+    async def no_network(session, url):
+        raise AssertionError(f"fetched {url} during replay")
+
+    async def extract(title, content, url):
+        assert content == "Bun is a fast JavaScript runtime."
+        return [{"name": "Bun", "description": "JavaScript runtime", "category": "Tool", "confidence": 0.9}]
+
+    monkeypatch.setattr(agent, "_fetch", no_network)
+    monkeypatch.setattr(agent, "_ai_extract_technologies", extract)
+    replay = agent.replaying(datetime.utcnow() + timedelta(seconds=1))
+    assert not agent.replay
+
+    articles = await replay._scrape_articles("https://news.example.com")
+    assert articles == [{"url": "https://news.example.com/article/bun", "title": "Bun 1.1 released", "base_url": "https://news.example.com"}]
+    now = datetime.utcnow()
+    source = NewsSource(_id="source", name="News", url="https://news.example.com", cadence_days=1, is_active=True, created_at=now, updated_at=now)
+    discoveries = await replay._extract_technologies_from_article(articles[0], source, {})
+    assert [d.name for d in discoveries] == ["Bun"]
@@ -0,0 +1,45 @@
+import os
+import time
+import pytest
+from httpx import AsyncClient, ASGITransport
+from app.main import app
+from app.core import profiling
+from app.core.profiling import PROFILE_HEADER, profile_block
+
+def busy(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        sum(range(1000))
+
+@pytest.fixture
+def profile_settings(tmp_path, monkeypatch):
+    monkeypatch.setattr(profiling.settings, "PROFILE_DIR", str(tmp_path))
+    monkeypatch.setattr(profiling.settings, "PROFILE_MAX_FILES", 2)
+    monkeypatch.setattr(profiling.settings, "PROFILE_INTERVAL_SECONDS", 0.001)
+    monkeypatch.setattr(profiling.settings, "PROFILE_ADMIN_TOKEN", "let-me-profile")
+    return tmp_path
+
+@pytest.mark.asyncio
+async def test_forced_profiles_are_folded_and_pruned(profile_settings):
+    for i in range(3):
+        async with profile_block(f"block {i}", force=True) as result:
+            busy(0.05)
+        assert os.path.exists(result["path"])
+
+    files = sorted(os.listdir(profile_settings))
+    assert len(files) == 2 and files[-1].endswith("block_2.folded")
+    lines = open(os.path.join(profile_settings, files[-1])).read().splitlines()
+    stack, count = lines[0].rsplit(" ", 1)
+    assert int(count) > 0 and "busy (test_profiling.py" in stack
+
+    async with profile_block("not sampled") as result:
+        pass
+    assert result is None
+
+@pytest.mark.asyncio
+async def test_admin_header_profiles_request(profile_settings):
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        await ac.get("/", headers={PROFILE_HEADER: "wrong"})
+        assert os.listdir(profile_settings) == []
+        await ac.get("/", headers={PROFILE_HEADER: "let-me-profile"})
+    assert [name.endswith("-GET.folded") for name in os.listdir(profile_settings)] == [True]
@@ -0,0 +1,79 @@
+import pytest
+import pytest_asyncio
+from datetime import datetime
+from httpx import AsyncClient, ASGITransport
+from fastapi import status
+from app.main import app
+from motor.motor_asyncio import AsyncIOMotorClient
+from app.api.v1 import search as search_module
+from app.core.indexes import ensure_collection_indexes
+from app.migrations.backfill_name_lower import migrate as backfill_name_lower
+from app.models import technology, technology_discovery
+from app.services.search_service import SearchService
+import os
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# Test database configuration
+TEST_MONGODB_URL = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
+TEST_DB_NAME = "test_radar_db"
+
+@pytest_asyncio.fixture(scope="function")
+async def test_db():
+    client = AsyncIOMotorClient(TEST_MONGODB_URL)
+    db = client[TEST_DB_NAME]
+    await db.technologies.delete_many({})
+    await db.technology_discoveries.delete_many({})
+    await ensure_collection_indexes(db, technology.COLLECTION, technology.INDEXES)
+    await ensure_collection_indexes(db, technology_discovery.COLLECTION, technology_discovery.INDEXES)
+    yield db
+    await db.technologies.delete_many({})
+    await db.technology_discoveries.delete_many({})
+    # Leave the collections as the other test modules expect them
+    await db.technologies.drop_indexes()
+    await db.technology_discoveries.drop_indexes()
+    client.close()
+
+@pytest.mark.asyncio
+async def test_search_ranks_names_and_applies_filters(test_db):
+    now = datetime.utcnow()
+    await test_db.technologies.insert_many([
+        {"name": "Kubernetes", "quadrant": "Platforms", "ring": "Adopt", "description": "Container orchestration"},
+        {"name": "Helm", "quadrant": "Tools", "ring": "Trial", "description": "Package manager for Kubernetes"},
+        {"name": "GraphQL", "quadrant": "Languages & Frameworks", "ring": "Trial", "description": "Query language for APIs"},
+    ])
+    await test_db.technology_discoveries.insert_many([
+        {
+            "name": "KubeVela", "description": "Application delivery platform", "source_url": "https://example.com",
+            "news_source_id": "source-1", "discovered_at": now, "article_title": "Shipping apps on Kubernetes",
+            "confidence_score": 0.8, "category": "Platform", "status": "discovered",
+        },
+    ])
+    assert await backfill_name_lower(test_db) == 4
+    app.dependency_overrides[search_module.get_search_service] = lambda: SearchService(test_db)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        resp = await ac.get("/api/v1/search/", params={"q": "kubernetes"})
+        assert resp.status_code == status.HTTP_200_OK
+        names = [hit["name"] for hit in resp.json()["results"]]
+        # Exact name first, then documents that mention it
+        assert names[0] == "Kubernetes" and set(names) == {"Kubernetes", "Helm", "KubeVela"}
+
+        prefix = (await ac.get("/api/v1/search/", params={"q": "kube"})).json()["results"]
+        assert {hit["name"] for hit in prefix} == {"Kubernetes", "KubeVela"}
+
+        # Prefixes match whatever the casing of the stored name
+        mixed_case = (await ac.get("/api/v1/search/", params={"q": "graphq"})).json()["results"]
+        assert [hit["name"] for hit in mixed_case] == ["GraphQL"]
+
+        adopted = (await ac.get("/api/v1/search/", params={"q": "kubernetes", "ring": "Adopt"})).json()["results"]
+        assert [(hit["type"], hit["name"]) for hit in adopted] == [("technology", "Kubernetes")]
+
+        page = (await ac.get("/api/v1/search/", params={"q": "kubernetes", "limit": 1, "skip": 1})).json()
+        assert len(page["results"]) == 1 and page["has_more"] is True
+
+        # A blank query would otherwise prefix-match every name
+        resp = await ac.get("/api/v1/search/", params={"q": "   "})
+        assert resp.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    app.dependency_overrides.clear()
@@ -0,0 +1,354 @@
+import json
+import pytest
+import pytest_asyncio
+from datetime import datetime, timedelta
+from httpx import AsyncClient, ASGITransport
+from fastapi import status
+from app.main import app
+from motor.motor_asyncio import AsyncIOMotorClient
+from app.api.v1 import technology_discoveries as discoveries_module
+from app.services.technology_discovery_service import TechnologyDiscoveryService
+from app.services.technology_service import TechnologyService
+from app.models.technology import TechnologyCreate
+from app.models.technology_discovery import TechnologyDiscoveryCreate
+from app.core.config import settings
+import os
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# Test database configuration
+TEST_MONGODB_URL = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
+TEST_DB_NAME = "test_radar_db"
+
+@pytest_asyncio.fixture(scope="function")
+async def test_db():
+    client = AsyncIOMotorClient(TEST_MONGODB_URL)
+    db = client[TEST_DB_NAME]
+    await db.technology_discoveries.delete_many({})
+    await db.discovery_stats.delete_many({})
+    await db.discovery_rollups.delete_many({})
+    await db.technologies.delete_many({})
+    await db.technology_discoveries_archive.delete_many({})
+    yield db
+    await db.technology_discoveries.delete_many({})
+    await db.discovery_stats.delete_many({})
+    await db.discovery_rollups.delete_many({})
+    await db.technologies.delete_many({})
+    await db.technology_changes.delete_many({})
+    await db.radar_snapshots.delete_many({})
+    await db.technology_discoveries_archive.delete_many({})
+    client.close()
+
+async def seed_discoveries(service: TechnologyDiscoveryService) -> None:
+    now = datetime.utcnow()
+    rows = [
+        ("Bun", "source-a", "discovered", "Tool", 0.9),
+        ("Deno", "source-a", "assessed", "Tool", 0.8),
+        ("Mojo", "source-a", "discovered", "Programming Language", 0.95),
+        ("Qdrant", "source-b", "discovered", "Database", 0.6),
+        ("htmx", "source-b", "discovered", "Tool", 0.3),
+    ]
+    for offset, (name, source_id, status_value, category, confidence) in enumerate(rows):
+        await service.create_discovery(TechnologyDiscoveryCreate(
+            name=name,
+            description=f"{name} description",
+            source_url="https://example.com",
+            news_source_id=source_id,
+            discovered_at=now - timedelta(hours=offset),
+            confidence_score=confidence,
+            category=category,
+            status=status_value,
+        ))
+
+@pytest.mark.asyncio
+async def test_list_discoveries_combines_filters(test_db):
+    service = TechnologyDiscoveryService(test_db)
+    await seed_discoveries(service)
+    app.dependency_overrides[discoveries_module.get_discovery_service] = lambda: service
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        resp = await ac.get("/api/v1/technology-discoveries/", params={
+            "news_source_id": "source-a",
+            "status": "discovered",
+            "category": "Tool",
+            "min_confidence": 0.5,
+        })
+        assert resp.status_code == status.HTTP_200_OK
+        assert [d["name"] for d in resp.json()] == ["Bun"]
+
+        resp = await ac.get("/api/v1/technology-discoveries/", params={"category": "Tool", "min_confidence": 0.5})
+        assert [d["name"] for d in resp.json()] == ["Bun", "Deno"]
+    app.dependency_overrides.clear()
+
+@pytest.mark.asyncio
+async def test_list_discoveries_paginates_newest_first(test_db):
+    service = TechnologyDiscoveryService(test_db)
+    await seed_discoveries(service)
+    app.dependency_overrides[discoveries_module.get_discovery_service] = lambda: service
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        first_page = await ac.get("/api/v1/technology-discoveries/", params={"limit": 2})
+        second_page = await ac.get("/api/v1/technology-discoveries/", params={"skip": 2, "limit": 2})
+        assert [d["name"] for d in first_page.json()] == ["Bun", "Deno"]
+        assert [d["name"] for d in second_page.json()] == ["Mojo", "Qdrant"]
+
+        resp = await ac.get("/api/v1/technology-discoveries/", headers={"Accept": "application/x-ndjson"})
+        assert resp.headers["content-type"] == "application/x-ndjson"
+        lines = [json.loads(line) for line in resp.text.splitlines()]
+        assert [d["name"] for d in lines] == ["Bun", "Deno", "Mojo", "Qdrant", "htmx"]
+        assert lines[0]["_id"] == first_page.json()[0]["_id"]
+
+        # Each representation has its own tag, so a cached JSON body never answers an NDJSON request
+        assert "Accept" in resp.headers["vary"].split(", ")
+        assert resp.headers["etag"] != first_page.headers["etag"]
+        resp = await ac.get("/api/v1/technology-discoveries/", headers={"Accept": "application/x-ndjson", "If-None-Match": first_page.headers["etag"]})
+        assert resp.status_code == 200
+        resp = await ac.get("/api/v1/technology-discoveries/", headers={"If-None-Match": first_page.headers["etag"]})
+        assert resp.status_code == 304
+    app.dependency_overrides.clear()
+
+@pytest.mark.asyncio
+async def test_materialized_stats_follow_writes(test_db, monkeypatch):
+    monkeypatch.setattr(settings, "DISCOVERY_STATS_MATERIALIZED", True)
+    service = TechnologyDiscoveryService(test_db)
+    await seed_discoveries(service)
+    assert await service.get_stats() == await service.compute_stats()
+
+    discoveries = await service.query_discoveries(category="Tool")
+    await service.update_discovery_status(discoveries[0].id, "ignored")
+    await service.delete_discovery(discoveries[1].id)
+
+    stats = await service.get_stats()
+    assert stats == await service.compute_stats()
+    assert stats["total_discoveries"] == 4
+    assert stats["by_status"] == {"discovered": 3, "ignored": 1}
+    assert stats["by_category"]["Tool"] == 2
+
+@pytest.mark.asyncio
+async def test_materialized_stats_survive_a_write_during_rebuild(test_db, monkeypatch):
+    monkeypatch.setattr(settings, "DISCOVERY_STATS_MATERIALIZED", True)
+    service = TechnologyDiscoveryService(test_db)
+    await seed_discoveries(service)
+    aggregate = service.compute_stats
+
+    async def write_after_aggregating():
+        stats = await aggregate()
+        # Not seen by this aggregate, and its increment arrives before the rebuild saves
+        monkeypatch.setattr(service, "compute_stats", aggregate)
+        await service.create_discovery(TechnologyDiscoveryCreate(
+            name="Late", description="Written mid-rebuild", source_url="https://example.com",
+            news_source_id="source-a", discovered_at=datetime.utcnow(), confidence_score=0.9, category="Tool",
+        ))
+        return stats
+
+    monkeypatch.setattr(service, "compute_stats", write_after_aggregating)
+    await service.rebuild_stats()
+    assert (await test_db.discovery_stats.find_one({}))["stale"] is True
+    stats = await service.get_stats()
+    assert stats == await service.compute_stats()
+    assert stats["total_discoveries"] == 6
+    assert (await test_db.discovery_stats.find_one({}))["stale"] is False
+
+@pytest.mark.asyncio
+async def test_trending_follows_rollups_and_matches_backfill(test_db):
+    service = TechnologyDiscoveryService(test_db)
+    now = datetime.utcnow()
+    mentions = [
+        # Bun: one source last week, three this week (one of them spelled differently)
+        ("Bun", "source-a", 10, 0.6),
+        ("Bun", "source-a", 1, 0.8),
+        ("Bun", "source-b", 0, 0.9),
+        ("bun ", "source-c", 2, 0.7),
+        # Deno: two sources last week, one this week
+        ("Deno", "source-a", 9, 0.8),
+        ("Deno", "source-b", 8, 0.8),
+        ("Deno", "source-a", 0, 0.8),
+        ("Mojo", "source-b", 3, 0.5),
+    ]
+    for name, source_id, days_ago, confidence in mentions:
+        await service.create_discovery(TechnologyDiscoveryCreate(
+            name=name,
+            description=f"{name} description",
+            source_url="https://example.com",
+            news_source_id=source_id,
+            discovered_at=now - timedelta(days=days_ago),
+            confidence_score=confidence,
+        ))
+
+    app.dependency_overrides[discoveries_module.get_discovery_service] = lambda: service
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        resp = await ac.get("/api/v1/technology-discoveries/trending", params={"window": "7d"})
+        assert resp.status_code == status.HTTP_200_OK
+        trending = resp.json()["technologies"]
+        assert [t["name"] for t in trending] == ["Bun", "Mojo"]
+        assert trending[0]["mentions"] == 3
+        assert trending[0]["sources"] == 3
+        assert trending[0]["previous_sources"] == 1
+        assert trending[0]["mean_confidence"] == pytest.approx(0.8)
+
+        resp = await ac.get("/api/v1/technology-discoveries/trending", params={"window": "365d"})
+        assert resp.status_code == status.HTTP_400_BAD_REQUEST
+    app.dependency_overrides.clear()
+
+    # Deletes and bulk updates adjust the buckets they touch
+    mojo = next(d for d in await service.query_discoveries(news_source_id="source-b") if d.name == "Mojo")
+    await service.delete_discovery(mojo.id)
+    await service.bulk_upsert_discoveries([
+        (1, {"name": "Deno", "description": "Deno", "source_url": "https://example.com", "news_source_id": "source-b",
+             "discovered_at": now, "confidence_score": 0.8}),
+        (2, {"name": "Deno", "description": "Deno", "source_url": "https://example.com", "news_source_id": "source-c",
+             "discovered_at": now, "confidence_score": 0.8}),
+        (3, {"name": "Deno", "description": "Deno", "source_url": "https://example.com", "news_source_id": "source-d",
+             "discovered_at": now, "confidence_score": 0.8}),
+    ])
+    incremental = await service.trending(7)
+    assert [t.name for t in incremental.technologies] == ["Deno", "Bun"]
+    assert (incremental.technologies[0].sources, incremental.technologies[0].previous_sources) == (4, 1)
+
+    await service.rollups.rebuild()
+    assert await service.trending(7) == incremental
+
+@pytest.mark.asyncio
+async def test_bulk_status_and_promotion_report_per_id(test_db, monkeypatch):
+    monkeypatch.setattr(settings, "DISCOVERY_STATS_MATERIALIZED", True)
+    service = TechnologyDiscoveryService(test_db)
+    technology_service = TechnologyService(test_db)
+    await seed_discoveries(service)
+    ids = {d.name: d.id for d in await service.query_discoveries()}
+    await technology_service.create_technology(TechnologyCreate(
+        name="Bun", quadrant="Tools", ring="Assess", description="Curated description",
+        source="Team review", uri="https://bun.sh"
+    ))
+
+    app.dependency_overrides[discoveries_module.get_discovery_service] = lambda: service
+    app.dependency_overrides[discoveries_module.get_technology_service] = lambda: technology_service
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        resp = await ac.post("/api/v1/technology-discoveries/bulk-status", json={
+            "ids": [ids["Qdrant"], ids["Deno"], ids["htmx"], "000000000000000000000000"],
+            "status": "assessed",
+        })
+        assert resp.status_code == status.HTTP_200_OK
+        assert [r["result"] for r in resp.json()["results"]] == ["updated", "unchanged", "updated", "not_found"]
+        assert (await service.get_stats())["by_status"] == {"discovered": 2, "assessed": 3}
+
+        # A discovery whose status changes between the read and the write is reported, not claimed
+        write_batch = service.collection.bulk_write
+
+        async def ignore_then_write(operations, **kwargs):
+            await test_db.technology_discoveries.update_one({"name": "Mojo"}, {"$set": {"status": "ignored"}})
+            return await write_batch(operations, **kwargs)
+
+        monkeypatch.setattr(service.collection, "bulk_write", ignore_then_write)
+        assert [r["result"] for r in await service.bulk_update_status([ids["Mojo"], ids["Bun"]], "assessed")] == ["conflict", "updated"]
+        monkeypatch.setattr(service.collection, "bulk_write", write_batch)
+        await test_db.technology_discoveries.update_one({"name": "Mojo"}, {"$set": {"status": "discovered"}})
+        assert (await service.get_stats()) == await service.compute_stats()
+
+        resp = await ac.post("/api/v1/technology-discoveries/bulk-status", json={"ids": [ids["Bun"]], "status": "archived"})
+        assert resp.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+        resp = await ac.post("/api/v1/technology-discoveries/promote", json={
+            "ids": [ids["Bun"], ids["Mojo"]], "quadrant": "Languages & Frameworks", "ring": "Trial",
+        })
+        assert resp.status_code == status.HTTP_200_OK
+        results = resp.json()["results"]
+        assert [(r["id"], r["result"], r["technology"]) for r in results] == [
+            (ids["Bun"], "promoted", "Bun"), (ids["Mojo"], "promoted", "Mojo")
+        ]
+    app.dependency_overrides.clear()
+
+    technologies = {t.name: t for t in await technology_service.list_technologies()}
+    assert (technologies["Bun"].quadrant, technologies["Bun"].ring) == ("Languages & Frameworks", "Trial")
+    assert (technologies["Bun"].description, technologies["Bun"].source, technologies["Bun"].uri) == (
+        "Curated description", "Team review", "https://bun.sh"
+    )
+    assert (technologies["Mojo"].description, technologies["Mojo"].source) == ("Mojo description", "Technology discovery")
+    assert {d.name for d in await service.query_discoveries(status="promoted")} == {"Bun", "Mojo"}
+    assert await service.get_stats() == await service.compute_stats()
+
+@pytest.mark.asyncio
+async def test_retention_archives_stale_discoveries(test_db, monkeypatch):
+    monkeypatch.setattr(settings, "DISCOVERY_ARCHIVE_AFTER_DAYS", 180)
+    monkeypatch.setattr(settings, "DISCOVERY_LOW_CONFIDENCE_BELOW", 0.3)
+    monkeypatch.setattr(settings, "DISCOVERY_LOW_CONFIDENCE_ARCHIVE_AFTER_DAYS", 30)
+    service = TechnologyDiscoveryService(test_db)
+    now = datetime.utcnow()
+    rows = [
+        ("Old", 200, 0.9, "discovered"),
+        ("Promoted", 200, 0.9, "promoted"),
+        ("Weak", 40, 0.2, "discovered"),
+        ("Recent weak", 5, 0.2, "discovered"),
+        ("Fresh", 1, 0.9, "discovered"),
+    ]
+    for name, days_ago, confidence, status_value in rows:
+        await service.create_discovery(TechnologyDiscoveryCreate(
+            name=name,
+            description=f"{name} description",
+            source_url="https://example.com",
+            news_source_id="source-a",
+            discovered_at=now - timedelta(days=days_ago),
+            confidence_score=confidence,
+            status=status_value,
+        ))
+    ids = {d.name: d.id for d in await service.query_discoveries()}
+
+    ignored = await service.update_discovery_status(ids["Fresh"], "ignored")
+    stored = await test_db.technology_discoveries.find_one({"name": "Fresh"})
+    assert stored["ignored_at"] == stored["updated_at"]
+    assert ignored.status == "ignored"
+
+    assert await service.archive_stale() == 2
+    assert await service.archive_stale() == 0
+    assert {d.name for d in await service.query_discoveries()} == {"Promoted", "Recent weak", "Fresh"}
+    archived = await test_db.technology_discoveries_archive.find_one({"name": "Old"})
+    assert archived["archived_at"] is not None
+
+    assert await service.get_discovery(ids["Old"]) is None
+    assert (await service.get_discovery(ids["Old"], include_archived=True)).name == "Old"
+    # Deduplication still sees archived names
+    assert {"old", "weak", "fresh"} <= await service.known_names("source-a")
+
+    # The list endpoint merges the archive in, newest first, and pages across both collections
+    app.dependency_overrides[discoveries_module.get_discovery_service] = lambda: service
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        resp = await ac.get("/api/v1/technology-discoveries/", params={"include_archived": True})
+        names = [d["name"] for d in resp.json()]
+        # Old and Promoted share a discovered_at, so only their set is fixed
+        assert names[:3] == ["Fresh", "Recent weak", "Weak"] and set(names[3:]) == {"Old", "Promoted"}
+        resp = await ac.get("/api/v1/technology-discoveries/", params={"include_archived": True, "skip": 1, "limit": 2})
+        assert [d["name"] for d in resp.json()] == ["Recent weak", "Weak"]
+        resp = await ac.get("/api/v1/technology-discoveries/", params={"limit": 10})
+        assert "Old" not in [d["name"] for d in resp.json()]
+        etag = resp.headers["etag"]
+
+        # A TTL deletion archives nothing, but the next pass still invalidates the listing
+        await test_db.technology_discoveries.delete_one({"name": "Fresh"})
+        assert await service.archive_stale() == 0
+        resp = await ac.get("/api/v1/technology-discoveries/", headers={"If-None-Match": etag})
+        assert resp.status_code == status.HTTP_200_OK
+    app.dependency_overrides.clear()
+
+@pytest.mark.asyncio
+async def test_archive_spares_discoveries_promoted_mid_batch(test_db, monkeypatch):
+    monkeypatch.setattr(settings, "DISCOVERY_ARCHIVE_AFTER_DAYS", 180)
+    service = TechnologyDiscoveryService(test_db)
+    for name in ("Old", "Rescued"):
+        await service.create_discovery(TechnologyDiscoveryCreate(
+            name=name,
+            description=f"{name} description",
+            source_url="https://example.com",
+            news_source_id="source-a",
+            discovered_at=datetime.utcnow() - timedelta(days=200),
+            confidence_score=0.9,
+        ))
+    copy_batch = service.archive.insert_many
+
+    async def promote_then_copy(docs, **kwargs):
+        # Promoted after the batch was read, before it is deleted
+        await test_db.technology_discoveries.update_one({"name": "Rescued"}, {"$set": {"status": "promoted"}})
+        return await copy_batch(docs, **kwargs)
+
+    monkeypatch.setattr(service.archive, "insert_many", promote_then_copy)
+    assert await service.archive_stale() == 1
+    assert [d.name for d in await service.query_discoveries()] == ["Rescued"]
+    assert await test_db.technology_discoveries_archive.distinct("name") == ["Old"]
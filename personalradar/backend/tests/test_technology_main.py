@@ -5,6 +5,7 @@ from fastapi import status
 from app.main import app
 from motor.motor_asyncio import AsyncIOMotorClient
 from app.api.v1 import technologies as technologies_module
+from app.core.container import Container
 from app.services.technology_service import TechnologyService
 import os
 from dotenv import load_dotenv
@@ -57,4 +58,20 @@ async def test_create_and_list_technology_main(test_db):
         techs = list_resp.json()
         assert len(techs) == 1
         assert any(t["name"] == "Kubernetes" for t in techs)
-    app.dependency_overrides.clear() 
\ No newline at end of file
+    app.dependency_overrides.clear()
+
+@pytest.mark.asyncio
+async def test_container_serves_routes_without_overrides(test_db, monkeypatch):
+    # ASGITransport skips the lifespan, so install the container it would build
+    container = Container(test_db)
+    monkeypatch.setattr(app.state, "container", container, raising=False)
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+            create_resp = await ac.post("/api/v1/technologies/", json={
+                "name": "Pulumi", "quadrant": "Tools", "ring": "Trial", "description": "Infrastructure as code"
+            })
+            assert create_resp.status_code == status.HTTP_201_CREATED
+            list_resp = await ac.get("/api/v1/technologies/")
+            assert [tech["name"] for tech in list_resp.json()] == ["Pulumi"]
+    finally:
+        await container.aclose()
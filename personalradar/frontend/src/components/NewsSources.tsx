@@ -12,7 +12,10 @@ const NewsSources: React.FC = () => {
     url: '',
     description: '',
     cadence_days: 7,
-    is_active: true
+    is_active: true,
+    adaptive_cadence: false,
+    min_cadence_days: 1,
+    max_cadence_days: 30
   });
 
   useEffect(() => {
@@ -39,7 +42,10 @@ const NewsSources: React.FC = () => {
         url: source.url,
         description: source.description || '',
         cadence_days: source.cadence_days,
-        is_active: source.is_active
+        is_active: source.is_active,
+        adaptive_cadence: source.adaptive_cadence ?? false,
+        min_cadence_days: source.min_cadence_days ?? 1,
+        max_cadence_days: source.max_cadence_days ?? 30
       });
     } else {
       setEditingSource(null);
@@ -48,7 +54,10 @@ const NewsSources: React.FC = () => {
         url: '',
         description: '',
         cadence_days: 7,
-        is_active: true
+        is_active: true,
+        adaptive_cadence: false,
+        min_cadence_days: 1,
+        max_cadence_days: 30
       });
     }
     setShowForm(true);
@@ -122,7 +131,15 @@ const NewsSources: React.FC = () => {
                 )}
                 <Typography variant="body2">
                   Cadence: {source.cadence_days} days
+                  {source.effective_cadence_days !== undefined && source.effective_cadence_days !== source.cadence_days && (
+                    <> (now every {Number(source.effective_cadence_days.toFixed(1))} days)</>
+                  )}
                 </Typography>
+                {source.adaptive_cadence && source.cadence_reason && (
+                  <Typography variant="body2" color="text.secondary">
+                    Adaptive: {source.cadence_reason}
+                  </Typography>
+                )}
                 <Typography variant="body2">
                   Status: {source.is_active ? 'Active' : 'Inactive'}
                 </Typography>
@@ -198,6 +215,32 @@ const NewsSources: React.FC = () => {
                 />
                 Active
               </label>
+              <label style={{ display: 'flex', alignItems: 'center', gap: '8px' }}>
+                <input
+                  type="checkbox"
+                  checked={formData.adaptive_cadence}
+                  onChange={(e) => setFormData({ ...formData, adaptive_cadence: e.target.checked })}
+                />
+                Adapt cadence to recent yield
+              </label>
+              {formData.adaptive_cadence && (
+                <Box sx={{ display: 'flex', gap: 2 }}>
+                  <input
+                    type="number"
+                    placeholder="Min days"
+                    value={formData.min_cadence_days}
+                    onChange={(e) => setFormData({ ...formData, min_cadence_days: parseInt(e.target.value) || 1 })}
+                    style={{ flex: 1, padding: '8px', border: '1px solid #ccc', borderRadius: '4px' }}
+                  />
+                  <input
+                    type="number"
+                    placeholder="Max days"
+                    value={formData.max_cadence_days}
+                    onChange={(e) => setFormData({ ...formData, max_cadence_days: parseInt(e.target.value) || 30 })}
+                    style={{ flex: 1, padding: '8px', border: '1px solid #ccc', borderRadius: '4px' }}
+                  />
+                </Box>
+              )}
             </Box>
             
             <Box sx={{ display: 'flex', gap: 2, mt: 3 }}>
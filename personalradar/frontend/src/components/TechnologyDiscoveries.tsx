@@ -1,12 +1,19 @@
 import React, { useState, useEffect, useCallback } from 'react';
-import { Box, Typography, List, ListItem, ListItemText, Paper, CircularProgress, Alert, Button } from '@mui/material';
-import { technologyDiscoveryApi, TechnologyDiscovery } from '../services/api';
+import { Box, Typography, List, ListItem, ListItemText, Paper, CircularProgress, Alert, Button, Checkbox, Select, MenuItem, FormControl, InputLabel } from '@mui/material';
+import { technologyDiscoveryApi, TechnologyDiscovery, DiscoveryResult, DiscoveryStatus } from '../services/api';
+
+const QUADRANTS = ['Techniques', 'Tools', 'Platforms', 'Languages & Frameworks'];
+const RINGS = ['Adopt', 'Trial', 'Assess', 'Hold'];
 
 const TechnologyDiscoveries: React.FC = () => {
   const [discoveries, setDiscoveries] = useState<TechnologyDiscovery[]>([]);
   const [loading, setLoading] = useState<boolean>(true);
   const [error, setError] = useState<string | null>(null);
   const [isDiscovering, setIsDiscovering] = useState<boolean>(false);
+  const [selected, setSelected] = useState<Set<string>>(new Set());
+  const [quadrant, setQuadrant] = useState<string>(QUADRANTS[0]);
+  const [ring, setRing] = useState<string>('Assess');
+  const [isUpdating, setIsUpdating] = useState<boolean>(false);
 
   const fetchDiscoveries = useCallback(async () => {
     try {
@@ -43,6 +50,51 @@ const TechnologyDiscoveries: React.FC = () => {
     }
   };
 
+  const toggleSelected = (id: string) => {
+    setSelected((current) => {
+      const next = new Set(current);
+      if (next.has(id)) {
+        next.delete(id);
+      } else {
+        next.add(id);
+      }
+      return next;
+    });
+  };
+
+  // Apply per-ID results to the list in place instead of reloading it
+  const applyResults = (results: DiscoveryResult[], status: DiscoveryStatus) => {
+    const changed = new Set(results.filter((r) => r.result === 'updated' || r.result === 'promoted').map((r) => r.id));
+    setDiscoveries((current) => current.map((d) => (d._id && changed.has(d._id) ? { ...d, status } : d)));
+    setSelected(new Set());
+    const failed = results.filter((r) => r.result === 'error' || r.result === 'not_found' || r.result === 'conflict');
+    setError(failed.length ? `${failed.length} of ${results.length} discoveries could not be updated.` : null);
+  };
+
+  const handleBulkStatus = async (status: DiscoveryStatus) => {
+    try {
+      setIsUpdating(true);
+      applyResults(await technologyDiscoveryApi.bulkUpdateStatus(Array.from(selected), status), status);
+    } catch (err) {
+      setError('Failed to update discoveries.');
+      console.error(err);
+    } finally {
+      setIsUpdating(false);
+    }
+  };
+
+  const handlePromote = async () => {
+    try {
+      setIsUpdating(true);
+      applyResults(await technologyDiscoveryApi.promote(Array.from(selected), quadrant, ring), 'promoted');
+    } catch (err) {
+      setError('Failed to promote discoveries.');
+      console.error(err);
+    } finally {
+      setIsUpdating(false);
+    }
+  };
+
   return (
     <Box sx={{ p: 3 }}>
       <Box sx={{ display: 'flex', justifyContent: 'space-between', alignItems: 'center', mb: 2 }}>
@@ -57,12 +109,41 @@ const TechnologyDiscoveries: React.FC = () => {
           {isDiscovering ? <CircularProgress size={24} /> : 'Run Discovery'}
         </Button>
       </Box>
+      <Box sx={{ display: 'flex', gap: 2, alignItems: 'center', flexWrap: 'wrap', mb: 2 }}>
+        <Typography variant="body2">{selected.size} selected</Typography>
+        <Button size="small" onClick={() => handleBulkStatus('assessed')} disabled={!selected.size || isUpdating}>
+          Mark assessed
+        </Button>
+        <Button size="small" onClick={() => handleBulkStatus('ignored')} disabled={!selected.size || isUpdating}>
+          Ignore
+        </Button>
+        <FormControl size="small" sx={{ minWidth: 200 }}>
+          <InputLabel>Quadrant</InputLabel>
+          <Select value={quadrant} label="Quadrant" onChange={(e) => setQuadrant(e.target.value)}>
+            {QUADRANTS.map((q) => (
+              <MenuItem key={q} value={q}>{q}</MenuItem>
+            ))}
+          </Select>
+        </FormControl>
+        <FormControl size="small" sx={{ minWidth: 120 }}>
+          <InputLabel>Ring</InputLabel>
+          <Select value={ring} label="Ring" onChange={(e) => setRing(e.target.value)}>
+            {RINGS.map((r) => (
+              <MenuItem key={r} value={r}>{r}</MenuItem>
+            ))}
+          </Select>
+        </FormControl>
+        <Button size="small" variant="outlined" onClick={handlePromote} disabled={!selected.size || isUpdating}>
+          Add to radar
+        </Button>
+      </Box>
       {loading ? (
         <CircularProgress />
-      ) : error ? (
+      ) : error && discoveries.length === 0 ? (
         <Alert severity="error">{error}</Alert>
       ) : (
         <Paper>
+          {error && <Alert severity="warning">{error}</Alert>}
           <List>
             {discoveries.length === 0 ? (
               <ListItem>
@@ -70,7 +151,12 @@ const TechnologyDiscoveries: React.FC = () => {
               </ListItem>
             ) : (
               discoveries.map((discovery) => (
-                <ListItem key={discovery.id}>
+                <ListItem key={discovery._id}>
+                  <Checkbox
+                    edge="start"
+                    checked={!!discovery._id && selected.has(discovery._id)}
+                    onChange={() => discovery._id && toggleSelected(discovery._id)}
+                  />
                   <ListItemText
                     primary={discovery.name}
                     secondary={
@@ -95,4 +181,4 @@ const TechnologyDiscoveries: React.FC = () => {
   );
 };
 
-export default TechnologyDiscoveries; 
\ No newline at end of file
+export default TechnologyDiscoveries;
@@ -7,8 +7,13 @@ const api = axios.create({
   headers: {
     'Content-Type': 'application/json',
   },
+  // 304 answers are resolved from the validator cache below
+  validateStatus: (status) => (status >= 200 && status < 300) || status === 304,
 });
 
+// Last ETag and body per GET URL, replayed when the server answers 304 Not Modified
+const etagCache = new Map<string, { etag: string; data: unknown }>();
+
 // Add a request interceptor to add the auth token to requests
 api.interceptors.request.use(
   (config) => {
@@ -16,6 +21,12 @@ api.interceptors.request.use(
     if (token) {
       config.headers.Authorization = `Bearer ${token}`;
     }
+    if (config.method === 'get') {
+      const cached = etagCache.get(api.getUri(config));
+      if (cached) {
+        config.headers['If-None-Match'] = cached.etag;
+      }
+    }
     return config;
   },
   (error) => {
@@ -25,7 +36,21 @@ api.interceptors.request.use(
 
 // Add a response interceptor to handle token expiration
 api.interceptors.response.use(
-  (response) => response,
+  (response) => {
+    if (response.config.method !== 'get') {
+      return response;
+    }
+    const key = api.getUri(response.config);
+    if (response.status === 304) {
+      const cached = etagCache.get(key);
+      return { ...response, status: 200, data: cached?.data };
+    }
+    const etag = response.headers['etag'];
+    if (etag) {
+      etagCache.set(key, { etag, data: response.data });
+    }
+    return response;
+  },
   async (error) => {
     if (error.response?.status === 401) {
       localStorage.removeItem('token');
@@ -55,12 +80,19 @@ export interface NewsSource {
   description?: string;
   cadence_days: number;
   is_active: boolean;
+  adaptive_cadence?: boolean;
+  min_cadence_days?: number;
+  max_cadence_days?: number;
+  effective_cadence_days?: number;
+  cadence_reason?: string;
   last_checked?: string;
+  next_check_at?: string;
   created_at?: string;
   updated_at?: string;
 }
 
 export interface TechnologyDiscovery {
+  _id?: string;
   id?: string;
   name: string;
   description: string;
@@ -134,9 +166,44 @@ export const newsSourceApi = {
   },
 };
 
+export interface TechnologyDiscoveryFilters {
+  news_source_id?: string;
+  status?: string;
+  category?: string;
+  min_confidence?: number;
+  skip?: number;
+  limit?: number;
+}
+
+export type DiscoveryStatus = 'discovered' | 'assessed' | 'ignored' | 'promoted';
+
+export interface DiscoveryResult {
+  id: string;
+  result: 'updated' | 'unchanged' | 'not_found' | 'conflict' | 'promoted' | 'error';
+  technology?: string;
+  technology_result?: 'created' | 'updated';
+  error?: string;
+}
+
+export interface TrendingTechnology {
+  name: string;
+  mentions: number;
+  previous_mentions: number;
+  sources: number;
+  previous_sources: number;
+  mean_confidence: number;
+  score: number;
+}
+
+export interface TrendingTechnologies {
+  window_days: number;
+  since: string;
+  technologies: TrendingTechnology[];
+}
+
 export const technologyDiscoveryApi = {
-  list: async (): Promise<TechnologyDiscovery[]> => {
-    const response = await api.get('/technology-discoveries/');
+  list: async (filters: TechnologyDiscoveryFilters = {}): Promise<TechnologyDiscovery[]> => {
+    const response = await api.get('/technology-discoveries/', { params: filters });
     return response.data;
   },
   get: async (id: string): Promise<TechnologyDiscovery> => {
@@ -155,6 +222,14 @@ export const technologyDiscoveryApi = {
     const response = await api.delete(`/technology-discoveries/${id}`);
     return response.data;
   },
+  bulkUpdateStatus: async (ids: string[], status: DiscoveryStatus): Promise<DiscoveryResult[]> => {
+    const response = await api.post('/technology-discoveries/bulk-status', { ids, status });
+    return response.data.results;
+  },
+  promote: async (ids: string[], quadrant: string, ring: string): Promise<DiscoveryResult[]> => {
+    const response = await api.post('/technology-discoveries/promote', { ids, quadrant, ring });
+    return response.data.results;
+  },
   runDiscovery: async (newsSourceId?: string) => {
     const url = newsSourceId 
       ? `/technology-discoveries/run-discovery?news_source_id=${newsSourceId}`
@@ -162,6 +237,13 @@ export const technologyDiscoveryApi = {
     const response = await api.post(url);
     return response.data;
   },
+  // Re-runs extraction over archived pages (as fetched at or before asOf) without crawling
+  replayDiscovery: async (newsSourceId?: string, asOf?: string) => {
+    const response = await api.post('/technology-discoveries/run-discovery', null, {
+      params: { replay: true, news_source_id: newsSourceId, as_of: asOf },
+    });
+    return response.data;
+  },
   getNewSince: async (newsSourceId: string, days: number = 7) => {
     const response = await api.get(`/technology-discoveries/new-since/${newsSourceId}?days=${days}`);
     return response.data;
@@ -170,6 +252,49 @@ export const technologyDiscoveryApi = {
     const response = await api.get('/technology-discoveries/stats/summary');
     return response.data;
   },
+  getTrending: async (window: string = '7d', limit: number = 20): Promise<TrendingTechnologies> => {
+    const response = await api.get('/technology-discoveries/trending', { params: { window, limit } });
+    return response.data;
+  },
+};
+
+export interface SearchFilters {
+  type?: 'technology' | 'discovery';
+  quadrant?: string;
+  ring?: string;
+  status?: string;
+  category?: string;
+  skip?: number;
+  limit?: number;
+}
+
+export interface SearchHit {
+  type: 'technology' | 'discovery';
+  id: string;
+  name: string;
+  description?: string;
+  score: number;
+  quadrant?: string;
+  ring?: string;
+  status?: string;
+  category?: string;
+  article_title?: string;
+  discovered_at?: string;
+}
+
+export interface SearchResults {
+  query: string;
+  skip: number;
+  limit: number;
+  has_more: boolean;
+  results: SearchHit[];
+}
+
+export const searchApi = {
+  search: async (q: string, filters: SearchFilters = {}): Promise<SearchResults> => {
+    const response = await api.get('/search/', { params: { q, ...filters } });
+    return response.data;
+  },
 };
 
 export default api; 
\ No newline at end of file